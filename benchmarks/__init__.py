@@ -0,0 +1,5 @@
+"""
+Everest API Benchmarks
+
+Offline performance benchmarks run against a local mock Everest server.
+"""
@@ -0,0 +1,411 @@
+#!/usr/bin/env python
+"""
+Everest API Benchmark Suite
+
+Measures throughput, p50/p99 latency and peak memory of the SDK against a
+local MockEverestServer, so no network access or credentials are needed.
+
+Results are written as JSON to benchmarks/results/<version>.json; keeping
+one file per release makes regressions visible when results are compared.
+
+Usage:
+    python -m benchmarks.bench
+    python -m benchmarks.bench --latency 0.002 --iterations 500
+    python -m benchmarks.bench --compare benchmarks/results/1.0.0.json --no-save
+    python -m benchmarks.bench --history
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import everest_api
+from everest_api import (
+    EverestApi, EverestApiResponse, Http2Transport, MissionExporter, ResponseCache
+)
+from everest_api.testing import MockEverestServer
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Metrics where a higher value is better; every other metric is "lower is better"
+HIGHER_IS_BETTER = frozenset({'ops_per_sec'})
+
+
+def _serve(connection: Any, settings: Dict[str, Any]) -> None:
+    """Run a mock server until the parent process asks it to stop."""
+    server = MockEverestServer(**settings).start()
+    connection.send(server.base_url)
+    connection.recv()
+    server.stop()
+
+
+@contextmanager
+def mock_server(**settings: Any) -> Iterator[str]:
+    """
+    Run a MockEverestServer in a child process.
+
+    Keeping the server out of the benchmark process means its CPU time
+    and allocations are not attributed to the SDK.
+
+    Args:
+        **settings: MockEverestServer keyword arguments
+
+    Yields:
+        Base API URL of the server
+    """
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_serve, args=(child, settings), daemon=True)
+    process.start()
+    try:
+        yield parent.recv()
+    finally:
+        parent.send(None)
+        process.join(5)
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """
+    Compute a percentile using the nearest-rank method.
+
+    Args:
+        samples: Measured values
+        fraction: Percentile as a fraction (e.g. 0.99)
+
+    Returns:
+        Percentile value
+    """
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def measure(operation: Callable[[], Any], iterations: int, ops_per_call: int = 1) -> Dict[str, float]:
+    """
+    Time an operation and then measure its peak memory.
+
+    Timing and memory are measured in separate passes because tracemalloc
+    slows down allocation-heavy code considerably.
+
+    Args:
+        operation: Callable to benchmark
+        iterations: Number of timed calls
+        ops_per_call: Number of logical operations performed per call
+
+    Returns:
+        Dictionary of metrics
+    """
+    operation()  # warm up connections and caches
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'ops_per_sec': round(iterations * ops_per_call / elapsed, 2),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'peak_memory_kib': round(peak / 1024, 1),
+    }
+
+
+def measure_import(statement: str, runs: int) -> Dict[str, float]:
+    """
+    Time an import statement in fresh interpreters.
+
+    Each run starts a new Python process, so nothing is cached in
+    `sys.modules`; only the statement itself is timed.
+
+    Args:
+        statement: Import statement to time
+        runs: Number of interpreters started
+
+    Returns:
+        Dictionary of metrics
+    """
+    script = (
+        'import time\n'
+        'started = time.perf_counter()\n'
+        f'{statement}\n'
+        'print(time.perf_counter() - started)\n'
+    )
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', script], check=True, stdout=subprocess.PIPE,
+            universal_newlines=True
+        ).stdout
+        samples.append(float(output))
+
+    return {
+        'p50_ms': round(percentile(samples, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(samples, 0.99) * 1000, 3),
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """
+    Run every benchmark scenario.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Metrics per scenario
+    """
+    results: Dict[str, Dict[str, float]] = {
+        'import_package': measure_import('import everest_api', args.import_runs),
+        'import_client': measure_import(
+            'from everest_api import EverestApi, EverestApiResponse', args.import_runs
+        ),
+    }
+
+    settings = {
+        'latency': args.latency,
+        'mission_count': args.missions,
+        'mission_padding': args.mission_padding,
+    }
+
+    with mock_server(**settings) as base_url:
+        api = EverestApi(base_url, 'bench-client', 'bench-secret')
+        api.auth()
+
+        def single_call() -> None:
+            api.post('/is-handled-address', {
+                'address': '18 Boulevard des Batignolles, 75017 Paris',
+                'start_date': 1760000000,
+                'service_id': 2,
+            })
+
+        executor = ThreadPoolExecutor(max_workers=args.concurrency)
+        refs = [f'MOCK-{i:06d}' for i in range(args.batch_size)]
+
+        def batch() -> None:
+            list(executor.map(lambda ref: api.post('/missions/get', {'ref': ref}), refs))
+
+        def pagination() -> None:
+            start = 0
+            while True:
+                page = api.post('/missions', {
+                    'limit_start': start,
+                    'limit_end': start + args.page_size,
+                }).get_data()['missions']
+                start += args.page_size
+                if len(page) < args.page_size:
+                    break
+
+        def streamed_page() -> None:
+            for _ in api.stream_missions({'limit_start': 0, 'limit_end': args.missions}):
+                pass
+
+        def full_page() -> None:
+            api.post('/missions', {'limit_start': 0, 'limit_end': args.missions}).get_data()
+
+        generator = MockEverestServer(**settings)
+        page_body = json.dumps({'missions': [generator.mission(i) for i in range(args.page_size)]})
+
+        def response_parsing() -> None:
+            EverestApiResponse(page_body, 200, {'Content-Type': 'application/json'}).get_data()
+
+        results['single_call'] = measure(single_call, args.iterations)
+        results['batch'] = measure(batch, max(1, args.iterations // args.batch_size), args.batch_size)
+        results['pagination'] = measure(pagination, max(1, args.iterations // 50))
+        results['full_page'] = measure(full_page, max(1, args.iterations // 50))
+        results['streamed_page'] = measure(streamed_page, max(1, args.iterations // 50))
+        results['response_parsing'] = measure(response_parsing, args.iterations)
+
+        exporter = MissionExporter(
+            api, args.processes, max(1, args.missions // (args.processes * 2)), args.page_size
+        )
+        with open(os.devnull, 'wb') as sink:
+            results['sharded_export'] = measure(
+                lambda: exporter.export(sink), max(1, args.iterations // 100), args.missions
+            )
+
+        executor.shutdown()
+
+    with mock_server(compress_responses=True, **settings) as base_url:
+        api = EverestApi(base_url, 'bench-client', 'bench-secret')
+        api.auth()
+
+        def compressed_page() -> None:
+            api.post('/missions', {'limit_start': 0, 'limit_end': args.missions}).get_data()
+
+        results['compressed_page'] = measure(compressed_page, max(1, args.iterations // 50))
+
+    with mock_server(etags=True, **settings) as base_url:
+        api = EverestApi(base_url, 'bench-client', 'bench-secret').set_response_cache(ResponseCache())
+        api.auth()
+
+        def revalidated_get() -> None:
+            api.post('/missions/get', {'ref': 'MOCK-000001'}).get_data()
+
+        results['revalidated_get'] = measure(revalidated_get, args.iterations)
+
+    try:
+        transport = Http2Transport(prior_knowledge=True)
+    except ImportError:
+        return results
+
+    with mock_server(http2=True, **settings) as base_url:
+        with EverestApi(base_url, 'bench-client', 'bench-secret', transport=transport) as api:
+            api.auth()
+            executor = ThreadPoolExecutor(max_workers=args.concurrency)
+
+            def http2_batch() -> None:
+                list(executor.map(lambda ref: api.post('/missions/get', {'ref': ref}), refs))
+
+            results['http2_batch'] = measure(
+                http2_batch, max(1, args.iterations // args.batch_size), args.batch_size
+            )
+            executor.shutdown()
+
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print a comparison table and collect regressions.
+
+    Args:
+        current: Current result document
+        baseline: Baseline result document
+        threshold: Relative change considered a regression (e.g. 0.10)
+
+    Returns:
+        Descriptions of regressed metrics
+    """
+    regressions = []
+    print(f"\nComparison against {baseline['version']} ({baseline['timestamp']}):")
+    print(f"{'scenario':<20}{'metric':<18}{'baseline':>12}{'current':>12}{'change':>10}")
+
+    for scenario, metrics in current['results'].items():
+        for metric, value in metrics.items():
+            previous = baseline['results'].get(scenario, {}).get(metric)
+            if not previous:
+                continue
+            change = (value - previous) / previous
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            flag = '  REGRESSION' if worse > threshold else ''
+            print(f'{scenario:<20}{metric:<18}{previous:>12}{value:>12}{change:>+10.1%}{flag}')
+            if flag:
+                regressions.append(f'{scenario}.{metric} {change:+.1%}')
+
+    return regressions
+
+
+def print_history() -> None:
+    """Print stored results of every release side by side."""
+    documents = []
+    for name in sorted(os.listdir(RESULTS_DIR)):
+        if name.endswith('.json'):
+            with open(os.path.join(RESULTS_DIR, name), encoding='utf-8') as f:
+                documents.append(json.load(f))
+
+    if not documents:
+        print('No stored results.')
+        return
+
+    print(f"{'scenario':<20}{'metric':<18}" + ''.join(f"{d['version']:>12}" for d in documents))
+    for scenario, metrics in documents[-1]['results'].items():
+        for metric in metrics:
+            values = ''.join(
+                f"{d['results'].get(scenario, {}).get(metric, '-'):>12}" for d in documents
+            )
+            print(f'{scenario:<20}{metric:<18}{values}')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Everest API SDK benchmarks')
+    parser.add_argument('--latency', type=float, default=0.0, help='Mock server latency in seconds')
+    parser.add_argument('--iterations', type=int, default=200, help='Timed calls per scenario')
+    parser.add_argument('--missions', type=int, default=1000, help='Missions in the mock account')
+    parser.add_argument('--mission-padding', type=int, default=200, help='Extra bytes per mission')
+    parser.add_argument('--page-size', type=int, default=100, help='Missions per page')
+    parser.add_argument('--batch-size', type=int, default=20, help='Calls per batch')
+    parser.add_argument('--concurrency', type=int, default=8, help='Threads used for batches')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes used for exports')
+    parser.add_argument('--import-runs', type=int, default=20, help='Interpreters started per import scenario')
+    parser.add_argument('--output', help='Result file (defaults to results/<version>.json)')
+    parser.add_argument('--no-save', action='store_true', help='Do not write a result file')
+    parser.add_argument('--compare', help='Baseline result file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Regression threshold')
+    parser.add_argument('--history', action='store_true', help='Print stored results and exit')
+    args = parser.parse_args(argv)
+
+    if args.history:
+        print_history()
+        return 0
+
+    output = None
+    if not args.no_save:
+        output = args.output or os.path.join(RESULTS_DIR, f'{everest_api.__version__}.json')
+
+    # Read the baseline before anything is written: it may be the default output file
+    baseline = None
+    if args.compare:
+        if output is not None and os.path.abspath(output) == os.path.abspath(args.compare):
+            parser.error(
+                f'refusing to overwrite the baseline {args.compare}; pass --output or --no-save'
+            )
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    document = {
+        'version': everest_api.__version__,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'latency': args.latency,
+            'iterations': args.iterations,
+            'missions': args.missions,
+            'mission_padding': args.mission_padding,
+            'page_size': args.page_size,
+            'batch_size': args.batch_size,
+            'concurrency': args.concurrency,
+            'processes': args.processes,
+            'import_runs': args.import_runs,
+        },
+        'results': run_benchmarks(args),
+    }
+
+    print(json.dumps(document['results'], indent=2))
+
+    if output is not None:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'\nResults written to {output}')
+
+    if baseline is not None:
+        regressions = compare(document, baseline, args.threshold)
+        if regressions:
+            print('\nRegressions: ' + ', '.join(regressions))
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,18 +2,102 @@
 Everest API Client
 
 Simple Python client for the Everest Logistics API.
+
+Names are imported from their submodules on first access (PEP 562), so
+`import everest_api` stays cheap: `requests` is only imported once a
+request is sent, and code that only parses responses (e.g. webhook
+handlers) never loads the HTTP stack.
 """
 
-from .client import EverestApi
-from .response import EverestApiResponse
-from .exceptions import EverestApiException
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "1.0.0"
 __author__ = "Everest"
 __email__ = "contact@everst.io"
 
+# Public name -> submodule defining it
+_EXPORTS = {
+    'EverestApi': 'client',
+    'EverestApiResponse': 'response',
+    'EverestApiException': 'exceptions',
+    'CircuitOpenException': 'exceptions',
+    'DeadlineExceededException': 'exceptions',
+    'Deadline': 'deadline',
+    'DebugLogger': 'debug',
+    'Instrumentation': 'instrumentation',
+    'CircuitBreaker': 'circuit_breaker',
+    'CircuitBreakerRegistry': 'circuit_breaker',
+    'RateLimiter': 'rate_limit',
+    'PriorityScheduler': 'scheduling',
+    'Quote': 'quotes',
+    'QuoteCache': 'quotes',
+    'QuoteMatrix': 'quotes',
+    'MissionChange': 'polling',
+    'MissionPoller': 'polling',
+    'MissionUpdater': 'tracking',
+    'TrackedMission': 'tracking',
+    'TenantClientPool': 'tenants',
+    'ResponseCache': 'caching',
+    'ExportBatch': 'export',
+    'MissionExporter': 'export',
+    'Transport': 'transport',
+    'RequestsTransport': 'transport',
+    'Http2Transport': 'transport',
+    'RecordingTransport': 'transport',
+    'ReplayTransport': 'transport',
+}
+
+_SUBMODULES = frozenset({
+    'caching', 'circuit_breaker', 'client', 'compression', 'deadline', 'debug', 'exceptions', 'export',
+    'instrumentation', 'polling', 'quotes', 'rate_limit', 'response', 'scheduling',
+    'streaming', 'tenants', 'testing', 'tracking', 'transport',
+})
+
+# Spelled out (not derived from _EXPORTS) so linters see the lazily imported names as exported
 __all__ = [
-    'EverestApi',
-    'EverestApiResponse',
-    'EverestApiException',
+    'EverestApi', 'EverestApiResponse', 'EverestApiException', 'CircuitOpenException',
+    'DeadlineExceededException', 'Deadline', 'DebugLogger', 'Instrumentation', 'CircuitBreaker',
+    'CircuitBreakerRegistry', 'RateLimiter', 'PriorityScheduler', 'Quote', 'QuoteCache',
+    'QuoteMatrix', 'MissionChange', 'MissionPoller', 'MissionUpdater', 'TrackedMission',
+    'TenantClientPool', 'ResponseCache', 'ExportBatch', 'MissionExporter', 'Transport',
+    'RequestsTransport', 'Http2Transport', 'RecordingTransport', 'ReplayTransport',
 ]
+
+if TYPE_CHECKING:
+    from .client import EverestApi
+    from .response import EverestApiResponse
+    from .exceptions import EverestApiException, CircuitOpenException, DeadlineExceededException
+    from .deadline import Deadline
+    from .debug import DebugLogger
+    from .instrumentation import Instrumentation
+    from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+    from .rate_limit import RateLimiter
+    from .scheduling import PriorityScheduler
+    from .quotes import Quote, QuoteCache, QuoteMatrix
+    from .polling import MissionChange, MissionPoller
+    from .tracking import MissionUpdater, TrackedMission
+    from .tenants import TenantClientPool
+    from .caching import ResponseCache
+    from .export import ExportBatch, MissionExporter
+    from .transport import (
+        Transport, RequestsTransport, Http2Transport, RecordingTransport, ReplayTransport
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES)
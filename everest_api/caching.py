@@ -0,0 +1,207 @@
+"""
+Everest API Response Cache
+
+Client-side revalidation of repeated reads. Responses carrying an ETag
+or Last-Modified validator are kept in a bounded LRU cache; identical
+later requests send If-None-Match / If-Modified-Since, and a
+304 Not Modified answer is served from the cached body without
+downloading it again. Responses without validators are compared by
+content hash. Either way callers get a copy of the cached response, so
+changes made to its data do not leak into later reads.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from .response import EverestApiResponse
+from .transport import request_key
+
+
+# Read endpoints whose responses are cached by default
+DEFAULT_ENDPOINTS = frozenset({'services', 'missions/get'})
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of responses and their validators.
+
+    Entries are keyed by method, URL and request parameters. A cache
+    holds responses as seen with one set of credentials; do not share it
+    between clients of different accounts.
+
+    Example:
+        api.set_response_cache(ResponseCache(max_entries=500))
+        first = api.post('/missions/get', {'ref': ref})
+        again = api.post('/missions/get', {'ref': ref})
+        if again.get_content_hash() == first.get_content_hash():
+            pass  # unchanged, nothing to reprocess
+    """
+
+    def __init__(self, max_entries: int = 1000, endpoints: Optional[Iterable[str]] = DEFAULT_ENDPOINTS):
+        """
+        Create a new cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            endpoints: Endpoint paths to cache (e.g. /services), or None for every endpoint
+        """
+        self._max_entries = max(1, max_entries)
+        self._endpoints = None if endpoints is None else frozenset(e.strip('/') for e in endpoints)
+        self._entries: 'OrderedDict[bytes, EverestApiResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._not_modified = 0
+        self._unchanged = 0
+        self._changed = 0
+
+    def caches(self, endpoint: str) -> bool:
+        """
+        Check whether responses of an endpoint are cached.
+
+        Args:
+            endpoint: Endpoint path
+
+        Returns:
+            True if the endpoint is cached
+        """
+        return self._endpoints is None or endpoint.strip('/') in self._endpoints
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Dict[str, Any]]) -> bytes:
+        """
+        Compute the cache key of a request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Request parameters
+
+        Returns:
+            Cache key
+        """
+        body = json.dumps(params, sort_keys=True).encode('utf-8') if params else b''
+        return request_key(method, url, body)
+
+    def get(self, key: bytes) -> Optional[EverestApiResponse]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    @staticmethod
+    def conditional_headers(response: EverestApiResponse) -> Dict[str, str]:
+        """
+        Build the revalidation headers for a cached response.
+
+        Args:
+            response: Cached response
+
+        Returns:
+            If-None-Match and/or If-Modified-Since headers (empty without validators)
+        """
+        headers = {}
+        etag = response.get_header('ETag')
+        if etag:
+            headers['If-None-Match'] = etag
+        last_modified = response.get_header('Last-Modified')
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def not_modified(self, key: bytes, cached: EverestApiResponse) -> EverestApiResponse:
+        """
+        Resolve a 304 Not Modified answer.
+
+        The response revalidated by the request is served even if another
+        thread evicted its entry meanwhile.
+
+        Args:
+            key: Cache key of the request
+            cached: Cached response whose validators were sent
+
+        Returns:
+            Copy of the cached response
+        """
+        with self._lock:
+            self._not_modified += 1
+            if self._entries.get(key) is cached:
+                self._entries.move_to_end(key)
+        return cached.copy()
+
+    def update(
+        self,
+        key: bytes,
+        response: EverestApiResponse,
+        cached: Optional[EverestApiResponse] = None
+    ) -> EverestApiResponse:
+        """
+        Store a fresh response, or keep the cached body if it is the same.
+
+        An unchanged body is stored with the headers of the new response,
+        so later requests send its validators rather than stale ones.
+
+        Args:
+            key: Cache key of the request
+            response: Response just received
+            cached: Response cached for the request before it was sent
+
+        Returns:
+            A copy of the cached response when the content hash matches, otherwise `response`
+        """
+        if not response.is_success():
+            return response
+
+        stored = response
+        unchanged = cached is not None and cached.get_content_hash() == response.get_content_hash()
+        if unchanged and cached is not None:
+            # Keep the cached body under the new validators; callers get their own copy of the data
+            stored = cached.copy(headers=response.get_headers())
+            response = stored.copy()
+
+        with self._lock:
+            if unchanged:
+                self._unchanged += 1
+            elif cached is not None:
+                self._changed += 1
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with entries, max_entries and the number of
+            revalidations answered by 304 (not_modified), by an identical
+            body (unchanged) and by a new body (changed)
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self._max_entries,
+                'not_modified': self._not_modified,
+                'unchanged': self._unchanged,
+                'changed': self._changed,
+            }
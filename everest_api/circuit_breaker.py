@@ -0,0 +1,269 @@
+"""
+Everest API Circuit Breakers
+
+Per-endpoint circuit breakers that stop sending requests to an endpoint
+while it is failing or too slow, so callers fail fast instead of piling
+up on timeouts.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding a single endpoint.
+
+    Outcomes of the last `window_size` calls are tracked. Once at least
+    `minimum_calls` are recorded, the breaker opens when the failure rate
+    or the slow call rate reaches its threshold. After `open_timeout`
+    seconds it lets `half_open_max_calls` trial calls through: if they all
+    succeed it closes again, any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = 10.0,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Create a new circuit breaker.
+
+        Args:
+            failure_rate_threshold: Failure ratio (0-1) that opens the breaker
+            slow_call_threshold: Duration in seconds above which a call is slow
+            slow_call_rate_threshold: Slow call ratio (0-1) that opens the breaker
+            window_size: Number of recent calls considered
+            minimum_calls: Calls required before rates are evaluated
+            open_timeout: Seconds to stay open before allowing trial calls
+            half_open_max_calls: Trial calls allowed while half-open
+            clock: Monotonic clock function
+        """
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_threshold = slow_call_threshold
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._minimum_calls = min(minimum_calls, window_size)
+        self._open_timeout = open_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._failures = 0
+        self._slow_calls = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_successes = 0
+
+    def get_state(self) -> str:
+        """
+        Get the current state.
+
+        Returns:
+            One of `closed`, `open` or `half_open`
+        """
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Ask permission to send a call.
+
+        Every allowed call must be followed by `record()`, or by
+        `release()` if it is not sent after all.
+
+        Returns:
+            True if the call may proceed
+        """
+        with self._lock:
+            self._refresh_state()
+
+            if self._state == CLOSED:
+                return True
+
+            if self._state == HALF_OPEN and self._trial_calls < self._half_open_max_calls:
+                self._trial_calls += 1
+                return True
+
+            return False
+
+    def release(self) -> None:
+        """
+        Give back the permission of an allowed call that was not sent.
+
+        Local failures (e.g. waiting too long for the rate limiter) say
+        nothing about the endpoint, so they are not recorded as outcomes.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._trial_calls > self._trial_successes:
+                self._trial_calls -= 1
+
+    def retry_after(self) -> float:
+        """
+        Get the time left before the breaker allows trial calls.
+
+        Returns:
+            Seconds until the open state expires (0 when not open)
+        """
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._open_timeout - self._clock())
+
+    def record(self, success: bool, elapsed: float) -> None:
+        """
+        Record the outcome of an allowed call.
+
+        Args:
+            success: False for transport errors and 5xx responses
+            elapsed: Call duration in seconds
+        """
+        slow = elapsed >= self._slow_call_threshold
+        failed = not success
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if failed or slow:
+                    self._open()
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self._half_open_max_calls:
+                        self._close()
+                return
+
+            if self._state == OPEN:
+                return
+
+            if len(self._window) == self._window.maxlen:
+                old_failed, old_slow = self._window[0]
+                self._failures -= old_failed
+                self._slow_calls -= old_slow
+            self._window.append((failed, slow))
+            self._failures += failed
+            self._slow_calls += slow
+
+            calls = len(self._window)
+            if calls >= self._minimum_calls and (
+                self._failures / calls >= self._failure_rate_threshold
+                or self._slow_calls / calls >= self._slow_call_rate_threshold
+            ):
+                self._open()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the breaker state and window statistics.
+
+        Returns:
+            Dictionary with state, calls, failure_rate and slow_call_rate
+        """
+        with self._lock:
+            self._refresh_state()
+            calls = len(self._window)
+            return {
+                'state': self._state,
+                'calls': calls,
+                'failure_rate': round(self._failures / calls, 3) if calls else 0.0,
+                'slow_call_rate': round(self._slow_calls / calls, 3) if calls else 0.0,
+            }
+
+    def _refresh_state(self) -> None:
+        """Move from open to half-open once the open timeout has elapsed."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self._open_timeout:
+            self._state = HALF_OPEN
+            self._trial_calls = 0
+            self._trial_successes = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._window.clear()
+        self._failures = 0
+        self._slow_calls = 0
+
+
+class CircuitBreakerRegistry:
+    """
+    Lazily created circuit breakers, one per endpoint.
+
+    All breakers share the settings given to the registry; individual
+    endpoints can be tuned with `configure()`.
+    """
+
+    def __init__(self, **settings: Any):
+        """
+        Create a new registry.
+
+        Args:
+            **settings: Default CircuitBreaker keyword arguments
+        """
+        self._settings = settings
+        self._endpoint_settings: Dict[str, Dict[str, Any]] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, endpoint: str, **settings: Any) -> 'CircuitBreakerRegistry':
+        """
+        Override breaker settings for one endpoint.
+
+        Args:
+            endpoint: API endpoint path (e.g. missions/get)
+            **settings: CircuitBreaker keyword arguments
+
+        Returns:
+            Self for method chaining
+        """
+        endpoint = endpoint.strip('/')
+        with self._lock:
+            self._endpoint_settings[endpoint] = settings
+            self._breakers.pop(endpoint, None)
+        return self
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """
+        Get the breaker for an endpoint, creating it if needed.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            Circuit breaker for the endpoint
+        """
+        endpoint = endpoint.strip('/')
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(endpoint)
+                if breaker is None:
+                    settings = dict(self._settings)
+                    settings.update(self._endpoint_settings.get(endpoint, {}))
+                    breaker = self._breakers[endpoint] = CircuitBreaker(**settings)
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every breaker.
+
+        Returns:
+            Breaker snapshots keyed by endpoint
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {endpoint: breaker.snapshot() for endpoint, breaker in breakers.items()}
@@ -6,11 +6,27 @@ Handles authentication, requests, and provides easy access to all API endpoints.
 """
 
 import json
-from typing import Dict, Any, Optional
-import requests
-
+import time
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .compression import accept_encoding, available_encodings, compress
+from .deadline import Deadline
+from .instrumentation import Instrumentation
+from .rate_limit import RateLimiter
+from .scheduling import PriorityScheduler
 from .response import EverestApiResponse
-from .exceptions import EverestApiException
+from .exceptions import EverestApiException, CircuitOpenException, DeadlineExceededException
+from .streaming import JsonArrayStream
+from .transport import Transport, RequestsTransport, TransportResponse, DEFAULT_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from .caching import ResponseCache
+    from .debug import DebugLogger
+    from .quotes import QuoteCache, QuoteMatrix
+
+DEFAULT_CONNECT_TIMEOUT = 30.0
+DEFAULT_READ_TIMEOUT = 30.0
 
 
 class EverestApi:
@@ -26,7 +42,10 @@ class EverestApi:
         base_url: str,
         client_id: str,
         client_secret: str,
-        debug: bool = False
+        debug: bool = False,
+        transport: Optional[Transport] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT
     ):
         """
         Create a new Everest API client instance.
@@ -35,14 +54,36 @@ class EverestApi:
             base_url: API base URL (e.g., https://platform.everst.io/api)
             client_id: OAuth client ID for authentication
             client_secret: OAuth client secret for authentication
-            debug: Enable debug mode to output request/response details
+            debug: Enable structured debug logging of requests and responses
+            transport: HTTP transport to use (defaults to a pooled requests session)
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for the server between bytes of the response
         """
         self._base_url = base_url.rstrip('/')
         self._client_id = client_id
         self._client_secret = client_secret
         self._debug = debug
+        self._debug_logger: Optional['DebugLogger'] = None
+        if debug:
+            # logging.handlers is only worth importing when debug logging is on
+            from .debug import DebugLogger
+            self._debug_logger = DebugLogger.default()
         self._token: Optional[str] = None
         self._verify_ssl = True
+        self._transport = transport or RequestsTransport()
+        self._instrumentation = Instrumentation()
+        self._circuit_breakers: Optional[CircuitBreakerRegistry] = None
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._scheduler: Optional[PriorityScheduler] = None
+        self._response_cache: Optional['ResponseCache'] = None
+        self._timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self._endpoint_timeouts: Dict[str, Tuple[float, float]] = {}
+        self._compression_threshold: Optional[int] = None
+        self._compression_encoding = 'gzip'
+        self._compression_level = 6
+        # None advertises every available encoding; optional codecs are probed on first request
+        self._accept_encoding: Optional[str] = None
+        self._instrumentation.register('compression', self._compression_stats)
 
     def set_verify_ssl(self, verify: bool) -> 'EverestApi':
         """
@@ -57,20 +98,258 @@ class EverestApi:
         self._verify_ssl = verify
         return self
 
-    def auth(self) -> EverestApiResponse:
+    def set_timeout(
+        self,
+        connect: Optional[float] = None,
+        read: Optional[float] = None,
+        endpoint: Optional[str] = None
+    ) -> 'EverestApi':
+        """
+        Configure connect and read timeouts for all endpoints or a single one.
+
+        Values left as None keep the client-wide setting.
+
+        Args:
+            connect: Seconds to wait for a connection to be established
+            read: Seconds to wait for the server between bytes of the response
+            endpoint: Endpoint path (e.g., /is-handled-address) or None for all endpoints
+
+        Returns:
+            Self for method chaining
+        """
+        if endpoint is None:
+            self._timeout = (
+                self._timeout[0] if connect is None else connect,
+                self._timeout[1] if read is None else read,
+            )
+            return self
+
+        endpoint = endpoint.strip('/')
+        current = self._endpoint_timeouts.get(endpoint, self._timeout)
+        self._endpoint_timeouts[endpoint] = (
+            current[0] if connect is None else connect,
+            current[1] if read is None else read,
+        )
+        return self
+
+    def get_timeout(self, endpoint: Optional[str] = None) -> Tuple[float, float]:
+        """
+        Get the connect and read timeouts used for an endpoint.
+
+        Args:
+            endpoint: Endpoint path or None for the client-wide setting
+
+        Returns:
+            Tuple of connect and read timeouts in seconds
+        """
+        if endpoint is None:
+            return self._timeout
+        return self._endpoint_timeouts.get(endpoint.strip('/'), self._timeout)
+
+    def set_compression(
+        self,
+        threshold: Optional[int] = None,
+        encoding: str = 'gzip',
+        level: int = 6,
+        accept_compressed: bool = True
+    ) -> 'EverestApi':
+        """
+        Configure request and response compression.
+
+        Request bodies of at least `threshold` bytes are compressed and sent
+        with a Content-Encoding header; small bodies are sent as-is since
+        compressing them costs more than it saves. Compressed responses are
+        decoded as they are read, including streamed ones.
+
+        Args:
+            threshold: Minimum body size in bytes to compress, or None to never compress
+            encoding: Request encoding (gzip, deflate, or br/zstd when installed)
+            level: Compression level
+            accept_compressed: Advertise supported encodings with Accept-Encoding
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the encoding is not available
+        """
+        if encoding not in available_encodings():
+            raise ValueError(f'Unsupported content encoding: {encoding}')
+        self._compression_threshold = threshold
+        self._compression_encoding = encoding
+        self._compression_level = level
+        self._accept_encoding = None if accept_compressed else 'identity'
+        return self
+
+    def set_debug_logger(self, debug_logger: Optional['DebugLogger']) -> 'EverestApi':
+        """
+        Set the debug logger used to record requests and responses.
+
+        Args:
+            debug_logger: Debug logger to use, or None to disable debug logging
+
+        Returns:
+            Self for method chaining
+        """
+        self._debug_logger = debug_logger
+        self._debug = debug_logger is not None
+        return self
+
+    def set_transport(self, transport: Transport) -> 'EverestApi':
+        """
+        Set the HTTP transport used to send requests.
+
+        Args:
+            transport: Transport to use (e.g. RecordingTransport or ReplayTransport)
+
+        Returns:
+            Self for method chaining
+        """
+        self._transport = transport
+        return self
+
+    def get_transport(self) -> Transport:
+        """
+        Get the HTTP transport used to send requests.
+
+        Returns:
+            Current transport
+        """
+        return self._transport
+
+    def set_circuit_breakers(self, circuit_breakers: Optional[CircuitBreakerRegistry]) -> 'EverestApi':
+        """
+        Guard endpoints with circuit breakers.
+
+        While an endpoint's breaker is open, requests to it fail fast with
+        CircuitOpenException. Breaker states are published in
+        `get_instrumentation().snapshot()['circuit_breakers']`.
+
+        Args:
+            circuit_breakers: Breaker registry to use, or None to disable breakers
+
+        Returns:
+            Self for method chaining
+        """
+        self._circuit_breakers = circuit_breakers
+        self._instrumentation.register(
+            'circuit_breakers', circuit_breakers.snapshot if circuit_breakers else None
+        )
+        return self
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> 'EverestApi':
+        """
+        Limit the request rate.
+
+        Requests wait for a token before being sent; with a deadline they
+        wait at most until it expires. A limiter may be shared by several
+        clients. Its counters are published in
+        `get_instrumentation().snapshot()['rate_limiter']`.
+
+        Args:
+            rate_limiter: Rate limiter to use, or None to disable rate limiting
+
+        Returns:
+            Self for method chaining
+        """
+        self._rate_limiter = rate_limiter
+        self._instrumentation.register(
+            'rate_limiter', rate_limiter.snapshot if rate_limiter else None
+        )
+        return self
+
+    def set_response_cache(self, response_cache: Optional['ResponseCache']) -> 'EverestApi':
+        """
+        Revalidate repeated reads instead of downloading them again.
+
+        Requests to the cache's endpoints send the ETag / Last-Modified
+        validators of the cached response; a 304 answer returns a copy of
+        the cached response, without downloading a body. A 2xx answer whose
+        body is identical to the cached one also returns a copy, so equal
+        `get_content_hash()` values tell callers nothing changed. Counters
+        are published in `get_instrumentation().snapshot()['response_cache']`.
+
+        Args:
+            response_cache: Response cache to use, or None to disable revalidation
+
+        Returns:
+            Self for method chaining
+        """
+        self._response_cache = response_cache
+        self._instrumentation.register(
+            'response_cache', response_cache.snapshot if response_cache is not None else None
+        )
+        return self
+
+    def set_scheduler(self, scheduler: Optional[PriorityScheduler]) -> 'EverestApi':
+        """
+        Queue requests in priority lanes.
+
+        The scheduler bounds the requests in flight; when it is saturated,
+        interactive requests are admitted ahead of queued bulk requests.
+        Requests wait for a slot before the rate limiter. Lane statistics
+        are published in `get_instrumentation().snapshot()['scheduler']`.
+
+        Args:
+            scheduler: Scheduler to use (may be shared by several clients), or None to disable
+
+        Returns:
+            Self for method chaining
+        """
+        self._scheduler = scheduler
+        self._instrumentation.register('scheduler', scheduler.snapshot if scheduler else None)
+        return self
+
+    def with_priority(self, priority: str) -> 'PriorityView':
+        """
+        Get a view of this client sending its requests with a priority.
+
+        The view shares the client's token, transport and settings.
+
+        Args:
+            priority: Scheduling lane (e.g. interactive or bulk)
+
+        Returns:
+            Client view
+        """
+        return PriorityView(self, priority)
+
+    def get_instrumentation(self) -> Instrumentation:
+        """
+        Get the metrics collected by this client.
+
+        Returns:
+            Instrumentation instance
+        """
+        return self._instrumentation
+
+    def close(self) -> None:
+        """Close the transport and release pooled connections."""
+        self._transport.close()
+
+    def __enter__(self) -> 'EverestApi':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def auth(self, deadline: Optional[Deadline] = None) -> EverestApiResponse:
         """
         Authenticate with the API and store the access token.
 
         Uses client credentials to obtain a bearer token that will be
         automatically included in subsequent requests.
 
+        Args:
+            deadline: Time budget shared with other calls
+
         Returns:
             Response containing authentication result and token
         """
         response = self.post('auth', {
             'client_id': self._client_id,
             'client_secret': self._client_secret,
-        })
+        }, deadline=deadline)
 
         if response.is_success():
             data = response.get_data()
@@ -103,59 +382,191 @@ class EverestApi:
         self._token = token
         return self
 
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> EverestApiResponse:
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
         """
         Send a GET request to the API.
 
         Args:
             endpoint: API endpoint path (e.g., /missions/get)
             params: Query parameters or request body
+            deadline: Time budget shared with other calls
+            priority: Scheduling lane (e.g. interactive or bulk), see `set_scheduler()`
 
         Returns:
             Response object containing status and data
         """
-        return self._request('GET', endpoint, params or {})
+        return self._request('GET', endpoint, params or {}, deadline, priority)
 
-    def post(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> EverestApiResponse:
+    def post(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
         """
         Send a POST request to the API.
 
         Args:
             endpoint: API endpoint path (e.g., /missions/create)
             params: Request parameters to send in the body
+            deadline: Time budget shared with other calls
+            priority: Scheduling lane (e.g. interactive or bulk), see `set_scheduler()`
 
         Returns:
             Response object containing status and data
         """
-        return self._request('POST', endpoint, params or {})
+        return self._request('POST', endpoint, params or {}, deadline, priority)
 
-    def put(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> EverestApiResponse:
+    def put(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
         """
         Send a PUT request to the API.
 
         Args:
             endpoint: API endpoint path (e.g., /missions/update)
             params: Request parameters to send in the body
+            deadline: Time budget shared with other calls
+            priority: Scheduling lane (e.g. interactive or bulk), see `set_scheduler()`
 
         Returns:
             Response object containing status and data
         """
-        return self._request('PUT', endpoint, params or {})
+        return self._request('PUT', endpoint, params or {}, deadline, priority)
 
-    def delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> EverestApiResponse:
+    def delete(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
         """
         Send a DELETE request to the API.
 
         Args:
             endpoint: API endpoint path (e.g., /missions/delete)
             params: Request parameters to send in the body
+            deadline: Time budget shared with other calls
+            priority: Scheduling lane (e.g. interactive or bulk), see `set_scheduler()`
 
         Returns:
             Response object containing status and data
         """
-        return self._request('DELETE', endpoint, params or {})
+        return self._request('DELETE', endpoint, params or {}, deadline, priority)
+
+    def stream_missions(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        priority: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream missions from the /missions endpoint one at a time.
+
+        The body is read from the socket in chunks and each mission is
+        yielded as soon as it is decoded, so peak memory stays around a
+        single mission instead of the whole page. The request is sent when
+        iteration starts.
+
+        Args:
+            params: Request parameters (e.g., limit_start, limit_end)
+            deadline: Time budget for the request and reading the body
+            chunk_size: Maximum number of bytes read from the socket at once
+            priority: Scheduling lane (e.g. interactive or bulk), see `set_scheduler()`
+
+        Yields:
+            Decoded missions, in order
+
+        Raises:
+            EverestApiException: If the request fails, the API returns an error
+                status or the body is not valid JSON or has no missions array
+        """
+        response = self._send('POST', 'missions', params or {}, deadline, True, priority)
+        try:
+            if not 200 <= response.status_code < 300:
+                error = EverestApiResponse(
+                    response.content.decode('utf-8', errors='replace'),
+                    response.status_code,
+                    response.headers
+                )
+                raise EverestApiException(
+                    f'Request failed with status {response.status_code}: {error.get_error_message()}'
+                )
+
+            parser = JsonArrayStream('missions')
+            for chunk in response.iter_content(chunk_size):
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceededException('Deadline exceeded while reading missions')
+                for mission in parser.feed(chunk):
+                    yield mission
+                if parser.done():
+                    break
+            else:
+                parser.close()
+            # Error bodies (e.g. {"error": "Invalid limit range"}) may come with a 2xx status
+            if not parser.found():
+                raise EverestApiException('Invalid missions response: no "missions" array')
+        except ValueError as e:
+            raise EverestApiException(f'Invalid JSON in missions response: {str(e)}') from e
+        finally:
+            response.close()
+            self._record_response_size(response)
+
+    def quote_matrix(
+        self,
+        addresses: Iterable[str],
+        services: Iterable[int],
+        slots: Iterable[int],
+        cache: Optional['QuoteCache'] = None,
+        max_workers: int = 8,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> 'QuoteMatrix':
+        """
+        Check eligibility and price of every address, service and slot combination.
+
+        Each distinct combination not found in the cache is sent to
+        /is-handled-address, concurrently.
+
+        Args:
+            addresses: Delivery addresses
+            services: Service IDs
+            slots: Slot start dates as Unix timestamps
+            cache: Quote cache to read from and fill
+            max_workers: Maximum number of concurrent lookups
+            deadline: Time budget shared by all lookups
+            priority: Scheduling lane of the lookups
 
-    def _request(self, method: str, endpoint: str, params: Dict[str, Any]) -> EverestApiResponse:
+        Returns:
+            Result table indexed by (address, service_id, start_date)
+        """
+        from .quotes import quote_matrix
+
+        return quote_matrix(
+            self, addresses, services, slots, cache, max_workers, deadline, priority
+        )
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
         """
         Execute an HTTP request to the API.
 
@@ -163,86 +574,350 @@ class EverestApi:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
             params: Request parameters
+            deadline: Time budget capping the request timeouts
+            priority: Scheduling lane
 
         Returns:
             Response object
 
         Raises:
+            CircuitOpenException: If the endpoint's circuit breaker is open
+            DeadlineExceededException: If the deadline passes before or during the request
+            EverestApiException: If request fails
+        """
+        cache = self._response_cache
+        if cache is None or not cache.caches(endpoint):
+            response = self._send(method, endpoint, params, deadline, priority=priority)
+
+            # Extract response data (headers are wrapped, not copied)
+            response_body = response.content.decode('utf-8', errors='replace')
+
+            return EverestApiResponse(response_body, response.status_code, response.headers)
+
+        key = cache.key(method, f"{self._base_url}/{endpoint.strip('/')}", params)
+        cached = cache.get(key)
+        headers = cache.conditional_headers(cached) if cached is not None else None
+        response = self._send(method, endpoint, params, deadline, priority=priority, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            return cache.not_modified(key, cached)
+
+        response_body = response.content.decode('utf-8', errors='replace')
+        return cache.update(
+            key, EverestApiResponse(response_body, response.status_code, response.headers), cached
+        )
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        stream: bool = False,
+        priority: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> TransportResponse:
+        """
+        Send an HTTP request once the scheduler admits it.
+
+        The scheduler slot is held until the response is read; for
+        streamed responses, until the response is closed.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            params: Request parameters
+            deadline: Time budget capping the wait and the request timeouts
+            stream: Leave the response body on the connection
+            priority: Scheduling lane (defaults to the scheduler's default priority)
+            headers: Extra request headers (e.g. conditional request headers)
+
+        Returns:
+            Raw transport response
+
+        Raises:
+            CircuitOpenException: If the endpoint's circuit breaker is open
+            DeadlineExceededException: If the deadline passes before or during the request
+            EverestApiException: If request fails
+        """
+        # Fail fast while the endpoint is degraded, without taking a slot or rate limiter tokens
+        endpoint = endpoint.lstrip('/')
+        breaker = self._circuit_breakers.get(endpoint) if self._circuit_breakers else None
+        if breaker is not None and not breaker.allow():
+            self._instrumentation.increment('circuit_breaker_rejections')
+            raise CircuitOpenException(
+                f'Circuit breaker open for endpoint: {endpoint}',
+                endpoint,
+                breaker.retry_after()
+            )
+
+        scheduler = self._scheduler
+        if scheduler is None:
+            return self._transmit(method, endpoint, params, deadline, stream, headers, breaker)
+
+        try:
+            waited = scheduler.acquire(priority, deadline.remaining() if deadline else None)
+        except BaseException as e:
+            # The request was never sent
+            if breaker is not None:
+                breaker.release()
+            if isinstance(e, TimeoutError):
+                raise DeadlineExceededException(
+                    f'Deadline exceeded waiting for a request slot: {method} {endpoint}'
+                ) from e
+            raise
+        if waited:
+            self._instrumentation.increment('scheduler_wait_time', waited)
+
+        try:
+            response = self._transmit(method, endpoint, params, deadline, stream, headers, breaker)
+        except BaseException:
+            scheduler.release()
+            raise
+
+        if stream:
+            response.call_on_close(scheduler.release)
+        else:
+            scheduler.release()
+        return response
+
+    def _transmit(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        stream: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ) -> TransportResponse:
+        """
+        Send an HTTP request through the transport.
+
+        Applies rate limiting, timeouts, debug logging and instrumentation,
+        and records the outcome with the endpoint's circuit breaker.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            params: Request parameters
+            deadline: Time budget capping the request timeouts
+            stream: Leave the response body on the connection
+            extra_headers: Extra request headers
+            breaker: Circuit breaker that allowed the request
+
+        Returns:
+            Raw transport response
+
+        Raises:
+            DeadlineExceededException: If the deadline passes before or during the request
             EverestApiException: If request fails
         """
         endpoint = endpoint.lstrip('/')
         url = f"{self._base_url}/{endpoint}"
 
         # Prepare request body
-        request_body = json.dumps(params) if params else ''
-
-        # Prepare headers
-        headers = {
-            'Content-Type': 'text/plain; charset=UTF-8',
-            'Content-Length': str(len(request_body.encode('utf-8'))),
-        }
+        request_body = json.dumps(params).encode('utf-8') if params else b''
+
+        # Compress large bodies
+        body = request_body
+        threshold = self._compression_threshold
+        headers = {'Content-Type': 'text/plain; charset=UTF-8'}
+        if threshold is not None and request_body and len(request_body) >= threshold:
+            body = compress(request_body, self._compression_encoding, self._compression_level)
+            headers['Content-Encoding'] = self._compression_encoding
+            self._instrumentation.increment('compressed_requests')
+        headers['Content-Length'] = str(len(body))
+        headers['Accept-Encoding'] = self._accept_encoding or accept_encoding()
 
         if self._token:
             headers['Authorization'] = f'Bearer {self._token}'
+        if extra_headers:
+            headers.update(extra_headers)
 
-        # Debug output
-        if self._debug:
-            self._debug_output('Request', {
-                'Method': method,
-                'URL': url,
-                'Headers': headers,
-                'Body': params,
-            })
-
         try:
-            # Make the request
-            response = requests.request(
-                method=method,
-                url=url,
-                data=request_body,
-                headers=headers,
-                verify=self._verify_ssl,
-                timeout=30
+            # Wait for the rate limiter before the time left is used to cap timeouts
+            if self._rate_limiter is not None:
+                try:
+                    waited = self._rate_limiter.acquire(deadline.remaining() if deadline else None)
+                except TimeoutError as e:
+                    raise DeadlineExceededException(
+                        f'Deadline exceeded waiting for the rate limiter: {method} {endpoint}'
+                    ) from e
+                if waited:
+                    self._instrumentation.increment('rate_limit_wait_time', waited)
+
+            timeout = self._endpoint_timeouts.get(endpoint.rstrip('/'), self._timeout)
+            if deadline is not None:
+                timeout = deadline.cap(timeout, f'{method} {endpoint}')
+
+            # Debug logging (sampled, formatted off the request path)
+            debug_logger = self._debug_logger
+            if debug_logger is not None and not debug_logger.sample():
+                debug_logger = None
+            if debug_logger is not None:
+                debug_logger.log_request(method, url, headers, request_body)
+        except BaseException:
+            # The request was never sent
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        started = time.perf_counter()
+
+        # Make the request. Transports cap each socket read only, so with a
+        # deadline the body is streamed and the deadline checked between chunks.
+        send = self._transport.stream if stream or deadline is not None else self._transport.send
+        try:
+            response = send(method, url, body, headers, timeout, self._verify_ssl)
+            if deadline is not None and not stream:
+                response.read_raw(deadline.expired)
+        except BaseException as e:
+            # Record any failure, so a half-open breaker gets its trial slot back
+            elapsed = time.perf_counter() - started
+            self._instrumentation.record_request(endpoint, None, elapsed)
+            if breaker is not None:
+                breaker.record(False, elapsed)
+            timed_out = isinstance(e, (EverestApiException, TimeoutError))
+            if timed_out and deadline is not None and deadline.expired():
+                raise DeadlineExceededException(f'Deadline exceeded during {method} {endpoint}') from e
+            raise
+
+        elapsed = time.perf_counter() - started
+        self._instrumentation.record_request(endpoint, response.status_code, elapsed)
+        if breaker is not None:
+            breaker.record(response.status_code < 500, elapsed)
+
+        self._instrumentation.increment('request_body_bytes', len(request_body))
+        self._instrumentation.increment('request_wire_bytes', len(body))
+        if not stream:
+            # Decode now, so corrupt compressed bodies surface as API errors
+            try:
+                response.content
+            except ValueError as e:
+                raise EverestApiException(f'Invalid response encoding: {str(e)}') from e
+            self._record_response_size(response)
+
+        if debug_logger is not None:
+            debug_logger.log_response(
+                method, url, response.status_code, response.headers,
+                None if stream else response.content, elapsed
             )
 
-            # Extract response data
-            response_body = response.text
-            status_code = response.status_code
-            response_headers = dict(response.headers)
+        return response
+
+    def _record_response_size(self, response: TransportResponse) -> None:
+        """Count the bytes of a response as received and once decoded."""
+        self._instrumentation.increment('response_wire_bytes', response.wire_bytes)
+        self._instrumentation.increment('response_body_bytes', response.body_bytes)
+
+    def _compression_stats(self) -> Dict[str, float]:
+        """
+        Compute compression ratios from the transfer counters.
+
+        Returns:
+            Decoded to on-the-wire size ratios of requests and responses
+        """
+        counters = self._instrumentation
+        ratios = {}
+        for direction in ('request', 'response'):
+            wire = counters.get_counter(f'{direction}_wire_bytes')
+            decoded = counters.get_counter(f'{direction}_body_bytes')
+            ratios[f'{direction}_ratio'] = round(decoded / wire, 3) if wire else 1.0
+        return ratios
 
-            # Create response object
-            api_response = EverestApiResponse(response_body, status_code, response_headers)
 
-            # Debug output
-            if self._debug:
-                self._debug_output('Response', {
-                    'Status Code': status_code,
-                    'Headers': response_headers,
-                    'Body': api_response.get_data(),
-                })
+class PriorityView:
+    """
+    View of an EverestApi client sending requests with a default priority.
 
-            return api_response
+    Request methods accept the same arguments as EverestApi's; every other
+    attribute is looked up on the client.
 
-        except requests.exceptions.RequestException as e:
-            raise EverestApiException(f'Request error: {str(e)}') from e
+    Example:
+        bulk = api.with_priority('bulk')
+        for mission in bulk.stream_missions({'limit_start': 0, 'limit_end': 5000}):
+            export(mission)
+    """
 
-    def _debug_output(self, title: str, data: Dict[str, Any]) -> None:
+    def __init__(self, client: EverestApi, priority: str):
         """
-        Output debug information to console.
+        Create a new view.
 
         Args:
-            title: Section title (Request/Response)
-            data: Data to display
+            client: Client sending the requests
+            priority: Scheduling lane
         """
-        print('\n' + '=' * 60)
-        print(title.upper())
-        print('=' * 60)
+        self._client = client
+        self._priority = priority
 
-        for key, value in data.items():
-            print(f'\n{key}:')
-            if isinstance(value, (dict, list)):
-                print(json.dumps(value, indent=2, ensure_ascii=False))
-            else:
-                print(value)
+    def get_priority(self) -> str:
+        """
+        Get the scheduling lane of this view.
+
+        Returns:
+            Priority name
+        """
+        return self._priority
 
-        print('=' * 60 + '\n')
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
+        return self._client.get(endpoint, params, deadline, priority or self._priority)
+
+    def post(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
+        return self._client.post(endpoint, params, deadline, priority or self._priority)
+
+    def put(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
+        return self._client.put(endpoint, params, deadline, priority or self._priority)
+
+    def delete(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> EverestApiResponse:
+        return self._client.delete(endpoint, params, deadline, priority or self._priority)
+
+    def stream_missions(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        priority: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        return self._client.stream_missions(params, deadline, chunk_size, priority or self._priority)
+
+    def quote_matrix(
+        self,
+        addresses: Iterable[str],
+        services: Iterable[int],
+        slots: Iterable[int],
+        cache: Optional['QuoteCache'] = None,
+        max_workers: int = 8,
+        deadline: Optional[Deadline] = None,
+        priority: Optional[str] = None
+    ) -> 'QuoteMatrix':
+        return self._client.quote_matrix(
+            addresses, services, slots, cache, max_workers, deadline, priority or self._priority
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
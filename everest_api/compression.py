@@ -0,0 +1,202 @@
+"""
+Everest API Compression
+
+Content-Encoding support for request and response bodies. gzip and
+deflate use the standard library; brotli and zstd are used when the
+optional `brotli` (or `brotlicffi`) and `zstandard` packages are installed.
+"""
+
+import zlib
+from typing import Any, Iterable, Iterator, List, Optional
+
+
+_optional_encodings: Optional[List[str]] = None
+
+
+def _brotli() -> Any:
+    """Import a brotli implementation, or return None if none is installed."""
+    try:
+        import brotli  # type: ignore[import]
+    except ImportError:
+        try:
+            import brotlicffi as brotli  # type: ignore[import]
+        except ImportError:
+            return None
+    return brotli
+
+
+def _zstandard() -> Any:
+    """Import zstandard, or return None if it is not installed."""
+    try:
+        import zstandard  # type: ignore[import]
+    except ImportError:
+        return None
+    return zstandard
+
+
+def available_encodings() -> List[str]:
+    """
+    Get the content encodings this installation can decode.
+
+    Returns:
+        Encoding names, preferred first
+    """
+    global _optional_encodings
+    if _optional_encodings is None:
+        encodings = []
+        if _zstandard() is not None:
+            encodings.append('zstd')
+        if _brotli() is not None:
+            encodings.append('br')
+        _optional_encodings = encodings
+    return _optional_encodings + ['gzip', 'deflate']
+
+
+def accept_encoding() -> str:
+    """
+    Build the Accept-Encoding header value.
+
+    Returns:
+        Comma-separated list of supported encodings
+    """
+    return ', '.join(available_encodings())
+
+
+def compress(data: bytes, encoding: str = 'gzip', level: int = 6) -> bytes:
+    """
+    Compress a request body.
+
+    Args:
+        data: Body to compress
+        encoding: Content encoding (gzip, deflate, br or zstd)
+        level: Compression level
+
+    Returns:
+        Compressed body
+
+    Raises:
+        ValueError: If the encoding is not available
+    """
+    if encoding == 'gzip':
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    if encoding == 'deflate':
+        return zlib.compress(data, level)
+    if encoding == 'br' and _brotli() is not None:
+        return _brotli().compress(data, quality=min(level, 11))
+    if encoding == 'zstd' and _zstandard() is not None:
+        return _zstandard().ZstdCompressor(level=level).compress(data)
+    raise ValueError(f'Unsupported content encoding: {encoding}')
+
+
+class _Decompressor:
+    """Incremental decoder with a uniform interface over the codec libraries."""
+
+    def __init__(self, encoding: str):
+        self._flush = None
+        self._received = False
+        if encoding in ('gzip', 'x-gzip', 'deflate'):
+            # Automatic header detection handles gzip and zlib streams
+            decoder = zlib.decompressobj(32 + zlib.MAX_WBITS)
+            self._decompress = decoder.decompress
+            self._flush = decoder.flush
+            self._finished = lambda: decoder.eof
+        elif encoding == 'br':
+            brotli = _brotli()
+            decoder = brotli.Decompressor()
+            self._decompress = getattr(decoder, 'process', None) or decoder.decompress
+            self._finished = decoder.is_finished
+        elif encoding == 'zstd':
+            decoder = _zstandard().ZstdDecompressor().decompressobj()
+            self._decompress = decoder.decompress
+            self._finished = lambda: decoder.eof
+        else:
+            raise ValueError(f'Unsupported content encoding: {encoding}')
+
+    def decompress(self, data: bytes) -> bytes:
+        self._received = self._received or bool(data)
+        try:
+            return self._decompress(data)
+        except Exception as e:
+            raise ValueError(f'Invalid compressed data: {str(e)}') from e
+
+    def flush(self) -> bytes:
+        """
+        Finish decoding.
+
+        Raises:
+            ValueError: If the stream is corrupt or was cut off before its end
+        """
+        try:
+            data = self._flush() if self._flush is not None else b''
+            finished = self._finished()
+        except Exception as e:
+            raise ValueError(f'Invalid compressed data: {str(e)}') from e
+        # Empty bodies (e.g. 204 or 304 answers) carry no stream at all
+        if self._received and not finished:
+            raise ValueError('Truncated compressed data')
+        return data
+
+
+def _codings(encoding: str) -> List[str]:
+    """
+    Split a Content-Encoding header value into its codings.
+
+    Returns:
+        Lowercase codings in the order they were applied, identity excluded
+    """
+    codings = (coding.strip().lower() for coding in encoding.split(','))
+    return [coding for coding in codings if coding and coding != 'identity']
+
+
+def can_decode(encoding: Optional[str]) -> bool:
+    """
+    Check whether a Content-Encoding header value can be decoded.
+
+    Args:
+        encoding: Content-Encoding header value (e.g. "gzip" or "gzip, br")
+
+    Returns:
+        True when every coding is supported (identity and empty values excluded)
+    """
+    if not encoding:
+        return False
+    codings = _codings(encoding)
+    supported = available_encodings()
+    return bool(codings) and all(coding == 'x-gzip' or coding in supported for coding in codings)
+
+
+def decode_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """
+    Decompress a body chunk by chunk.
+
+    Codings of a multi-valued header are undone in reverse order of
+    application.
+
+    Args:
+        chunks: Compressed body chunks
+        encoding: Content-Encoding header value
+
+    Yields:
+        Decompressed chunks
+
+    Raises:
+        ValueError: If the encoding is unsupported, or the data is corrupt or truncated
+    """
+    codings = _codings(encoding)
+    if not codings:
+        raise ValueError(f'Unsupported content encoding: {encoding}')
+    for coding in reversed(codings):
+        chunks = _decode_chunks(chunks, _Decompressor(coding))
+    return iter(chunks)
+
+
+def _decode_chunks(chunks: Iterable[bytes], decompressor: _Decompressor) -> Iterator[bytes]:
+    """Decompress chunks with one decoder."""
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+    data = decompressor.flush()
+    if data:
+        yield data
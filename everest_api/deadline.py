@@ -0,0 +1,89 @@
+"""
+Everest API Deadlines
+
+Overall time budgets shared by a sequence of API calls. Each call's
+connect and read timeouts are capped by the time left, so a budget is
+spread across authentication, retries and page fetches made with the
+same deadline.
+"""
+
+import time
+from typing import Callable, Optional, Tuple
+
+from .exceptions import DeadlineExceededException
+
+
+class Deadline:
+    """
+    Point in time by which a sequence of calls must complete.
+
+    Example:
+        deadline = Deadline(2.0)
+        api.auth(deadline=deadline)
+        api.post('/is-handled-address', params, deadline=deadline)
+    """
+
+    def __init__(self, budget: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Create a new deadline.
+
+        Args:
+            budget: Time budget in seconds, starting now
+            clock: Monotonic clock function
+        """
+        self._clock = clock
+        self._expires_at = clock() + budget
+
+    def remaining(self) -> float:
+        """
+        Get the time left.
+
+        Returns:
+            Seconds left before the deadline (0 once expired)
+        """
+        return max(0.0, self._expires_at - self._clock())
+
+    def expired(self) -> bool:
+        """
+        Check whether the deadline has passed.
+
+        Returns:
+            True if no time is left
+        """
+        return self._clock() >= self._expires_at
+
+    def limit(self, budget: float) -> 'Deadline':
+        """
+        Derive a deadline for one step of a sequence.
+
+        The derived deadline expires after `budget` seconds or with this
+        deadline, whichever comes first.
+
+        Args:
+            budget: Maximum time in seconds for the step
+
+        Returns:
+            New deadline
+        """
+        return Deadline(min(budget, self.remaining()), self._clock)
+
+    def cap(self, timeout: Tuple[float, float], operation: Optional[str] = None) -> Tuple[float, float]:
+        """
+        Cap connect and read timeouts by the time left.
+
+        Args:
+            timeout: Tuple of connect and read timeouts in seconds
+            operation: Description used in the error message
+
+        Returns:
+            Capped tuple of connect and read timeouts
+
+        Raises:
+            DeadlineExceededException: If the deadline has already passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededException(
+                f'Deadline exceeded before {operation}' if operation else 'Deadline exceeded'
+            )
+        return min(timeout[0], remaining), min(timeout[1], remaining)
@@ -0,0 +1,315 @@
+"""
+Everest API Debug Logging
+
+Structured, sampled debug logging for API requests and responses.
+Records are built cheaply on the calling thread and handed to a
+background queue listener, which performs redaction, truncation and
+JSON serialization off the request path.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import logging.handlers
+import queue
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+
+LOGGER_NAME = 'everest_api'
+
+# Dedicated child logger of the shared debug logger, so enabling debug=True
+# leaves the level and propagation of the package logger alone
+DEFAULT_LOGGER_NAME = f'{LOGGER_NAME}.debug'
+
+DEFAULT_REDACTED_KEYS = frozenset({
+    'client_secret',
+    'authorization',
+    'token',
+    'password',
+})
+
+REDACTED = '[REDACTED]'
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Format Everest debug records as single-line JSON documents.
+
+    Redaction of secrets and truncation of large bodies happen here, so
+    when the formatter runs behind a queue listener the calling thread
+    never pays for them.
+    """
+
+    def __init__(
+        self,
+        max_body_length: int = 2048,
+        redacted_keys: Iterable[str] = DEFAULT_REDACTED_KEYS
+    ):
+        """
+        Create a new structured formatter.
+
+        Args:
+            max_body_length: Maximum number of body characters to keep
+            redacted_keys: Header and body field names whose values are masked
+        """
+        super().__init__()
+        self._max_body_length = max_body_length
+        self._redacted_keys = frozenset(key.lower() for key in redacted_keys)
+        self._body_pattern = re.compile(
+            r'("(?:' + '|'.join(re.escape(key) for key in sorted(self._redacted_keys)) + r')"\s*:\s*)'
+            r'"(?:[^"\\]|\\.)*"',
+            re.IGNORECASE
+        )
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON line for Everest debug records, default formatting otherwise
+        """
+        payload = getattr(record, 'everest', None)
+        if not isinstance(payload, dict):
+            return super().format(record)
+
+        entry: Dict[str, Any] = {
+            'time': self.formatTime(record),
+            'logger': record.name,
+            'event': record.getMessage(),
+        }
+
+        for key, value in payload.items():
+            if key == 'headers' and value is not None:
+                entry[key] = self._redact_headers(value)
+            elif key == 'body' and value is not None:
+                entry[key] = self._redact_body(value)
+            else:
+                entry[key] = value
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+    def _redact_headers(self, headers: Mapping[str, str]) -> Dict[str, str]:
+        """
+        Copy headers, masking sensitive values.
+
+        Args:
+            headers: Request or response headers
+
+        Returns:
+            Redacted copy of the headers
+        """
+        return {
+            key: REDACTED if key.lower() in self._redacted_keys else value
+            for key, value in headers.items()
+        }
+
+    def _redact_body(self, body: Any) -> str:
+        """
+        Mask sensitive fields in a body and truncate it.
+
+        Args:
+            body: Raw body (bytes, string or any JSON-serializable value)
+
+        Returns:
+            Redacted and truncated body text
+        """
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            body = bytes(body).decode('utf-8', errors='replace')
+        elif not isinstance(body, str):
+            body = json.dumps(body, ensure_ascii=False, default=str)
+
+        if self._redacted_keys:
+            body = self._body_pattern.sub(r'\1"' + REDACTED + '"', body)
+
+        if len(body) > self._max_body_length:
+            omitted = len(body) - self._max_body_length
+            body = f'{body[:self._max_body_length]}... [{omitted} chars truncated]'
+
+        return body
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class DebugLogger:
+    """
+    Sampled structured debug logger for API traffic.
+
+    Emits one record per sampled request and response through a standard
+    `logging.Logger`. Only references to already-built values are handed
+    over; use `start_background()` (done automatically for `debug=True`)
+    so that formatting happens on a background thread.
+    """
+
+    _default: Optional['DebugLogger'] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, logger: Optional[logging.Logger] = None, sample_rate: int = 1):
+        """
+        Create a new debug logger.
+
+        Args:
+            logger: Logger to emit records to (defaults to the `everest_api` logger)
+            sample_rate: Log one request out of every `sample_rate` requests
+        """
+        if sample_rate < 1:
+            raise ValueError('sample_rate must be at least 1')
+
+        self._logger = logger or logging.getLogger(LOGGER_NAME)
+        self._sample_rate = sample_rate
+        self._counter = itertools.count()
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._queue_handler: Optional[logging.Handler] = None
+
+    @classmethod
+    def default(cls) -> 'DebugLogger':
+        """
+        Get the shared debug logger used by clients created with `debug=True`.
+
+        The shared logger writes JSON lines to stderr from a background
+        thread. It emits to the `everest_api.debug` logger, which does not
+        propagate, so the records are not written twice by application
+        handlers; set its `propagate` attribute to True to receive them too.
+
+        Returns:
+            Shared debug logger instance
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                debug_logger = cls(logging.getLogger(DEFAULT_LOGGER_NAME))
+                debug_logger._logger.setLevel(logging.DEBUG)
+                debug_logger._logger.propagate = False
+                debug_logger.start_background()
+                cls._default = debug_logger
+            return cls._default
+
+    def get_logger(self) -> logging.Logger:
+        """
+        Get the underlying logger.
+
+        Returns:
+            Logger receiving the debug records
+        """
+        return self._logger
+
+    def start_background(
+        self,
+        handlers: Optional[List[logging.Handler]] = None,
+        max_body_length: int = 2048,
+        redacted_keys: Iterable[str] = DEFAULT_REDACTED_KEYS
+    ) -> 'DebugLogger':
+        """
+        Route records through a queue to handlers running on a background thread.
+
+        Args:
+            handlers: Target handlers (defaults to a stderr stream handler)
+            max_body_length: Maximum body length kept by the default formatter
+            redacted_keys: Field names masked by the default formatter
+
+        Returns:
+            Self for method chaining
+        """
+        if self._listener is not None:
+            return self
+
+        if handlers is None:
+            handlers = [logging.StreamHandler()]
+
+        for handler in handlers:
+            if handler.formatter is None:
+                handler.setFormatter(StructuredFormatter(max_body_length, redacted_keys))
+
+        record_queue = queue.SimpleQueue()  # type: queue.SimpleQueue
+        self._queue_handler = _DeferredQueueHandler(record_queue)
+        self._listener = logging.handlers.QueueListener(
+            record_queue, *handlers, respect_handler_level=True
+        )
+        self._logger.addHandler(self._queue_handler)
+        self._listener.start()
+        atexit.register(self.close)
+
+        return self
+
+    def close(self) -> None:
+        """Flush pending records and stop the background listener."""
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        if self._queue_handler is not None:
+            self._logger.removeHandler(self._queue_handler)
+        self._listener = None
+        self._queue_handler = None
+
+    def sample(self) -> bool:
+        """
+        Decide whether the next request should be logged.
+
+        Returns:
+            True for one request out of every `sample_rate`
+        """
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return False
+        return next(self._counter) % self._sample_rate == 0
+
+    def log_request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes
+    ) -> None:
+        """
+        Log an outgoing request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+            body: Encoded request body (decoded on the listener thread)
+        """
+        self._logger.debug('request', extra={'everest': {
+            'method': method,
+            'url': url,
+            'headers': headers,
+            'body': body,
+        }})
+
+    def log_response(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        body: Optional[bytes],
+        elapsed: float
+    ) -> None:
+        """
+        Log a received response.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            status_code: HTTP status code
+            headers: Response headers
+            body: Raw response body, or None for streamed responses
+            elapsed: Request duration in seconds
+        """
+        self._logger.debug('response', extra={'everest': {
+            'method': method,
+            'url': url,
+            'status_code': status_code,
+            'elapsed_ms': round(elapsed * 1000, 3),
+            'headers': headers,
+            'body': body,
+        }})
@@ -5,6 +5,8 @@ Exception thrown when API requests fail due to connection errors,
 HTTP failures, or other technical issues (not API-level errors).
 """
 
+from typing import Tuple, Type
+
 
 class EverestApiException(Exception):
     """
@@ -15,3 +17,39 @@ class EverestApiException(Exception):
     It does not cover API-level errors returned in successful responses.
     """
     pass
+
+
+class CircuitOpenException(EverestApiException):
+    """
+    Exception raised when a request is rejected by an open circuit breaker.
+
+    The request was not sent; the endpoint has recently been failing or
+    too slow and is given time to recover.
+    """
+
+    def __init__(self, message: str, endpoint: str, retry_after: float):
+        """
+        Create a new circuit open exception.
+
+        Args:
+            message: Error message
+            endpoint: Endpoint whose breaker is open
+            retry_after: Seconds until the breaker allows trial calls
+        """
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+    def __reduce__(self) -> Tuple[Type['CircuitOpenException'], Tuple[str, str, float]]:
+        # Rebuilt with every constructor argument, e.g. when raised in an export worker
+        return type(self), (self.args[0], self.endpoint, self.retry_after)
+
+
+class DeadlineExceededException(EverestApiException):
+    """
+    Exception raised when a call's deadline passes.
+
+    Raised before sending when no time is left, or when a request
+    times out after the deadline has expired.
+    """
+    pass
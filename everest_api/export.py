@@ -0,0 +1,307 @@
+"""
+Everest API Mission Export
+
+Full-account exports spread over worker processes. The `limit_start` /
+`limit_end` range of `/missions` is cut into shards; each worker process
+fetches and decodes its shards with its own pooled client, reusing the
+parent's token, and hands back each shard as one NDJSON byte string
+rather than pickled dictionaries. JSON decoding, the CPU-bound part of
+large exports, then scales with the number of cores.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterator, NamedTuple, Optional, Tuple
+
+from .exceptions import EverestApiException
+
+
+# Compact separators; non-ASCII text is kept as UTF-8 rather than escaped
+_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+# Client of the current worker process, created by _init_worker
+_worker_api: Any = None
+_worker_transform: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = None
+
+
+class ExportBatch(NamedTuple):
+    """
+    Missions of one shard, encoded as NDJSON (one mission per line).
+
+    `end` is the limit_end actually reached: it is lower than requested
+    when the account has fewer missions.
+    """
+
+    start: int
+    end: int
+    mission_count: int
+    data: bytes
+
+    def missions(self) -> Iterator[Dict[str, Any]]:
+        """
+        Decode the missions of the batch.
+
+        Yields:
+            Missions, in order
+        """
+        for line in self.data.splitlines():
+            yield json.loads(line)
+
+
+def _client_settings(api: Any, processes: int) -> Dict[str, Any]:
+    """
+    Collect what a worker needs to build a client equivalent to `api`.
+
+    Objects holding locks or connections cannot cross processes, so the
+    rate limiter and circuit breakers are rebuilt in each worker from
+    their settings: every worker gets an equal share of the rate, and
+    breakers of different workers open independently.
+
+    Raises:
+        EverestApiException: If the client uses a transport other than the default one
+    """
+    from .transport import RequestsTransport
+
+    transport = api.get_transport()
+    if type(transport) is not RequestsTransport:
+        raise EverestApiException(
+            f'Cannot export with {type(transport).__name__}: worker processes use their own '
+            f'RequestsTransport'
+        )
+
+    rate_limit = None
+    if api._rate_limiter is not None:
+        limiter = api._rate_limiter.snapshot()
+        rate_limit = (limiter['rate'] / processes, max(1, limiter['burst'] // processes))
+
+    circuit_breakers = None
+    if api._circuit_breakers is not None:
+        circuit_breakers = (
+            dict(api._circuit_breakers._settings), dict(api._circuit_breakers._endpoint_settings)
+        )
+
+    return {
+        'base_url': api._base_url,
+        'client_id': api._client_id,
+        'client_secret': api._client_secret,
+        'token': api.get_token(),
+        'verify_ssl': api._verify_ssl,
+        'timeout': api.get_timeout(),
+        'endpoint_timeouts': dict(api._endpoint_timeouts),
+        'compression': (
+            api._compression_threshold, api._compression_encoding, api._compression_level,
+            api._accept_encoding != 'identity'
+        ),
+        'rate_limit': rate_limit,
+        'circuit_breakers': circuit_breakers,
+    }
+
+
+def _init_worker(
+    settings: Dict[str, Any],
+    transform: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]]
+) -> None:
+    """Create the pooled client of a worker process."""
+    global _worker_api, _worker_transform
+    from .circuit_breaker import CircuitBreakerRegistry
+    from .client import EverestApi
+    from .rate_limit import RateLimiter
+
+    connect, read = settings['timeout']
+    api = EverestApi(
+        settings['base_url'],
+        settings['client_id'],
+        settings['client_secret'],
+        connect_timeout=connect,
+        read_timeout=read
+    )
+    api.set_verify_ssl(settings['verify_ssl']).set_token(settings['token'])
+    for endpoint, (connect, read) in settings['endpoint_timeouts'].items():
+        api.set_timeout(connect, read, endpoint)
+    api.set_compression(*settings['compression'])
+
+    if settings['rate_limit'] is not None:
+        api.set_rate_limiter(RateLimiter(*settings['rate_limit']))
+    if settings['circuit_breakers'] is not None:
+        defaults, endpoint_settings = settings['circuit_breakers']
+        breakers = CircuitBreakerRegistry(**defaults)
+        for endpoint, endpoint_defaults in endpoint_settings.items():
+            breakers.configure(endpoint, **endpoint_defaults)
+        api.set_circuit_breakers(breakers)
+
+    _worker_api = api
+    _worker_transform = transform
+
+
+def _export_shard(start: int, end: int, page_size: int) -> Tuple[ExportBatch, bool]:
+    """
+    Fetch the missions of [start, end) page by page (runs in a worker).
+
+    Returns:
+        Batch and whether the end of the account was reached
+    """
+    encode = _ENCODER.encode
+    transform = _worker_transform
+    lines = []
+    position = start
+    exhausted = False
+
+    while position < end:
+        limit_end = min(position + page_size, end)
+        requested = limit_end - position
+        fetched = 0
+        for mission in _worker_api.stream_missions({'limit_start': position, 'limit_end': limit_end}):
+            fetched += 1
+            if transform is not None:
+                mission = transform(mission)
+                if mission is None:
+                    continue
+            lines.append(encode(mission))
+
+        position += fetched
+        if fetched < requested:
+            exhausted = True
+            break
+
+    data = ('\n'.join(lines) + '\n').encode('utf-8') if lines else b''
+    return ExportBatch(start, position, len(lines), data), exhausted
+
+
+class MissionExporter:
+    """
+    Multi-process export of every mission of an account.
+
+    Shards of `shard_size` missions are fetched by `processes` worker
+    processes, each with its own connection pool and the token of the
+    given client (which authenticates first if it has none). Batches are
+    yielded in mission order. Without an `end`, shards are handed out
+    until one comes back short.
+
+    Workers reuse the client's timeouts and compression settings. A rate
+    limiter is split evenly between the workers, and circuit breakers are
+    recreated in each worker with the same settings (their state is not
+    shared). The scheduler, response cache and debug logger of the client
+    are not used, and only the default transport is supported.
+
+    `transform` runs in the workers on each mission (return None to skip
+    it); it must be picklable, e.g. a module-level function.
+
+    Example:
+        exporter = MissionExporter(api, processes=8)
+        with open('missions.ndjson', 'wb') as f:
+            exporter.export(f)
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        processes: Optional[int] = None,
+        shard_size: int = 5000,
+        page_size: int = 500,
+        transform: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = None,
+        mp_context: Any = None
+    ):
+        """
+        Create a new exporter.
+
+        Args:
+            api: EverestApi client whose settings and token the workers reuse
+            processes: Number of worker processes (defaults to the number of CPUs)
+            shard_size: Missions per shard handed to a worker
+            page_size: Missions per /missions request within a shard
+            transform: Function applied to each mission in the workers
+            mp_context: multiprocessing context (e.g. multiprocessing.get_context('spawn'))
+        """
+        self._api = api
+        self._processes = max(1, processes or os.cpu_count() or 1)
+        self._shard_size = max(1, shard_size)
+        self._page_size = max(1, min(page_size, self._shard_size))
+        self._transform = transform
+        self._mp_context = mp_context
+
+    def batches(self, start: int = 0, end: Optional[int] = None) -> Iterator[ExportBatch]:
+        """
+        Export missions as NDJSON batches.
+
+        Args:
+            start: First mission index
+            end: Mission index to stop at, or None for the whole account
+
+        Yields:
+            Non-empty batches, in mission order
+
+        Raises:
+            EverestApiException: If authentication or a shard request fails, or
+                the client uses a custom transport
+        """
+        if self._api.get_token() is None:
+            response = self._api.auth()
+            if self._api.get_token() is None:
+                raise EverestApiException(
+                    f'Authentication failed: {response.get_error_message() or response.get_status_code()}'
+                )
+
+        settings = _client_settings(self._api, self._processes)
+        executor = ProcessPoolExecutor(
+            self._processes, self._mp_context, _init_worker, (settings, self._transform)
+        )
+        pending: Deque['Future[Tuple[ExportBatch, bool]]'] = deque()
+        next_start = start
+        try:
+            while True:
+                # Keep every worker busy with one shard ahead
+                while len(pending) < self._processes * 2 and (end is None or next_start < end):
+                    shard_end = next_start + self._shard_size
+                    if end is not None:
+                        shard_end = min(shard_end, end)
+                    pending.append(executor.submit(_export_shard, next_start, shard_end, self._page_size))
+                    next_start = shard_end
+
+                if not pending:
+                    return
+                batch, exhausted = pending.popleft().result()
+                if batch.mission_count:
+                    yield batch
+                if exhausted:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
+
+    def missions(self, start: int = 0, end: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Export missions, decoded in this process.
+
+        Prefer `batches()` or `export()` for very large accounts: decoding
+        here is bound by this process's single core.
+
+        Args:
+            start: First mission index
+            end: Mission index to stop at, or None for the whole account
+
+        Yields:
+            Missions, in order
+        """
+        for batch in self.batches(start, end):
+            yield from batch.missions()
+
+    def export(self, file: BinaryIO, start: int = 0, end: Optional[int] = None) -> int:
+        """
+        Write missions to a binary file as NDJSON without decoding them here.
+
+        Args:
+            file: File opened in binary mode
+            start: First mission index
+            end: Mission index to stop at, or None for the whole account
+
+        Returns:
+            Number of missions written
+        """
+        count = 0
+        for batch in self.batches(start, end):
+            file.write(batch.data)
+            count += batch.mission_count
+        return count
@@ -0,0 +1,118 @@
+"""
+Everest API Instrumentation
+
+Thread-safe metrics collected by an EverestApi client: per-endpoint
+request counts and latencies, named counters, and state published by
+other components (e.g. circuit breakers).
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class Instrumentation:
+    """
+    Collects metrics for an EverestApi client.
+
+    Components publish live state with `register()`; it is read only when
+    `snapshot()` is called, so publishing costs nothing per request.
+    """
+
+    def __init__(self):
+        """Create an empty metrics collector."""
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, float]] = {}
+        self._counters: Dict[str, float] = {}
+        self._sources: Dict[str, Callable[[], Any]] = {}
+
+    def record_request(self, endpoint: str, status_code: Optional[int], elapsed: float) -> None:
+        """
+        Record a completed (or failed) request.
+
+        Args:
+            endpoint: API endpoint path
+            status_code: HTTP status code, or None if no response was received
+            elapsed: Request duration in seconds
+        """
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = {
+                    'requests': 0, 'errors': 0, 'total_time': 0.0, 'max_time': 0.0,
+                }
+            stats['requests'] += 1
+            if status_code is None or status_code >= 500:
+                stats['errors'] += 1
+            stats['total_time'] += elapsed
+            if elapsed > stats['max_time']:
+                stats['max_time'] = elapsed
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Increment a named counter.
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get_counter(self, name: str) -> float:
+        """
+        Get the value of a named counter.
+
+        Args:
+            name: Counter name
+
+        Returns:
+            Counter value (0 if never incremented)
+        """
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def register(self, name: str, source: Optional[Callable[[], Any]]) -> None:
+        """
+        Publish state from another component.
+
+        Args:
+            name: Key under which the state appears in snapshots
+            source: Callable returning the current state, or None to unregister
+        """
+        with self._lock:
+            if source is None:
+                self._sources.pop(name, None)
+            else:
+                self._sources[name] = source
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a point-in-time copy of all metrics.
+
+        Returns:
+            Dictionary with `endpoints`, `counters` and registered state
+        """
+        with self._lock:
+            endpoints = {
+                endpoint: {
+                    'requests': int(stats['requests']),
+                    'errors': int(stats['errors']),
+                    'avg_ms': round(stats['total_time'] / stats['requests'] * 1000, 3),
+                    'max_ms': round(stats['max_time'] * 1000, 3),
+                }
+                for endpoint, stats in self._endpoints.items()
+            }
+            counters = dict(self._counters)
+            sources = dict(self._sources)
+
+        result: Dict[str, Any] = {'endpoints': endpoints, 'counters': counters}
+        for name, source in sources.items():
+            result[name] = source()
+
+        return result
+
+    def reset(self) -> None:
+        """Clear request statistics and counters (registered state is kept)."""
+        with self._lock:
+            self._endpoints.clear()
+            self._counters.clear()
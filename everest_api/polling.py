@@ -0,0 +1,354 @@
+"""
+Everest API Mission Polling
+
+Change detection for integrations without webhooks. The poller tracks
+a set of mission refs and gives each its own poll interval based on the
+mission status and how close its start date is. Only due refs are
+fetched, concurrently, and events are emitted only when a mission
+actually changed. Missions reaching a terminal status are dropped.
+"""
+
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .exceptions import EverestApiException
+
+
+TERMINAL_STATUSES = frozenset({'completed', 'canceled', 'cancelled', 'failed'})
+
+# Seconds between polls per mission status
+DEFAULT_INTERVALS = {
+    'pending': 300.0,
+    'accepted': 120.0,
+    'started': 30.0,
+}
+
+
+class MissionChange(NamedTuple):
+    """
+    A detected mission change.
+
+    `mission` is None when the mission no longer exists; it is then no
+    longer tracked.
+    """
+
+    ref: str
+    mission: Optional[Dict[str, Any]]
+    previous: Optional[Dict[str, Any]]
+    changes: Dict[str, Tuple[Any, Any]]
+
+
+def diff_missions(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Compare two snapshots of a mission field by field.
+
+    Args:
+        previous: Earlier snapshot
+        current: Later snapshot
+
+    Returns:
+        (old, new) values of every field that differs
+    """
+    return {
+        field: (previous.get(field), current.get(field))
+        for field in previous.keys() | current.keys()
+        if previous.get(field) != current.get(field)
+    }
+
+
+class MissionPoller:
+    """
+    Adaptive poller of mission statuses.
+
+    Each ref is polled every `intervals[status]` seconds (or
+    `default_interval` for other statuses). Missions starting within
+    `imminent_window` seconds are polled at least every
+    `imminent_interval` seconds. The first fetch of a ref tracked without
+    a snapshot only records a baseline.
+
+    Example:
+        poller = MissionPoller(api)
+        poller.track_many(open_refs)
+        poller.run(lambda change: print(change.ref, change.changes))
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        intervals: Optional[Dict[str, float]] = None,
+        default_interval: float = 120.0,
+        imminent_window: float = 900.0,
+        imminent_interval: float = 15.0,
+        terminal_statuses: Iterable[str] = TERMINAL_STATUSES,
+        batch_size: int = 50,
+        max_workers: int = 8,
+        priority: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time
+    ):
+        """
+        Create a new poller.
+
+        Args:
+            api: Authenticated EverestApi client (or priority view)
+            intervals: Poll interval in seconds per mission status
+            default_interval: Poll interval for statuses without their own
+            imminent_window: Seconds before start_date during which polling speeds up
+            imminent_interval: Maximum poll interval of missions about to start
+            terminal_statuses: Statuses after which a mission is dropped
+            batch_size: Maximum number of refs fetched per poll
+            max_workers: Maximum number of concurrent fetches
+            priority: Scheduling lane of the fetches
+            clock: Monotonic clock used for scheduling
+            wall_clock: Clock returning Unix time, compared with start_date
+        """
+        self._api = api
+        self._intervals = dict(DEFAULT_INTERVALS if intervals is None else intervals)
+        self._default_interval = default_interval
+        self._imminent_window = imminent_window
+        self._imminent_interval = imminent_interval
+        self._terminal_statuses = frozenset(terminal_statuses)
+        self._batch_size = max(1, batch_size)
+        self._max_workers = max(1, max_workers)
+        self._priority = priority
+        self._clock = clock
+        self._wall_clock = wall_clock
+
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._due: Dict[str, float] = {}
+        # (due time, ref); entries whose time no longer matches _due are stale
+        self._heap: List[Tuple[float, str]] = []
+        self.fetch_count = 0
+        self.error_count = 0
+
+    def track(self, ref: str, mission: Optional[Dict[str, Any]] = None) -> 'MissionPoller':
+        """
+        Start tracking a mission.
+
+        Args:
+            ref: Mission reference
+            mission: Known mission data; it is scheduled from its status and
+                compared with the first fetch. Without it the ref is due now.
+
+        Returns:
+            Self for method chaining
+        """
+        with self._lock:
+            self._snapshots[ref] = mission
+            due = self._clock() + (self.interval_for(mission) if mission else 0.0)
+            self._schedule(ref, due)
+        return self
+
+    def track_many(self, refs: Iterable[str]) -> 'MissionPoller':
+        """
+        Start tracking several missions, due now.
+
+        Args:
+            refs: Mission references
+
+        Returns:
+            Self for method chaining
+        """
+        for ref in refs:
+            self.track(ref)
+        return self
+
+    def untrack(self, ref: str) -> None:
+        """
+        Stop tracking a mission.
+
+        Args:
+            ref: Mission reference
+        """
+        with self._lock:
+            self._snapshots.pop(ref, None)
+            self._due.pop(ref, None)
+
+    def tracked(self) -> List[str]:
+        """
+        Get the tracked refs.
+
+        Returns:
+            Mission references
+        """
+        with self._lock:
+            return list(self._snapshots)
+
+    def snapshot(self, ref: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the last known data of a tracked mission.
+
+        Args:
+            ref: Mission reference
+
+        Returns:
+            Mission data, or None if not fetched yet or not tracked
+        """
+        with self._lock:
+            return self._snapshots.get(ref)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __contains__(self, ref: object) -> bool:
+        return ref in self._snapshots
+
+    def interval_for(self, mission: Optional[Dict[str, Any]]) -> float:
+        """
+        Compute the poll interval of a mission.
+
+        Args:
+            mission: Mission data
+
+        Returns:
+            Seconds until the next poll
+        """
+        if not mission:
+            return self._default_interval
+
+        status = mission.get('status')
+        interval = self._default_interval
+        if isinstance(status, str):
+            interval = self._intervals.get(status, interval)
+        start_date = mission.get('start_date')
+        if isinstance(start_date, (int, float)):
+            until_start = start_date - self._wall_clock()
+            if until_start <= self._imminent_window:
+                interval = min(interval, self._imminent_interval)
+        return interval
+
+    def next_due(self) -> Optional[float]:
+        """
+        Get the time until the next ref is due.
+
+        Returns:
+            Seconds (0 if refs are already due), or None when nothing is tracked
+        """
+        with self._lock:
+            self._discard_stale()
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self._clock())
+
+    def poll(self) -> List[MissionChange]:
+        """
+        Fetch the refs that are due and detect changes.
+
+        At most `batch_size` refs are fetched, concurrently. Refs whose
+        fetch fails are retried after their current interval.
+
+        Returns:
+            Changes detected, in ref due order
+        """
+        now = self._clock()
+        due_refs: List[str] = []
+        with self._lock:
+            while self._heap and len(due_refs) < self._batch_size:
+                self._discard_stale()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                _, ref = heapq.heappop(self._heap)
+                del self._due[ref]
+                due_refs.append(ref)
+            self.fetch_count += len(due_refs)
+
+        if not due_refs:
+            return []
+
+        workers = min(self._max_workers, len(due_refs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._fetch, due_refs))
+
+        changes = []
+        with self._lock:
+            for ref, (found, mission) in zip(due_refs, results):
+                if ref not in self._snapshots:
+                    continue  # untracked while fetching
+                previous = self._snapshots[ref]
+
+                if not found:
+                    self._snapshots.pop(ref)
+                    changes.append(MissionChange(ref, None, previous, {}))
+                    continue
+
+                if mission is None:
+                    self.error_count += 1
+                    self._schedule(ref, self._clock() + self.interval_for(previous))
+                    continue
+
+                if previous is not None:
+                    fields = diff_missions(previous, mission)
+                    if fields:
+                        changes.append(MissionChange(ref, mission, previous, fields))
+
+                if mission.get('status') in self._terminal_statuses:
+                    self._snapshots.pop(ref)
+                else:
+                    self._snapshots[ref] = mission
+                    self._schedule(ref, self._clock() + self.interval_for(mission))
+
+        return changes
+
+    def run(
+        self,
+        on_change: Callable[[MissionChange], None],
+        stop: Optional[threading.Event] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        """
+        Poll until every mission is dropped or `stop` is set.
+
+        Args:
+            on_change: Callback receiving each change
+            stop: Event ending the loop when set
+            sleep: Function used to wait between polls when `stop` is not given
+        """
+        while stop is None or not stop.is_set():
+            for change in self.poll():
+                on_change(change)
+
+            wait = self.next_due()
+            if wait is None:
+                return
+            if wait > 0:
+                if stop is not None:
+                    stop.wait(wait)
+                else:
+                    sleep(wait)
+
+    def _fetch(self, ref: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Fetch one mission.
+
+        Returns:
+            (False, None) if the mission does not exist, (True, None) on
+            errors, otherwise (True, mission)
+        """
+        try:
+            response = self._api.post('/missions/get', {'ref': ref}, None, self._priority)
+        except EverestApiException:
+            return True, None
+
+        if response.get_status_code() == 404:
+            return False, None
+
+        data = response.get_data()
+        mission = data.get('mission') if isinstance(data, dict) else None
+        if not response.is_success() or not isinstance(mission, dict):
+            return True, None
+        return True, mission
+
+    def _schedule(self, ref: str, due: float) -> None:
+        """Set the next poll time of a ref (called with the lock held)."""
+        self._due[ref] = due
+        heapq.heappush(self._heap, (due, ref))
+
+    def _discard_stale(self) -> None:
+        """Pop heap entries of untracked or rescheduled refs (called with the lock held)."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
@@ -0,0 +1,305 @@
+"""
+Everest API Quotes
+
+Bulk eligibility and price lookups. A quote matrix checks every
+combination of candidate addresses, services and start date slots with
+`/is-handled-address`, sending the distinct lookups concurrently and
+reusing cached answers, so a delivery options page costs one parallel
+round of requests instead of dozens of serial ones.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .deadline import Deadline
+from .exceptions import EverestApiException
+
+
+# (address, service_id, start_date)
+QuoteKey = Tuple[str, int, int]
+
+
+class Quote(NamedTuple):
+    """Eligibility and price of one (address, service, slot) combination."""
+
+    handled: bool
+    total_ttc: Optional[float] = None
+    total_ht: Optional[float] = None
+    error: Optional[str] = None
+
+
+class QuoteCache:
+    """
+    Thread-safe LRU cache of quotes with a time to live.
+
+    Failed lookups are never cached. A cache can be shared by several
+    quote matrices (and clients) to avoid re-quoting popular addresses.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Create a new cache.
+
+        Args:
+            ttl: Seconds a quote stays valid
+            max_entries: Maximum number of cached quotes
+            clock: Monotonic clock function
+        """
+        self._ttl = ttl
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: 'OrderedDict[QuoteKey, Tuple[float, Quote]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: QuoteKey) -> Optional[Quote]:
+        """
+        Get a cached quote.
+
+        Args:
+            key: (address, service_id, start_date)
+
+        Returns:
+            Quote, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: QuoteKey, quote: Quote) -> None:
+        """
+        Cache a quote.
+
+        Args:
+            key: (address, service_id, start_date)
+            quote: Quote to cache
+        """
+        if quote.error is not None:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, quote)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached quote."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QuoteMatrix:
+    """
+    Result table of a quote matrix, indexed by (address, service_id, start_date).
+
+    Example:
+        matrix = api.quote_matrix(addresses, [1, 2, 3], slots)
+        quote = matrix.get(address, 2, slots[0])
+        if quote and quote.handled:
+            print(quote.total_ttc)
+    """
+
+    def __init__(self, quotes: Dict[QuoteKey, Quote], lookups: int, cache_hits: int):
+        """
+        Create a result table.
+
+        Args:
+            quotes: Quote per combination
+            lookups: Number of requests sent
+            cache_hits: Number of combinations answered from the cache
+        """
+        self._quotes = quotes
+        self.lookups = lookups
+        self.cache_hits = cache_hits
+
+    def get(self, address: str, service_id: int, start_date: int) -> Optional[Quote]:
+        """
+        Get the quote of a combination.
+
+        Args:
+            address: Delivery address
+            service_id: Service ID
+            start_date: Slot start as a Unix timestamp
+
+        Returns:
+            Quote, or None if the combination was not requested
+        """
+        return self._quotes.get((address, service_id, start_date))
+
+    def __getitem__(self, key: QuoteKey) -> Quote:
+        return self._quotes[key]
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def __iter__(self) -> Iterator[QuoteKey]:
+        return iter(self._quotes)
+
+    def items(self) -> Iterable[Tuple[QuoteKey, Quote]]:
+        """
+        Iterate over combinations and their quotes.
+
+        Returns:
+            (key, quote) pairs in request order
+        """
+        return self._quotes.items()
+
+    def options(self, address: str, start_date: Optional[int] = None) -> List[Tuple[QuoteKey, Quote]]:
+        """
+        Get the handled combinations of an address, cheapest first.
+
+        Args:
+            address: Delivery address
+            start_date: Restrict to one slot, or None for every slot
+
+        Returns:
+            (key, quote) pairs sorted by total_ttc
+        """
+        options = [
+            (key, quote) for key, quote in self._quotes.items()
+            if key[0] == address and quote.handled
+            and (start_date is None or key[2] == start_date)
+        ]
+        options.sort(key=lambda item: (
+            item[1].total_ttc is None, item[1].total_ttc or 0.0, item[0][2], item[0][1]
+        ))
+        return options
+
+    def errors(self) -> Dict[QuoteKey, str]:
+        """
+        Get the combinations whose lookup failed.
+
+        Returns:
+            Error message per combination
+        """
+        return {key: quote.error for key, quote in self._quotes.items() if quote.error is not None}
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        Convert the table to a list of rows (e.g. for rendering or CSV export).
+
+        Returns:
+            One dictionary per combination
+        """
+        return [
+            {
+                'address': key[0],
+                'service_id': key[1],
+                'start_date': key[2],
+                'handled': quote.handled,
+                'total_ttc': quote.total_ttc,
+                'total_ht': quote.total_ht,
+                'error': quote.error,
+            }
+            for key, quote in self._quotes.items()
+        ]
+
+
+def _unique(values: Iterable[Any]) -> List[Any]:
+    """Remove duplicates, keeping the first occurrence order."""
+    return list(OrderedDict.fromkeys(values))
+
+
+def _lookup(api: Any, key: QuoteKey, deadline: Optional[Deadline], priority: Optional[str]) -> Quote:
+    """
+    Quote one combination with `/is-handled-address`.
+
+    Failures are returned as quotes carrying an error, so one failed
+    lookup does not fail the whole matrix.
+    """
+    address, service_id, start_date = key
+    try:
+        response = api.post('/is-handled-address', {
+            'address': address,
+            'service_id': service_id,
+            'start_date': start_date,
+        }, deadline, priority)
+    except EverestApiException as e:
+        return Quote(False, error=str(e))
+
+    # Error bodies may come with a 2xx status; they must not be cached as "not handled"
+    if not response.is_success() or response.has_error():
+        return Quote(False, error=response.get_error_message() or f'HTTP {response.get_status_code()}')
+
+    data = response.get_data()
+    if not isinstance(data, dict) or not data.get('success'):
+        return Quote(False)
+
+    price = data.get('price')
+    if not isinstance(price, dict):
+        price = {}
+    return Quote(True, price.get('total_ttc'), price.get('total_ht'))
+
+
+def quote_matrix(
+    api: Any,
+    addresses: Iterable[str],
+    services: Iterable[int],
+    slots: Iterable[int],
+    cache: Optional[QuoteCache] = None,
+    max_workers: int = 8,
+    deadline: Optional[Deadline] = None,
+    priority: Optional[str] = None
+) -> QuoteMatrix:
+    """
+    Quote every combination of addresses, services and slots.
+
+    Duplicate inputs are removed, cached quotes are reused, and the
+    remaining lookups are sent concurrently.
+
+    Args:
+        api: Authenticated EverestApi client (or priority view)
+        addresses: Delivery addresses
+        services: Service IDs
+        slots: Slot start dates as Unix timestamps
+        cache: Quote cache to read from and fill
+        max_workers: Maximum number of concurrent lookups
+        deadline: Time budget shared by all lookups
+        priority: Scheduling lane of the lookups
+
+    Returns:
+        Result table
+    """
+    keys = [
+        (address, service_id, start_date)
+        for address in _unique(addresses)
+        for service_id in _unique(services)
+        for start_date in _unique(slots)
+    ]
+
+    quotes: Dict[QuoteKey, Quote] = {}
+    missing = []
+    for key in keys:
+        cached = cache.get(key) if cache is not None else None
+        if cached is None:
+            missing.append(key)
+        else:
+            quotes[key] = cached
+    cache_hits = len(keys) - len(missing)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+            results = executor.map(lambda key: _lookup(api, key, deadline, priority), missing)
+            for key, quote in zip(missing, results):
+                quotes[key] = quote
+                if cache is not None:
+                    cache.put(key, quote)
+
+    # Keep the table in request order regardless of cache hits
+    return QuoteMatrix({key: quotes[key] for key in keys}, len(missing), cache_hits)
@@ -0,0 +1,120 @@
+"""
+Everest API Rate Limiting
+
+Token bucket rate limiter keeping request rates within the API quota.
+One limiter can be shared by several clients (e.g. all tenants of a
+TenantClientPool) so that together they stay under a single quota.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second; each request takes one. Waiting callers reserve their token up
+    front, so they are served in arrival order without polling.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Create a new rate limiter.
+
+        Args:
+            rate: Requests allowed per second
+            burst: Requests allowed at once after an idle period (defaults to one second of traffic)
+            clock: Monotonic clock function
+            sleep: Function used to wait for a token
+        """
+        if rate <= 0:
+            raise ValueError('Rate must be positive')
+        self._rate = rate
+        self._burst = max(1, burst if burst is not None else int(rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self._burst)
+        self._updated = clock()
+        self._acquired = 0
+        self._delayed = 0
+        self._rejected = 0
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available right now.
+
+        Returns:
+            True if the request may proceed
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._acquired += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Take a token, waiting for one if needed.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If no token becomes available within the timeout
+                (nothing is reserved in that case)
+        """
+        with self._lock:
+            self._refill()
+            wait = max(0.0, (1 - self._tokens) / self._rate)
+            if timeout is not None and wait > timeout:
+                self._rejected += 1
+                raise TimeoutError(f'No request token available within {timeout:.3f}s')
+            # Reserve the token now; the bucket goes negative while callers wait
+            self._tokens -= 1
+            self._acquired += 1
+            if wait:
+                self._delayed += 1
+
+        if wait:
+            self._sleep(wait)
+        return wait
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get limiter settings and counters.
+
+        Returns:
+            Dictionary with rate, burst, available tokens and request counts
+        """
+        with self._lock:
+            self._refill()
+            return {
+                'rate': self._rate,
+                'burst': self._burst,
+                'available': round(max(0.0, self._tokens), 3),
+                'acquired': self._acquired,
+                'delayed': self._delayed,
+                'rejected': self._rejected,
+            }
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update (called with the lock held)."""
+        now = self._clock()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
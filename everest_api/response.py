@@ -5,8 +5,9 @@ Wraps HTTP response data from API requests and provides
 convenient methods for accessing response data, headers, and status.
 """
 
+import hashlib
 import json
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Any, Mapping
 
 
 class EverestApiResponse:
@@ -15,37 +16,90 @@ class EverestApiResponse:
 
     Provides convenient methods for accessing response data, headers,
     status codes, and error information.
+
+    Headers are kept as given by the transport, without copying; the
+    case-insensitive lookup index used by `get_header()` and the parsed
+    JSON body are built on first use, so responses that are only checked
+    for their status or content hash are never parsed. Instances use
+    `__slots__` to keep retained responses small.
     """
 
-    def __init__(self, response_body: str, status_code: int, headers: Dict[str, str]):
+    __slots__ = (
+        '_raw_body', '_status_code', '_headers', '_header_index', '_data', '_parsed', '_content_hash'
+    )
+
+    def __init__(self, response_body: str, status_code: int, headers: Mapping[str, str]):
         """
         Create a new API response instance.
 
         Args:
             response_body: Raw HTTP response body as string
             status_code: HTTP status code (e.g., 200, 404, 500)
-            headers: Response headers as dictionary
+            headers: Response headers (any mapping, used without copying)
         """
         self._raw_body = response_body
         self._status_code = status_code
         self._headers = headers
-        self._data = None
-
-        # Try to parse JSON response
-        try:
-            self._data = json.loads(response_body) if response_body else None
-        except (json.JSONDecodeError, ValueError):
-            self._data = None
+        self._header_index: Optional[Mapping[str, str]] = None
+        self._data: Any = None
+        self._parsed = False
+        self._content_hash: Optional[str] = None
 
     def get_data(self) -> Optional[Any]:
         """
         Get parsed JSON response data.
 
+        The body is parsed on the first call.
+
         Returns:
             Decoded JSON data (dict, list, etc.) or None if decoding failed
         """
+        if not self._parsed:
+            try:
+                self._data = json.loads(self._raw_body) if self._raw_body else None
+            except ValueError:
+                self._data = None
+            self._parsed = True
         return self._data
 
+    def copy(self, headers: Optional[Mapping[str, str]] = None) -> 'EverestApiResponse':
+        """
+        Create a response with the same body, status and headers.
+
+        The copy parses the body again on first use, so changes made to
+        the data of one response never show in the other.
+
+        Args:
+            headers: Headers to use instead of this response's headers
+
+        Returns:
+            New response sharing the body, headers and content hash
+        """
+        if headers is None:
+            response = EverestApiResponse(self._raw_body, self._status_code, self._headers)
+            response._header_index = self._header_index
+        else:
+            response = EverestApiResponse(self._raw_body, self._status_code, headers)
+        response._content_hash = self._content_hash
+        return response
+
+    def get_content_hash(self) -> str:
+        """
+        Get a digest of the response body.
+
+        Two responses with the same hash have the same body, so callers
+        can skip reprocessing a payload that did not change, even when the
+        API sends no ETag or Last-Modified header.
+
+        Returns:
+            Hex digest of the body
+        """
+        digest = self._content_hash
+        if digest is None:
+            digest = hashlib.blake2b(self._raw_body.encode('utf-8'), digest_size=16).hexdigest()
+            self._content_hash = digest
+        return digest
+
     def get_raw_body(self) -> str:
         """
         Get raw response body string.
@@ -64,12 +118,12 @@ class EverestApiResponse:
         """
         return self._status_code
 
-    def get_headers(self) -> Dict[str, str]:
+    def get_headers(self) -> Mapping[str, str]:
         """
         Get all response headers.
 
         Returns:
-            Dictionary of all response headers
+            Mapping of all response headers, as provided by the transport
         """
         return self._headers
 
@@ -83,11 +137,28 @@ class EverestApiResponse:
         Returns:
             Header value or None if not found
         """
-        name_lower = name.lower()
-        for key, value in self._headers.items():
-            if key.lower() == name_lower:
-                return value
-        return None
+        index = self._header_index
+        if index is None:
+            index = self._build_header_index()
+        return index.get(name.lower())
+
+    def _build_header_index(self) -> Mapping[str, str]:
+        """
+        Build the case-insensitive header index.
+
+        Header mappings that are already case-insensitive (such as the
+        ones returned by requests) are used directly.
+
+        Returns:
+            Mapping from lowercase header names to values
+        """
+        headers = self._headers
+        if hasattr(headers, 'lower_items'):
+            index = headers
+        else:
+            index = {key.lower(): value for key, value in headers.items()}
+        self._header_index = index
+        return index
 
     def is_success(self) -> bool:
         """
@@ -119,8 +190,9 @@ class EverestApiResponse:
         if self.is_error():
             return True
 
-        if isinstance(self._data, dict):
-            return 'error' in self._data
+        data = self.get_data()
+        if isinstance(data, dict):
+            return 'error' in data
 
         return False
 
@@ -134,20 +206,21 @@ class EverestApiResponse:
         Returns:
             Error message or None if no error found
         """
-        if not isinstance(self._data, dict):
+        data = self.get_data()
+        if not isinstance(data, dict):
             return None
 
         # Check for 'error' field
-        if 'error' in self._data:
-            error = self._data['error']
+        if 'error' in data:
+            error = data['error']
             if isinstance(error, str):
                 return error
             else:
                 return json.dumps(error)
 
         # Check for 'message' field
-        if 'message' in self._data:
-            return self._data['message']
+        if 'message' in data:
+            return data['message']
 
         return None
 
@@ -159,9 +232,9 @@ class EverestApiResponse:
             Dictionary containing data, status_code, and headers
         """
         return {
-            'data': self._data,
+            'data': self.get_data(),
             'status_code': self._status_code,
-            'headers': self._headers,
+            'headers': dict(self._headers),
         }
 
     def __repr__(self) -> str:
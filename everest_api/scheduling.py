@@ -0,0 +1,177 @@
+"""
+Everest API Request Scheduling
+
+Priority lanes for requests sharing a client. A weighted scheduler
+limits the number of requests in flight; when it is saturated, waiting
+requests are admitted lane by lane according to their weights, so
+latency-sensitive calls jump ahead of queued bulk work while bulk work
+still uses the leftover capacity.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+INTERACTIVE = 'interactive'
+BULK = 'bulk'
+
+DEFAULT_WEIGHTS = {INTERACTIVE: 8, BULK: 1}
+
+
+class _Ticket:
+    """A request waiting for admission."""
+
+    __slots__ = ('granted',)
+
+    def __init__(self):
+        self.granted = False
+
+
+class PriorityScheduler:
+    """
+    Admission control with weighted priority lanes.
+
+    At most `max_concurrent` requests run at once. Requests arriving
+    while all slots are taken wait in the lane of their priority; each
+    freed slot goes to the next lane picked by smooth weighted round
+    robin among lanes with waiting requests (FIFO within a lane). With
+    the default weights, interactive requests get 8 of every 9 slots
+    while both lanes are busy, and bulk requests get every slot while
+    no interactive request waits.
+
+    Every successful `acquire()` must be followed by `release()`.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 10,
+        weights: Optional[Dict[str, int]] = None,
+        default_priority: str = INTERACTIVE
+    ):
+        """
+        Create a new scheduler.
+
+        Args:
+            max_concurrent: Maximum number of requests in flight (e.g. the connection pool size)
+            weights: Share of slots per priority lane
+            default_priority: Lane used for requests without a priority
+        """
+        self._max_concurrent = max(1, max_concurrent)
+        self._weights = dict(weights or DEFAULT_WEIGHTS)
+        if default_priority not in self._weights:
+            raise ValueError(f'Unknown priority: {default_priority}')
+        self._default_priority = default_priority
+        self._condition = threading.Condition()
+        self._lanes: Dict[str, Deque[_Ticket]] = {name: deque() for name in self._weights}
+        self._credits: Dict[str, int] = {name: 0 for name in self._weights}
+        self._active = 0
+        self._admitted: Dict[str, int] = {name: 0 for name in self._weights}
+        self._waited: Dict[str, float] = {name: 0.0 for name in self._weights}
+
+    def get_default_priority(self) -> str:
+        """
+        Get the lane used for requests without a priority.
+
+        Returns:
+            Priority name
+        """
+        return self._default_priority
+
+    def acquire(self, priority: Optional[str] = None, timeout: Optional[float] = None) -> float:
+        """
+        Wait for a slot.
+
+        Args:
+            priority: Priority lane (defaults to the scheduler's default priority)
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ValueError: If the priority is unknown
+            TimeoutError: If no slot was granted within the timeout
+        """
+        priority = priority or self._default_priority
+        lane = self._lanes.get(priority)
+        if lane is None:
+            raise ValueError(f'Unknown priority: {priority}')
+
+        with self._condition:
+            if self._active < self._max_concurrent and not any(self._lanes.values()):
+                self._active += 1
+                self._admitted[priority] += 1
+                return 0.0
+
+            ticket = _Ticket()
+            lane.append(ticket)
+            started = time.monotonic()
+            end = None if timeout is None else started + timeout
+
+            while not ticket.granted:
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    lane.remove(ticket)
+                    raise TimeoutError(f'No request slot available within {timeout:.3f}s')
+                self._condition.wait(remaining)
+
+            waited = time.monotonic() - started
+            self._admitted[priority] += 1
+            self._waited[priority] += waited
+            return waited
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiting request."""
+        with self._condition:
+            self._active -= 1
+            self._dispatch()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get scheduler state.
+
+        Returns:
+            Dictionary with active and max_concurrent slots and per-lane
+            weight, queued, admitted and total wait time
+        """
+        with self._condition:
+            return {
+                'active': self._active,
+                'max_concurrent': self._max_concurrent,
+                'lanes': {
+                    name: {
+                        'weight': self._weights[name],
+                        'queued': len(lane),
+                        'admitted': self._admitted[name],
+                        'wait_time': round(self._waited[name], 6),
+                    }
+                    for name, lane in self._lanes.items()
+                },
+            }
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiting requests (called with the condition held)."""
+        granted = False
+        while self._active < self._max_concurrent:
+            waiting = [name for name, lane in self._lanes.items() if lane]
+            if not waiting:
+                for name in self._credits:
+                    self._credits[name] = 0
+                break
+
+            # Smooth weighted round robin (as in nginx upstream balancing)
+            total = 0
+            for name in waiting:
+                self._credits[name] += self._weights[name]
+                total += self._weights[name]
+            chosen = max(waiting, key=lambda name: self._credits[name])
+            self._credits[chosen] -= total
+
+            self._lanes[chosen].popleft().granted = True
+            self._active += 1
+            granted = True
+
+        if granted:
+            self._condition.notify_all()
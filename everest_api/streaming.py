@@ -0,0 +1,361 @@
+"""
+Everest API Streaming
+
+Incremental JSON parsing of large responses. The elements of one array
+inside the top-level object (e.g. `missions`) are decoded one at a time
+as the body arrives, so peak memory stays around a single element
+instead of the whole response.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, List, Optional
+
+
+_WHITESPACE = ' \t\r\n'
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[,\]}\s]')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*')
+_DECODER = json.JSONDecoder()
+
+# Parser states
+_OBJECT_START = 0
+_KEY_OR_END = 1
+_COLON = 2
+_VALUE = 3
+_AFTER_VALUE = 4
+_ELEMENT_OR_END = 5
+_AFTER_ELEMENT = 6
+_DONE = 7
+
+
+class JsonArrayStream:
+    """
+    Push parser yielding the elements of one array of a JSON object.
+
+    Feed the body in chunks of any size; each call returns the elements
+    completed by that chunk. Other top-level values are skipped without
+    being decoded, and parsing stops at the end of the target array.
+
+    Elements that are complete in the buffer are decoded directly by the
+    C JSON decoder; only elements split across chunks are scanned for
+    their end first.
+
+    Example:
+        parser = JsonArrayStream('missions')
+        for chunk in chunks:
+            for mission in parser.feed(chunk):
+                handle(mission)
+        parser.close()
+    """
+
+    def __init__(self, key: str):
+        """
+        Create a new parser.
+
+        Args:
+            key: Top-level key of the array to stream
+        """
+        self._key = key
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = _OBJECT_START
+        self._is_target = False
+        self._found = False
+        # Resumable value scanner
+        self._value_start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the body.
+
+        Args:
+            data: Next body chunk
+
+        Returns:
+            Array elements completed by this chunk
+
+        Raises:
+            ValueError: If the body is not valid JSON of the expected shape
+        """
+        if self._state == _DONE:
+            return []
+
+        self._buffer += self._decoder.decode(data)
+        elements: List[Any] = []
+
+        while self._state != _DONE and self._step(elements):
+            pass
+
+        self._compact()
+        return elements
+
+    def close(self) -> None:
+        """
+        Signal the end of the body.
+
+        Raises:
+            ValueError: If the body ended before the target array was complete
+        """
+        self._decoder.decode(b'', final=True)
+        if self._state != _DONE:
+            raise ValueError('Truncated JSON body')
+
+    def done(self) -> bool:
+        """
+        Check whether parsing is finished.
+
+        Returns:
+            True once the target array (or the top-level object) has ended
+        """
+        return self._state == _DONE
+
+    def found(self) -> bool:
+        """
+        Check whether the target array was present.
+
+        Returns:
+            True once the target key has been seen
+        """
+        return self._found
+
+    def _step(self, elements: List[Any]) -> bool:
+        """
+        Advance the state machine by one token.
+
+        Args:
+            elements: List receiving completed array elements
+
+        Returns:
+            False when more data is needed
+        """
+        if self._value_start is not None:
+            end = self._scan_value()
+            if end is None:
+                return False
+            self._finish_value(end, elements)
+            return True
+
+        pos = self._skip_whitespace()
+        if pos is None:
+            return False
+        char = self._buffer[pos]
+        state = self._state
+
+        if state == _OBJECT_START:
+            if char != '{':
+                raise ValueError('Expected a JSON object')
+            self._advance(pos, _KEY_OR_END)
+        elif state == _KEY_OR_END:
+            if char == '}':
+                self._advance(pos, _DONE)
+            elif char == '"':
+                self._begin_value(pos)
+            else:
+                raise ValueError('Expected an object key')
+        elif state == _COLON:
+            if char != ':':
+                raise ValueError('Expected ":" after object key')
+            self._advance(pos, _VALUE)
+        elif state == _VALUE:
+            if not self._is_target:
+                self._begin_value(pos)
+            elif char == '[':
+                self._advance(pos, _ELEMENT_OR_END)
+            else:
+                raise ValueError(f'Expected an array for "{self._key}"')
+        elif state == _AFTER_VALUE:
+            if char == ',':
+                self._advance(pos, _KEY_OR_END)
+            elif char == '}':
+                self._advance(pos, _DONE)
+            else:
+                raise ValueError('Expected "," or "}" in object')
+        elif state == _ELEMENT_OR_END:
+            if char == ']':
+                self._advance(pos, _DONE)
+            elif not self._decode_element(pos, elements):
+                self._begin_value(pos)
+        elif state == _AFTER_ELEMENT:
+            if char == ',':
+                self._advance(pos, _ELEMENT_OR_END)
+            elif char == ']':
+                self._advance(pos, _DONE)
+            else:
+                raise ValueError('Expected "," or "]" in array')
+
+        return True
+
+    def _advance(self, pos: int, state: int) -> None:
+        """Consume the single-byte token at `pos` and move to `state`."""
+        self._pos = pos + 1
+        self._state = state
+
+    def _decode_element(self, pos: int, elements: List[Any]) -> bool:
+        """
+        Try to decode an element that is already complete in the buffer.
+
+        Args:
+            pos: Start position of the element
+            elements: List receiving the decoded element
+
+        Returns:
+            False if the element may continue in the next chunk
+        """
+        try:
+            element, end = _DECODER.raw_decode(self._buffer, pos)
+        except ValueError:
+            return False
+
+        # A number may continue in the next chunk (the decoder stops at
+        # "-0." or "1e"), so it is only complete once followed by
+        # something other than number characters
+        if self._buffer[pos] not in '{["':
+            tail = _NUMBER_TAIL.match(self._buffer, end)
+            if tail is None or tail.end() >= len(self._buffer):
+                return False
+
+        elements.append(element)
+        self._pos = end
+        self._state = _AFTER_ELEMENT
+        return True
+
+    def _begin_value(self, pos: int) -> None:
+        """Start scanning a key, a skipped value or an array element at `pos`."""
+        self._value_start = pos
+        self._pos = pos
+        self._depth = 0
+        self._in_string = False
+
+    def _finish_value(self, end: int, elements: List[Any]) -> None:
+        """
+        Handle a fully scanned value according to the current state.
+
+        Args:
+            end: End position of the value
+            elements: List receiving completed array elements
+        """
+        start = self._value_start
+        assert start is not None
+        self._value_start = None
+        self._pos = end
+
+        if self._state == _KEY_OR_END:
+            self._is_target = json.loads(self._buffer[start:end]) == self._key
+            self._found = self._found or self._is_target
+            self._state = _COLON
+        elif self._state == _VALUE:
+            self._state = _AFTER_VALUE
+        else:
+            elements.append(json.loads(self._buffer[start:end]))
+            self._state = _AFTER_ELEMENT
+
+    def _skip_whitespace(self) -> Optional[int]:
+        """
+        Find the next non-whitespace character.
+
+        Returns:
+            Its position, or None if the buffer is exhausted
+        """
+        buffer = self._buffer
+        pos = self._pos
+        length = len(buffer)
+        while pos < length and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos if pos < length else None
+
+    def _scan_value(self) -> Optional[int]:
+        """
+        Continue scanning the value starting at `_value_start`.
+
+        Jumps between structural characters with regular expressions, so
+        long strings are skipped without a per-byte Python loop.
+
+        Returns:
+            End position of the value, or None if more data is needed
+        """
+        buffer = self._buffer
+        start = self._value_start
+        assert start is not None
+
+        if self._pos == start and not self._in_string and self._depth == 0:
+            first = buffer[start]
+            if first not in '{["':
+                match = _SCALAR_END.search(buffer, start)
+                if match is None:
+                    return None
+                return match.start()
+
+        pos = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    return None
+                if buffer[match.start()] == '\\':
+                    if match.end() >= len(buffer):
+                        self._pos = match.start()
+                        return None
+                    pos = match.end() + 1
+                    continue
+                pos = match.end()
+                self._in_string = False
+                if self._depth == 0:
+                    self._pos = pos
+                    return pos
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                self._pos = len(buffer)
+                return None
+            char = buffer[match.start()]
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in '[{':
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pos = pos
+                    return pos
+
+    def _compact(self) -> None:
+        """Drop consumed text from the front of the buffer."""
+        keep = self._pos if self._value_start is None else self._value_start
+        if keep:
+            self._buffer = self._buffer[keep:]
+            self._pos -= keep
+            if self._value_start is not None:
+                self._value_start = 0
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Decode the elements of a top-level array from a chunked JSON body.
+
+    Args:
+        chunks: Body chunks (e.g. read from the socket)
+        key: Top-level key of the array to stream
+
+    Yields:
+        Decoded array elements, in order
+
+    Raises:
+        ValueError: If the body is malformed or truncated
+    """
+    parser = JsonArrayStream(key)
+    for chunk in chunks:
+        for element in parser.feed(chunk):
+            yield element
+        if parser.done():
+            return
+    parser.close()
@@ -0,0 +1,283 @@
+"""
+Everest API Tenant Pool
+
+Clients for many sets of API credentials (e.g. one per shipper) sharing
+a single connection pool and rate limiter. Tenants authenticate lazily
+on their first request, and idle tenants are evicted once the pool is
+full, so thousands of tenants fit in one process.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .client import EverestApi
+from .deadline import Deadline
+from .exceptions import EverestApiException
+from .rate_limit import RateLimiter
+from .scheduling import PriorityScheduler
+from .response import EverestApiResponse
+from .transport import RequestsTransport, Transport, TransportResponse
+
+
+class _TenantClient(EverestApi):
+    """
+    EverestApi authenticating on first use and again when its token is rejected.
+    """
+
+    def __init__(self, tenant_id: str, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._tenant_id = tenant_id
+        self._auth_lock = threading.Lock()
+        self.auth_count = 0
+
+    def auth(self, deadline: Optional[Deadline] = None) -> EverestApiResponse:
+        self.auth_count += 1
+        return super().auth(deadline)
+
+    def close(self) -> None:
+        # The transport is shared with the other tenants and closed by the pool
+        pass
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        stream: bool = False,
+        priority: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> TransportResponse:
+        if endpoint.strip('/') == 'auth':
+            return super()._send(method, endpoint, params, deadline, stream, priority, headers)
+
+        token = self._ensure_token(deadline)
+        response = super()._send(method, endpoint, params, deadline, stream, priority, headers)
+        if response.status_code != 401:
+            return response
+
+        # The cached token expired or was revoked: authenticate once more and retry
+        response.close()
+        with self._auth_lock:
+            if self._token == token:
+                self._token = None
+        self._ensure_token(deadline)
+        return super()._send(method, endpoint, params, deadline, stream, priority, headers)
+
+    def _ensure_token(self, deadline: Optional[Deadline]) -> Optional[str]:
+        """
+        Authenticate unless a token is cached.
+
+        Returns:
+            Token in use
+
+        Raises:
+            EverestApiException: If authentication fails
+        """
+        if self._token is None:
+            with self._auth_lock:
+                if self._token is None:
+                    response = self.auth(deadline)
+                    if self._token is None:
+                        raise EverestApiException(
+                            f'Authentication failed for tenant {self._tenant_id}: '
+                            f'{response.get_error_message() or response.get_status_code()}'
+                        )
+        return self._token
+
+
+class TenantClientPool:
+    """
+    Pool of EverestApi clients, one per tenant.
+
+    All clients send through one transport (and so one connection pool),
+    one optional rate limiter and one optional priority scheduler. Each tenant keeps its own token and
+    metrics. At most `max_tenants` clients are kept; the least recently
+    used one is evicted (dropping its token) to make room, and is
+    re-created and re-authenticated on its next use.
+
+    Example:
+        pool = TenantClientPool(base_url, rate_limiter=RateLimiter(50))
+        pool.add_tenant('shipper-1', client_id, client_secret)
+        pool.client('shipper-1').post('/missions/get', {'ref': ref})
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        transport: Optional[Transport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        scheduler: Optional[PriorityScheduler] = None,
+        max_tenants: int = 1000,
+        credentials: Optional[Callable[[str], Optional[Tuple[str, str]]]] = None,
+        **client_options: Any
+    ):
+        """
+        Create a new tenant pool.
+
+        Args:
+            base_url: API base URL
+            transport: Transport shared by all tenants (defaults to a pooled requests session)
+            rate_limiter: Rate limiter shared by all tenants
+            scheduler: Priority scheduler shared by all tenants
+            max_tenants: Maximum number of tenant clients kept in memory
+            credentials: Callable returning (client_id, client_secret) for tenants
+                not added with `add_tenant()`, or None if unknown; it is called
+                without holding the pool lock and may run concurrently
+            **client_options: EverestApi keyword arguments (e.g. read_timeout)
+        """
+        self._base_url = base_url
+        self._transport = transport or RequestsTransport()
+        self._rate_limiter = rate_limiter
+        self._scheduler = scheduler
+        self._max_tenants = max(1, max_tenants)
+        self._credentials_loader = credentials
+        self._client_options = client_options
+        self._credentials: Dict[str, Tuple[str, str]] = {}
+        self._clients: 'OrderedDict[str, _TenantClient]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+        self._auths = 0
+
+    def add_tenant(self, tenant_id: str, client_id: str, client_secret: str) -> 'TenantClientPool':
+        """
+        Register the credentials of a tenant.
+
+        Updating the credentials of a known tenant drops its cached client.
+
+        Args:
+            tenant_id: Tenant identifier
+            client_id: OAuth client ID of the tenant
+            client_secret: OAuth client secret of the tenant
+
+        Returns:
+            Self for method chaining
+        """
+        with self._lock:
+            if self._credentials.get(tenant_id) != (client_id, client_secret):
+                self._drop(tenant_id)
+            self._credentials[tenant_id] = (client_id, client_secret)
+        return self
+
+    def remove_tenant(self, tenant_id: str) -> None:
+        """
+        Forget a tenant's credentials, client and token.
+
+        Args:
+            tenant_id: Tenant identifier
+        """
+        with self._lock:
+            self._credentials.pop(tenant_id, None)
+            self._drop(tenant_id)
+
+    def client(self, tenant_id: str) -> EverestApi:
+        """
+        Get the client of a tenant, creating it if needed.
+
+        The client authenticates on its first request; no request is
+        sent by this method.
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            Client for the tenant
+
+        Raises:
+            EverestApiException: If the tenant is unknown
+        """
+        with self._lock:
+            client = self._clients.get(tenant_id)
+            if client is not None:
+                self._clients.move_to_end(tenant_id)
+                return client
+            credentials = self._credentials.get(tenant_id)
+
+        # Loaders may be slow (e.g. a secrets vault): other tenants are not blocked meanwhile
+        if credentials is None and self._credentials_loader is not None:
+            credentials = self._credentials_loader(tenant_id)
+        if credentials is None:
+            raise EverestApiException(f'Unknown tenant: {tenant_id}')
+
+        with self._lock:
+            # Another thread may have created the client while credentials were loaded
+            client = self._clients.get(tenant_id)
+            if client is not None:
+                self._clients.move_to_end(tenant_id)
+                return client
+
+            client = _TenantClient(
+                tenant_id,
+                self._base_url,
+                credentials[0],
+                credentials[1],
+                transport=self._transport,
+                **self._client_options
+            )
+            if self._rate_limiter is not None:
+                client.set_rate_limiter(self._rate_limiter)
+            if self._scheduler is not None:
+                client.set_scheduler(self._scheduler)
+
+            self._clients[tenant_id] = client
+            while len(self._clients) > self._max_tenants:
+                self._drop(next(iter(self._clients)))
+                self._evictions += 1
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        return tenant_id in self._clients
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get pool statistics and the metrics of every resident tenant.
+
+        Returns:
+            Dictionary with tenants, evictions, auths, the shared rate
+            limiter state and per-tenant `endpoints`/`counters` metrics
+        """
+        with self._lock:
+            clients = dict(self._clients)
+            result: Dict[str, Any] = {
+                'tenants': len(clients),
+                'max_tenants': self._max_tenants,
+                'evictions': self._evictions,
+                'auths': self._auths + sum(c.auth_count for c in clients.values()),
+            }
+
+        tenant_metrics = {}
+        for tenant_id, client in clients.items():
+            metrics = client.get_instrumentation().snapshot()
+            tenant_metrics[tenant_id] = {
+                'endpoints': metrics['endpoints'],
+                'counters': metrics['counters'],
+            }
+        result['tenant_metrics'] = tenant_metrics
+
+        if self._rate_limiter is not None:
+            result['rate_limiter'] = self._rate_limiter.snapshot()
+        if self._scheduler is not None:
+            result['scheduler'] = self._scheduler.snapshot()
+        return result
+
+    def close(self) -> None:
+        """Drop every tenant client and close the shared transport."""
+        with self._lock:
+            self._clients.clear()
+        self._transport.close()
+
+    def __enter__(self) -> 'TenantClientPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _drop(self, tenant_id: str) -> None:
+        """Remove a tenant client (called with the lock held)."""
+        client = self._clients.pop(tenant_id, None)
+        if client is not None:
+            self._auths += client.auth_count
@@ -0,0 +1,535 @@
+"""
+Everest API Testing Helpers
+
+Local stand-in for the Everest platform, used by the test and benchmark
+suites and usable for offline integration tests. The server speaks
+HTTP/1.1 with keep-alive (and optionally HTTP/2) and mimics the main API endpoints with
+configurable latency, payload sizes, compression and ETags.
+"""
+
+import hashlib
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from .compression import can_decode, compress, decode_chunks
+
+
+MOCK_TOKEN = 'mock-token'
+
+MISSION_STATUSES = ('pending', 'accepted', 'started', 'completed')
+
+# Endpoints answering with an ETag when the server is created with etags=True
+_VALIDATED_ENDPOINTS = frozenset({'services', 'missions', 'missions/get'})
+
+
+def _endpoint(path: str) -> str:
+    """Strip the query string and /api prefix of a request path."""
+    endpoint = path.split('?', 1)[0].strip('/')
+    if endpoint.startswith('api/'):
+        endpoint = endpoint[4:]
+    return endpoint
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    """Request handler dispatching to the owning MockEverestServer."""
+
+    protocol_version = 'HTTP/1.1'
+    server: '_MockHTTPServer'
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.owner._count_connection()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch()
+
+    def do_POST(self) -> None:
+        self._dispatch()
+
+    def do_PUT(self) -> None:
+        self._dispatch()
+
+    def do_DELETE(self) -> None:
+        self._dispatch()
+
+    def handle(self) -> None:
+        # HTTP/2 clients with prior knowledge open with the "PRI * HTTP/2.0" preface
+        if self.server.owner.http2 and self.connection.recv(3, socket.MSG_PEEK) == b'PRI':
+            _Http2Connection(self.server.owner, self.connection).serve()
+        else:
+            super().handle()
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+
+        status, headers, body = self.server.owner._respond(
+            self.command, self.path, dict(self.headers), raw_body
+        )
+
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Http2Connection:
+    """
+    Minimal HTTP/2 (h2c) server connection built on the `h2` package.
+
+    Each stream is answered on its own thread, so requests multiplexed
+    on the connection are served concurrently.
+    """
+
+    def __init__(self, owner: 'MockEverestServer', sock: socket.socket):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        self._owner = owner
+        self._socket = sock
+        self._events = h2.events
+        self._connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding='utf-8')
+        )
+        # Guards the h2 state machine; notified when flow control windows grow
+        self._condition = threading.Condition()
+        self._requests: Dict[int, Tuple[Dict[str, str], bytearray]] = {}
+        self._closed = False
+
+    def serve(self) -> None:
+        """Read frames until the client disconnects."""
+        events = self._events
+        with self._condition:
+            self._connection.initiate_connection()
+            self._flush()
+
+        try:
+            while True:
+                data = self._socket.recv(65536)
+                if not data:
+                    break
+                with self._condition:
+                    received = self._connection.receive_data(data)
+                    for event in received:
+                        if isinstance(event, events.RequestReceived):
+                            self._requests[event.stream_id] = (dict(event.headers), bytearray())
+                        elif isinstance(event, events.DataReceived):
+                            self._requests[event.stream_id][1].extend(event.data)
+                            self._connection.acknowledge_received_data(
+                                event.flow_controlled_length, event.stream_id
+                            )
+                        elif isinstance(event, events.StreamEnded):
+                            headers, body = self._requests.pop(event.stream_id)
+                            threading.Thread(
+                                target=self._answer,
+                                args=(event.stream_id, headers, bytes(body)),
+                                daemon=True
+                            ).start()
+                        elif isinstance(event, (events.WindowUpdated, events.RemoteSettingsChanged)):
+                            self._condition.notify_all()
+                    self._flush()
+        except OSError:
+            pass
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+
+    def _answer(self, stream_id: int, headers: Dict[str, str], raw_body: bytes) -> None:
+        """Build the response of a stream and send it within the flow control windows."""
+        status, response_headers, body = self._owner._respond(
+            headers.get(':method', 'GET'), headers.get(':path', '/'), headers, raw_body
+        )
+
+        connection = self._connection
+        with self._condition:
+            connection.send_headers(stream_id, [(':status', str(status))] + [
+                (name.lower(), value) for name, value in response_headers
+            ])
+            offset = 0
+            while offset < len(body) and not self._closed:
+                size = min(
+                    len(body) - offset,
+                    connection.local_flow_control_window(stream_id),
+                    connection.max_outbound_frame_size
+                )
+                if size <= 0:
+                    self._condition.wait()
+                    continue
+                connection.send_data(stream_id, body[offset:offset + size])
+                offset += size
+                self._flush()
+            if not self._closed:
+                connection.end_stream(stream_id)
+                self._flush()
+
+    def _flush(self) -> None:
+        """Write pending frames (called with the condition held)."""
+        data = self._connection.data_to_send()
+        if data:
+            try:
+                self._socket.sendall(data)
+            except OSError:
+                self._closed = True
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    owner: 'MockEverestServer'
+
+
+class MockEverestServer:
+    """
+    Local stand-in HTTP server for the Everest API.
+
+    Serves `/auth`, `/services`, `/missions`, `/missions/create`,
+    `/missions/get`, `/missions/update` and `/is-handled-address` under
+    an `/api` prefix. Missions are generated deterministically from their
+    index, so large accounts cost no memory until they are requested.
+
+    Example:
+        with MockEverestServer(mission_count=1000, latency=0.002) as server:
+            api = EverestApi(server.base_url, 'id', 'secret')
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.0,
+        mission_count: int = 100,
+        mission_padding: int = 0,
+        service_count: int = 5,
+        compress_responses: bool = False,
+        http2: bool = False,
+        etags: bool = False
+    ):
+        """
+        Create a new mock server (call `start()` or use it as a context manager).
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Artificial delay in seconds added to every response
+            mission_count: Number of missions in the simulated account
+            mission_padding: Extra characters added to each mission's comment
+            service_count: Number of services returned by `/services`
+            compress_responses: Gzip responses for clients accepting gzip
+            http2: Also accept HTTP/2 prior-knowledge connections (requires `h2`)
+            etags: Send ETags on read endpoints and answer matching If-None-Match with 304
+        """
+        self._host = host
+        self._port = port
+        self._latency = latency
+        self._endpoint_latency: Dict[str, float] = {}
+        self._endpoint_errors: Dict[str, Tuple[int, str]] = {}
+        self._mission_count = mission_count
+        self._mission_padding = mission_padding
+        self._service_count = service_count
+        self._overrides: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_MockHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.compress_responses = compress_responses
+        self.http2 = http2
+        self.etags = etags
+        self.connection_count = 0
+        self.request_count = 0
+        self.compressed_request_count = 0
+        self.not_modified_count = 0
+        self.updates: List[Dict[str, Any]] = []
+
+    @property
+    def base_url(self) -> str:
+        """Base API URL of the running server."""
+        if self._server is None:
+            raise RuntimeError('Mock server is not running')
+        host, port = self._server.socket.getsockname()[:2]
+        return f'http://{host}:{port}/api'
+
+    def start(self) -> 'MockEverestServer':
+        """
+        Start serving on a background thread.
+
+        Returns:
+            Self for method chaining
+        """
+        self._server = _MockHTTPServer((self._host, self._port), _MockRequestHandler)
+        self._server.owner = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release its socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> 'MockEverestServer':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def set_latency(self, latency: float, endpoint: Optional[str] = None) -> 'MockEverestServer':
+        """
+        Set the artificial response delay.
+
+        Args:
+            latency: Delay in seconds
+            endpoint: Endpoint path (e.g. missions/get) or None for all endpoints
+
+        Returns:
+            Self for method chaining
+        """
+        if endpoint is None:
+            self._latency = latency
+        else:
+            self._endpoint_latency[endpoint.strip('/')] = latency
+        return self
+
+    def set_error(
+        self,
+        endpoint: str,
+        message: Optional[str],
+        status: int = 200
+    ) -> 'MockEverestServer':
+        """
+        Answer an endpoint with an error body.
+
+        The API sends some errors with a 2xx status, which is the default.
+
+        Args:
+            endpoint: Endpoint path (e.g. missions/update)
+            message: Error message, or None to answer normally again
+            status: HTTP status code of the error responses
+
+        Returns:
+            Self for method chaining
+        """
+        with self._lock:
+            if message is None:
+                self._endpoint_errors.pop(endpoint.strip('/'), None)
+            else:
+                self._endpoint_errors[endpoint.strip('/')] = (status, message)
+        return self
+
+    def set_mission_fields(self, ref: str, fields: Dict[str, Any]) -> 'MockEverestServer':
+        """
+        Override fields of a generated mission (e.g. to simulate a status change).
+
+        Args:
+            ref: Mission reference
+            fields: Fields to override
+
+        Returns:
+            Self for method chaining
+        """
+        with self._lock:
+            self._overrides.setdefault(ref, {}).update(fields)
+        return self
+
+    def mission(self, index: int) -> Dict[str, Any]:
+        """
+        Build the mission stored at an index of the simulated account.
+
+        Args:
+            index: Mission index (0-based)
+
+        Returns:
+            Mission data
+        """
+        ref = f'MOCK-{index:06d}'
+        mission = {
+            'ref': ref,
+            'client_ref': f'ORDER-{index}',
+            'status': MISSION_STATUSES[index % len(MISSION_STATUSES)],
+            'service_id': index % self._service_count + 1,
+            'start_date': 1760000000 + index * 600,
+            'address_start': '18 Boulevard des Batignolles, 75017 Paris',
+            'address_end': f'{index % 200 + 1} Rue du Faubourg Saint-Honoré, 75008 Paris',
+            'address_end_name': 'John Doe',
+            'comment': 'x' * self._mission_padding,
+            'price': {'total_ht': 10.0 + index % 7, 'total_ttc': 12.0 + index % 7},
+            'packages': [{'name': 'Package', 'weight': 0.5, 'quantity': 1}],
+        }
+        override = self._overrides.get(ref)
+        if override:
+            mission.update(override)
+        return mission
+
+    def _count_connection(self) -> None:
+        with self._lock:
+            self.connection_count += 1
+
+    def _count_compressed_request(self) -> None:
+        with self._lock:
+            self.compressed_request_count += 1
+
+    def _respond(
+        self,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        raw_body: bytes
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """
+        Produce the encoded response to a request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            headers: Request headers
+            raw_body: Request body as received
+
+        Returns:
+            Tuple of status code, response headers and body
+        """
+        lowered = {name.lower(): value for name, value in headers.items()}
+        encoding = lowered.get('content-encoding') or ''
+        try:
+            if raw_body and can_decode(encoding):
+                raw_body = b''.join(decode_chunks((raw_body,), encoding))
+                self._count_compressed_request()
+            params = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            params = {}
+
+        status, payload = self._handle(method, path, headers, params)
+
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        response_headers = [('Content-Type', 'application/json')]
+
+        if self.etags and status == 200 and _endpoint(path) in _VALIDATED_ENDPOINTS:
+            etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+            if lowered.get('if-none-match') == etag:
+                with self._lock:
+                    self.not_modified_count += 1
+                return 304, [('ETag', etag), ('Content-Length', '0')], b''
+            response_headers.append(('ETag', etag))
+
+        if self.compress_responses and 'gzip' in lowered.get('accept-encoding', ''):
+            body = compress(body, 'gzip')
+            response_headers.append(('Content-Encoding', 'gzip'))
+        response_headers.append(('Content-Length', str(len(body))))
+        return status, response_headers, body
+
+    def _handle(
+        self,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any]
+    ) -> Tuple[int, Any]:
+        """
+        Produce the status code and JSON payload for a request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            headers: Request headers
+            params: Decoded JSON request body
+
+        Returns:
+            Tuple of status code and payload
+        """
+        endpoint = _endpoint(path)
+
+        with self._lock:
+            self.request_count += 1
+
+        latency = self._endpoint_latency.get(endpoint, self._latency)
+        if latency:
+            time.sleep(latency)
+
+        if endpoint == 'auth':
+            if params.get('client_id') and params.get('client_secret'):
+                return 200, {'token': MOCK_TOKEN}
+            return 401, {'error': 'Invalid credentials'}
+
+        authorization = {k.lower(): v for k, v in headers.items()}.get('authorization')
+        if authorization != f'Bearer {MOCK_TOKEN}':
+            return 401, {'error': 'Unauthorized'}
+
+        error = self._endpoint_errors.get(endpoint)
+        if error is not None:
+            return error[0], {'error': error[1]}
+
+        if endpoint == 'services':
+            return 200, {'services': [
+                {'id': i, 'name': f'Service {i}'} for i in range(1, self._service_count + 1)
+            ]}
+
+        if endpoint == 'missions':
+            start = max(int(params.get('limit_start', 0)), 0)
+            end = min(int(params.get('limit_end', 50)), self._mission_count)
+            return 200, {'missions': [self.mission(i) for i in range(start, end)]}
+
+        if endpoint == 'missions/get':
+            index = self._mission_index(params.get('ref'))
+            if index is None:
+                return 404, {'error': 'Mission not found'}
+            return 200, {'mission': self.mission(index)}
+
+        if endpoint == 'missions/create':
+            with self._lock:
+                index = self._mission_count
+                self._mission_count += 1
+            mission = self.mission(index)
+            mission.update({k: v for k, v in params.items() if not isinstance(v, (dict, list))})
+            mission['ref'] = f'MOCK-{index:06d}'
+            mission['status'] = 'pending'
+            return 200, {'mission': mission}
+
+        if endpoint == 'missions/update':
+            ref = params.get('ref', '')
+            if self._mission_index(ref) is None:
+                return 404, {'error': 'Mission not found'}
+            with self._lock:
+                self.updates.append(params)
+            self.set_mission_fields(ref, {k: v for k, v in params.items() if k != 'ref'})
+            return 200, {'success': True}
+
+        if endpoint == 'is-handled-address':
+            service_id = int(params.get('service_id', 0))
+            if not params.get('address') or not 1 <= service_id <= self._service_count:
+                return 200, {'success': False}
+            return 200, {
+                'success': True,
+                'price': {'total_ht': 8.0 + service_id, 'total_ttc': 9.6 + service_id * 1.2},
+            }
+
+        return 404, {'error': f'Unknown endpoint: {endpoint}'}
+
+    def _mission_index(self, ref: Any) -> Optional[int]:
+        """
+        Resolve a mission reference to its index.
+
+        Args:
+            ref: Mission reference
+
+        Returns:
+            Mission index or None if the reference is unknown
+        """
+        if not isinstance(ref, str) or not ref.startswith('MOCK-'):
+            return None
+        try:
+            index = int(ref[5:])
+        except ValueError:
+            return None
+        return index if 0 <= index < self._mission_count else None
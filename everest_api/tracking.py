@@ -0,0 +1,305 @@
+"""
+Everest API Mission Tracking
+
+Delta-only mission updates. A tracked mission keeps the snapshot
+returned by `/missions/get` and sends only the fields that differ from
+it to `/missions/update`. A mission updater coalesces pending updates
+of the same ref so that each ref costs one request per flush.
+"""
+
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from .deadline import Deadline
+from .exceptions import EverestApiException
+from .polling import diff_missions
+from .response import EverestApiResponse
+
+
+class TrackedMission:
+    """
+    Mission with local change tracking.
+
+    Fields are read and written like a dictionary. Changes (including
+    changes made inside nested values) are found by comparing the working
+    copy with the last saved snapshot, and `save()` sends only those.
+
+    Example:
+        mission = TrackedMission.load(api, 'MISSION-REF')
+        mission['address_end_comment'] = 'Ring twice'
+        mission.save()   # sends {'ref': ..., 'address_end_comment': 'Ring twice'}
+    """
+
+    def __init__(self, api: Any, mission: Dict[str, Any]):
+        """
+        Track a mission.
+
+        Args:
+            api: Authenticated EverestApi client (or priority view)
+            mission: Mission data as returned by /missions/get
+
+        Raises:
+            EverestApiException: If the mission has no ref
+        """
+        if not mission.get('ref'):
+            raise EverestApiException('Tracked missions need a ref')
+        self._api = api
+        self._snapshot = copy.deepcopy(mission)
+        self._current = mission
+
+    @classmethod
+    def load(cls, api: Any, ref: str, deadline: Optional[Deadline] = None) -> 'TrackedMission':
+        """
+        Fetch a mission and track it.
+
+        Args:
+            api: Authenticated EverestApi client
+            ref: Mission reference
+            deadline: Time budget of the request
+
+        Returns:
+            Tracked mission
+
+        Raises:
+            EverestApiException: If the mission cannot be fetched
+        """
+        response = api.post('/missions/get', {'ref': ref}, deadline)
+        data = response.get_data()
+        mission = data.get('mission') if isinstance(data, dict) else None
+        if not response.is_success() or not isinstance(mission, dict):
+            raise EverestApiException(
+                f'Cannot load mission {ref}: {response.get_error_message() or response.get_status_code()}'
+            )
+        return cls(api, mission)
+
+    @property
+    def ref(self) -> str:
+        """Mission reference."""
+        return self._snapshot['ref']
+
+    def __getitem__(self, field: str) -> Any:
+        return self._current[field]
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        if field == 'ref':
+            raise EverestApiException('The ref of a mission cannot be changed')
+        self._current[field] = value
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._current
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._current)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        Get a field value.
+
+        Args:
+            field: Field name
+            default: Value returned when the field is missing
+
+        Returns:
+            Field value
+        """
+        return self._current.get(field, default)
+
+    def update(self, fields: Dict[str, Any]) -> 'TrackedMission':
+        """
+        Set several fields.
+
+        Args:
+            fields: Field values
+
+        Returns:
+            Self for method chaining
+        """
+        for field, value in fields.items():
+            self[field] = value
+        return self
+
+    def changes(self) -> Dict[str, Any]:
+        """
+        Get the fields changed since the last save.
+
+        Returns:
+            New value of every changed field (None for removed fields)
+        """
+        return {
+            field: new for field, (_, new) in diff_missions(self._snapshot, self._current).items()
+        }
+
+    def is_dirty(self) -> bool:
+        """
+        Check whether there are unsaved changes.
+
+        Returns:
+            True if a field differs from the last saved snapshot
+        """
+        return self._current != self._snapshot
+
+    def discard(self) -> None:
+        """Revert unsaved changes."""
+        self._current = copy.deepcopy(self._snapshot)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the mission data including unsaved changes.
+
+        Returns:
+            Mission data
+        """
+        return self._current
+
+    def save(self, deadline: Optional[Deadline] = None) -> Optional[EverestApiResponse]:
+        """
+        Send the changed fields to /missions/update.
+
+        Args:
+            deadline: Time budget of the request
+
+        Returns:
+            Update response, or None if nothing changed (the changes stay
+            unsaved when the response is an error)
+        """
+        changes = self.changes()
+        if not changes:
+            return None
+
+        response = self._api.post('/missions/update', dict(changes, ref=self.ref), deadline)
+        # Error bodies may come with a 2xx status; the changes then stay unsaved
+        if response.is_success() and not response.has_error():
+            self.mark_saved(changes)
+        return response
+
+    def queue(self, updater: 'MissionUpdater') -> None:
+        """
+        Hand the changed fields to an updater instead of sending them now.
+
+        The changes count as saved once queued; the updater retries fields
+        whose update failed with a transient error on its next flush.
+
+        Args:
+            updater: Updater coalescing updates per ref
+        """
+        changes = self.changes()
+        if changes:
+            updater.update(self.ref, changes)
+            self.mark_saved(changes)
+
+    def mark_saved(self, fields: Dict[str, Any]) -> None:
+        """
+        Record field values as saved on the server.
+
+        Args:
+            fields: Saved field values
+        """
+        for field, value in fields.items():
+            self._snapshot[field] = copy.deepcopy(value)
+
+
+class MissionUpdater:
+    """
+    Coalesces pending mission updates per ref.
+
+    Updates queued for the same ref are merged (later values win) and sent
+    as a single /missions/update request by `flush()`; different refs are
+    sent concurrently. Fields of updates that failed with a transport or
+    server (5xx) error are queued again unless a newer value was queued
+    meanwhile; updates rejected by the API (4xx) are dropped.
+
+    Example:
+        with MissionUpdater(api) as updater:
+            updater.update('REF-1', {'address_end_comment': 'Gate code 1234'})
+            updater.update('REF-1', {'address_end_phone': '+33600000000'})
+        # one request for REF-1 when the block exits
+    """
+
+    def __init__(self, api: Any, max_workers: int = 8):
+        """
+        Create a new updater.
+
+        Args:
+            api: Authenticated EverestApi client (or priority view)
+            max_workers: Maximum number of concurrent update requests
+        """
+        self._api = api
+        self._max_workers = max(1, max_workers)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.coalesced_count = 0
+
+    def update(self, ref: str, fields: Dict[str, Any]) -> None:
+        """
+        Queue field updates for a mission.
+
+        Args:
+            ref: Mission reference
+            fields: Field values to send
+        """
+        with self._lock:
+            pending = self._pending.get(ref)
+            if pending is None:
+                self._pending[ref] = dict(fields)
+            else:
+                pending.update(fields)
+                self.coalesced_count += 1
+
+    def pending(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the queued updates.
+
+        Returns:
+            Field values per ref
+        """
+        with self._lock:
+            return {ref: dict(fields) for ref, fields in self._pending.items()}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def flush(self, deadline: Optional[Deadline] = None) -> Dict[str, EverestApiResponse]:
+        """
+        Send one update request per ref with queued fields.
+
+        Args:
+            deadline: Time budget shared by the requests
+
+        Returns:
+            Response per ref, including rejected (4xx) updates, which are not
+            retried; refs whose request raised are missing and re-queued
+        """
+        with self._lock:
+            batch = self._pending
+            self._pending = {}
+        if not batch:
+            return {}
+
+        def send(ref: str) -> Optional[EverestApiResponse]:
+            try:
+                return self._api.post('/missions/update', dict(batch[ref], ref=ref), deadline)
+            except EverestApiException:
+                return None
+
+        refs: List[str] = list(batch)
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(refs))) as executor:
+            results = list(executor.map(send, refs))
+
+        responses = {}
+        with self._lock:
+            for ref, response in zip(refs, results):
+                if response is not None:
+                    responses[ref] = response
+                if response is None or response.get_status_code() >= 500:
+                    # Retry the fields after transient failures, keeping values queued since
+                    newer = self._pending.get(ref, {})
+                    self._pending[ref] = dict(batch[ref], **newer)
+        return responses
+
+    def __enter__(self) -> 'MissionUpdater':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
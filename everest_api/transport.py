@@ -0,0 +1,732 @@
+"""
+Everest API Transports
+
+Pluggable HTTP transports used by EverestApi to send requests.
+The default transport uses a pooled `requests` session and an optional
+HTTP/2 transport multiplexes requests over httpx; the recording
+and replay transports capture traffic into a compact indexed cassette
+file and serve it back offline for deterministic load tests.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Mapping, Optional, Tuple, Type
+
+from .compression import can_decode, decode_chunks
+from .exceptions import EverestApiException
+
+if TYPE_CHECKING:
+    import requests
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _read_errors() -> Tuple[Type[BaseException], ...]:
+    """
+    Get the errors raised while reading a body from the connection.
+
+    requests and urllib3 are imported here rather than at module level:
+    they account for most of the package import time, and processes that
+    never send a request (e.g. webhook handlers) should not pay for them.
+    """
+    import requests
+    import urllib3
+
+    return (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+
+
+class TransportResponse:
+    """
+    Raw HTTP response returned by a transport.
+
+    Transports hand over the body as received on the wire; it is decoded
+    according to its Content-Encoding header while it is read, so
+    compressed bodies are never held in memory twice when streamed.
+    The body is either available up front or, for streamed responses,
+    read from the connection in chunks on demand.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: Optional[bytes] = b'',
+        reader: Optional[Callable[[int], Iterator[bytes]]] = None,
+        on_close: Optional[Callable[[], None]] = None
+    ):
+        """
+        Create a new transport response.
+
+        Args:
+            status_code: HTTP status code
+            headers: Response headers
+            content: Raw (possibly compressed) body, None for streamed responses
+            reader: Callable returning an iterator of raw body chunks of a given size
+            on_close: Callable releasing the underlying connection
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self._raw = content
+        self._content: Optional[bytes] = None
+        self._reader = reader
+        self._on_close = on_close
+
+    @property
+    def content(self) -> bytes:
+        """
+        Full decoded response body, read from the connection if not read yet.
+
+        Raises:
+            ValueError: If the body cannot be decompressed
+        """
+        if self._content is None:
+            raw = self.read_raw()
+            encoding = self.content_encoding()
+            if can_decode(encoding):
+                self._content = b''.join(decode_chunks((raw,), encoding or ''))
+            else:
+                self._content = bytes(raw)
+            self.body_bytes = len(self._content)
+        return self._content
+
+    def content_encoding(self) -> Optional[str]:
+        """
+        Get the Content-Encoding header value.
+
+        Returns:
+            Header value or None
+        """
+        value = self.headers.get('Content-Encoding')
+        if value is None:
+            for name, header_value in self.headers.items():
+                if name.lower() == 'content-encoding':
+                    return header_value
+        return value
+
+    def read_raw(self, expired: Optional[Callable[[], bool]] = None) -> bytes:
+        """
+        Read the whole body as received, without decoding it.
+
+        Args:
+            expired: Callable checked after each chunk read from the connection;
+                reading stops once it returns True
+
+        Returns:
+            Raw response body
+
+        Raises:
+            TimeoutError: If `expired` returns True before the body is read
+        """
+        if self._raw is None:
+            try:
+                chunks = []
+                for chunk in self.iter_raw():
+                    chunks.append(chunk)
+                    if expired is not None and expired():
+                        raise TimeoutError('Time budget exhausted while reading the response body')
+                self._raw = b''.join(chunks)
+            finally:
+                self.close()
+        self.wire_bytes = len(self._raw)
+        return self._raw
+
+    def iter_raw(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the body as received, without decoding it.
+
+        Args:
+            chunk_size: Maximum chunk size in bytes
+
+        Returns:
+            Iterator of raw body chunks
+        """
+        if self._raw is not None or self._reader is None:
+            raw = self._raw or b''
+            self.wire_bytes = len(raw)
+            return (raw[i:i + chunk_size] for i in range(0, len(raw), chunk_size))
+        reader = self._reader
+        self._reader = None
+        return self._count_wire_bytes(reader(chunk_size))
+
+    def iter_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the decoded body in chunks.
+
+        Compressed bodies are decompressed incrementally, so decoded
+        chunks may be larger than `chunk_size`.
+
+        Args:
+            chunk_size: Maximum raw chunk size in bytes
+
+        Returns:
+            Iterator of decoded body chunks
+
+        Raises:
+            ValueError: While iterating, if the body cannot be decompressed
+        """
+        if self._content is not None:
+            content = self._content
+            return (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+
+        chunks = self.iter_raw(chunk_size)
+        encoding = self.content_encoding()
+        if can_decode(encoding):
+            chunks = decode_chunks(chunks, encoding or '')
+        return self._count_body_bytes(chunks)
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        if self._on_close is not None:
+            on_close = self._on_close
+            self._on_close = None
+            on_close()
+
+    def call_on_close(self, callback: Callable[[], None]) -> None:
+        """
+        Run a callback once the response is closed.
+
+        Args:
+            callback: Callable run after the connection is released
+        """
+        previous = self._on_close
+
+        def on_close() -> None:
+            try:
+                if previous is not None:
+                    previous()
+            finally:
+                callback()
+
+        self._on_close = on_close
+
+    def _count_wire_bytes(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.wire_bytes += len(chunk)
+            yield chunk
+
+    def _count_body_bytes(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.body_bytes += len(chunk)
+            yield chunk
+
+
+class Transport:
+    """
+    Base class for HTTP transports.
+
+    Subclasses implement `send()`; they must be safe to call from
+    several threads at once.
+    """
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        """
+        Send an HTTP request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            body: Encoded request body
+            headers: Request headers
+            timeout: Tuple of connect and read timeouts in seconds
+            verify: Whether to verify SSL certificates
+
+        Returns:
+            Raw response
+
+        Raises:
+            EverestApiException: If the request cannot be completed
+        """
+        raise NotImplementedError
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        """
+        Send an HTTP request without reading the response body up front.
+
+        The default implementation reads the whole body; transports able
+        to stream from the connection override it. Callers must close the
+        returned response.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            body: Encoded request body
+            headers: Request headers
+            timeout: Tuple of connect and read timeouts in seconds
+            verify: Whether to verify SSL certificates
+
+        Returns:
+            Response whose body is read with `iter_content()`
+
+        Raises:
+            EverestApiException: If the request cannot be completed
+        """
+        return self.send(method, url, body, headers, timeout, verify)
+
+    def close(self) -> None:
+        """Release resources held by the transport."""
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by a `requests.Session`, reusing pooled connections.
+
+    requests is imported and the session created on the first request.
+    """
+
+    def __init__(self, session: Optional['requests.Session'] = None):
+        """
+        Create a new requests-based transport.
+
+        Args:
+            session: Session to use (a new one is created on first use by default)
+        """
+        self._session = session
+        self._session_lock = threading.Lock()
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        response = self._open(method, url, body, headers, timeout, verify)
+        try:
+            content = response.raw.read(decode_content=False)
+        except _read_errors() as e:
+            raise EverestApiException(f'Request error: {str(e)}') from e
+        finally:
+            response.close()
+
+        return TransportResponse(response.status_code, response.headers, content)
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        response = self._open(method, url, body, headers, timeout, verify)
+        read_errors = _read_errors()
+
+        def reader(chunk_size: int) -> Iterator[bytes]:
+            try:
+                for chunk in response.raw.stream(chunk_size, decode_content=False):
+                    yield chunk
+            except read_errors as e:
+                raise EverestApiException(f'Request error: {str(e)}') from e
+
+        return TransportResponse(
+            response.status_code, response.headers, None, reader, response.close
+        )
+
+    def _open(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> 'requests.Response':
+        """
+        Send a request and return once the response headers are read.
+
+        The body is left on the connection and read undecoded, so that
+        TransportResponse handles Content-Encoding itself.
+        """
+        import requests
+
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = requests.Session()
+                session = self._session
+
+        try:
+            return session.request(
+                method=method,
+                url=url,
+                data=body,
+                headers=headers,
+                verify=verify,
+                timeout=timeout,
+                stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            raise EverestApiException(f'Request error: {str(e)}') from e
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+
+class Http2Transport(Transport):
+    """
+    Transport multiplexing concurrent requests over a few HTTP/2 connections.
+
+    Requires the optional `httpx` package with HTTP/2 support
+    (`pip install everest-api-client[http2]`). Over TLS the protocol is
+    negotiated per connection, so servers that only speak HTTP/1.1 are
+    used over HTTP/1.1; without the `h2` package every request uses
+    HTTP/1.1. Plain-text URLs use HTTP/1.1 unless `prior_knowledge` is
+    set, which assumes the server accepts HTTP/2 without negotiation.
+    """
+
+    def __init__(self, prior_knowledge: bool = False, max_connections: int = 10):
+        """
+        Create a new HTTP/2 transport.
+
+        Args:
+            prior_knowledge: Speak HTTP/2 to plain-text servers without negotiation
+            max_connections: Maximum number of open connections
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                'Http2Transport requires httpx: pip install everest-api-client[http2]'
+            ) from e
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        self._httpx = httpx
+        self._http2 = http2
+        self._prior_knowledge = prior_knowledge and http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        )
+        self._clients: Dict[bool, Any] = {}
+        self._lock = threading.Lock()
+
+    def supports_http2(self) -> bool:
+        """
+        Check whether HTTP/2 can be used.
+
+        Returns:
+            False when the `h2` package is missing and HTTP/1.1 is used instead
+        """
+        return self._http2
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        response = self._open(method, url, body, headers, timeout, verify)
+        try:
+            content = b''.join(response.iter_raw())
+        except (self._httpx.HTTPError, self._httpx.StreamError) as e:
+            raise EverestApiException(f'Request error: {str(e)}') from e
+        finally:
+            response.close()
+
+        return TransportResponse(response.status_code, response.headers, content)
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        response = self._open(method, url, body, headers, timeout, verify)
+        errors = (self._httpx.HTTPError, self._httpx.StreamError)
+
+        def reader(chunk_size: int) -> Iterator[bytes]:
+            try:
+                for chunk in response.iter_raw(chunk_size):
+                    yield chunk
+            except errors as e:
+                raise EverestApiException(f'Request error: {str(e)}') from e
+
+        return TransportResponse(
+            response.status_code, response.headers, None, reader, response.close
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def _open(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> Any:
+        """Send a request and return once the response headers are read."""
+        client = self._client(verify)
+        request = client.build_request(
+            method,
+            url,
+            content=body,
+            headers=headers,
+            timeout=self._httpx.Timeout(timeout[1], connect=timeout[0])
+        )
+        try:
+            return client.send(request, stream=True)
+        except self._httpx.HTTPError as e:
+            raise EverestApiException(f'Request error: {str(e)}') from e
+
+    def _client(self, verify: bool) -> Any:
+        """
+        Get the httpx client for a verification setting, creating it if needed.
+
+        httpx binds certificate verification to the client, so one client
+        (and connection pool) is kept per setting.
+        """
+        client = self._clients.get(verify)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(verify)
+                if client is None:
+                    client = self._clients[verify] = self._httpx.Client(
+                        http1=not self._prior_knowledge,
+                        http2=self._http2,
+                        verify=verify,
+                        limits=self._limits
+                    )
+        return client
+
+
+# Cassette layout (little-endian):
+#   magic | record* | index entry* | footer
+#   record:      status (H) headers length (I) body length (I) headers JSON, body
+#   index entry: request key (8s) record offset (Q), sorted by key
+#   footer:      index offset (Q) entry count (I) index magic
+CASSETTE_MAGIC = b'EVCASS01'
+CASSETTE_INDEX_MAGIC = b'EVCASIDX'
+
+_RECORD_HEADER = struct.Struct('<HII')
+_INDEX_ENTRY = struct.Struct('<8sQ')
+_FOOTER = struct.Struct('<QI8s')
+
+
+def request_key(method: str, url: str, body: bytes) -> bytes:
+    """
+    Compute the cassette key identifying a request.
+
+    Headers are not part of the key, so recordings replay regardless
+    of the bearer token in use.
+
+    Args:
+        method: HTTP method
+        url: Full request URL
+        body: Encoded request body
+
+    Returns:
+        8-byte request key
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(method.upper().encode('ascii'))
+    digest.update(b'\0')
+    digest.update(url.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(body)
+    return digest.digest()
+
+
+class RecordingTransport(Transport):
+    """
+    Transport that forwards requests and records responses into a cassette.
+
+    Records are appended to the file as they arrive; the index is written
+    by `close()`. When the same request is recorded several times, the
+    latest response wins.
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None):
+        """
+        Create a new recording transport.
+
+        Args:
+            path: Cassette file to write (overwritten if it exists)
+            transport: Transport performing the real requests
+        """
+        self._transport = transport or RequestsTransport()
+        self._file = open(path, 'wb')
+        self._file.write(CASSETTE_MAGIC)
+        self._offsets: Dict[bytes, int] = {}
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        response = self._transport.send(method, url, body, headers, timeout, verify)
+        # Bodies are stored as received, so replay decodes them the same way
+        raw = response.read_raw()
+
+        encoded_headers = json.dumps(
+            dict(response.headers), separators=(',', ':')
+        ).encode('utf-8')
+
+        with self._lock:
+            if self._file.closed:
+                raise EverestApiException('Recording transport is closed')
+            self._offsets[request_key(method, url, body)] = self._file.tell()
+            self._file.write(_RECORD_HEADER.pack(
+                response.status_code, len(encoded_headers), len(raw)
+            ))
+            self._file.write(encoded_headers)
+            self._file.write(raw)
+
+        return response
+
+    def close(self) -> None:
+        """Write the cassette index and close the file."""
+        with self._lock:
+            if self._file.closed:
+                return
+            index_offset = self._file.tell()
+            for key in sorted(self._offsets):
+                self._file.write(_INDEX_ENTRY.pack(key, self._offsets[key]))
+            self._file.write(_FOOTER.pack(index_offset, len(self._offsets), CASSETTE_INDEX_MAGIC))
+            self._file.close()
+
+        self._transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Transport serving recorded responses from a memory-mapped cassette.
+
+    Lookups binary-search the sorted on-disk index, so neither the index
+    nor the recorded bodies are loaded into memory up front.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a cassette for replay.
+
+        Args:
+            path: Cassette file written by RecordingTransport
+
+        Raises:
+            EverestApiException: If the file is not a complete cassette
+        """
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(CASSETTE_MAGIC) + _FOOTER.size:
+            self._file.close()
+            raise EverestApiException(f'Invalid cassette file: {path}')
+
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        index_offset, count, index_magic = _FOOTER.unpack_from(self._map, size - _FOOTER.size)
+        if self._map[:len(CASSETTE_MAGIC)] != CASSETTE_MAGIC or index_magic != CASSETTE_INDEX_MAGIC:
+            self.close()
+            raise EverestApiException(f'Invalid cassette file: {path}')
+
+        self._index_offset = index_offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Tuple[float, float],
+        verify: bool
+    ) -> TransportResponse:
+        offset = self._find(request_key(method, url, body))
+        if offset is None:
+            raise EverestApiException(f'No recorded response for {method} {url}')
+
+        status_code, headers_length, body_length = _RECORD_HEADER.unpack_from(self._map, offset)
+        start = offset + _RECORD_HEADER.size
+        recorded_headers = json.loads(self._map[start:start + headers_length])
+        start += headers_length
+
+        return TransportResponse(status_code, recorded_headers, self._map[start:start + body_length])
+
+    def _find(self, key: bytes) -> Optional[int]:
+        """
+        Binary-search the index for a request key.
+
+        Args:
+            key: Request key
+
+        Returns:
+            Record offset or None if the request was not recorded
+        """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry_key, offset = _INDEX_ENTRY.unpack_from(
+                self._map, self._index_offset + middle * _INDEX_ENTRY.size
+            )
+            if entry_key == key:
+                return offset
+            if entry_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
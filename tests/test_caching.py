@@ -0,0 +1,197 @@
+"""
+Tests for ResponseCache and conditional requests
+"""
+
+import copy
+import pickle
+
+import pytest
+from everest_api import EverestApi, EverestApiResponse, ResponseCache, TrackedMission
+from everest_api.testing import MockEverestServer
+from everest_api.transport import RequestsTransport
+
+
+def make_api(server, cache):
+    api = EverestApi(server.base_url, 'client', 'secret').set_response_cache(cache)
+    api.auth()
+    return api
+
+
+def test_not_modified_returns_cached_response():
+    """Test ETags are revalidated and 304 answers reuse the cached body"""
+    with MockEverestServer(etags=True) as server:
+        cache = ResponseCache()
+        api = make_api(server, cache)
+
+        first = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        assert first.get_header('ETag')
+        assert first.get_data()['mission']['ref'] == 'MOCK-000001'
+
+        again = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        assert again.get_content_hash() == first.get_content_hash()
+        assert again.get_data() == first.get_data()
+        assert server.not_modified_count == 1
+
+        server.set_mission_fields('MOCK-000001', {'status': 'canceled'})
+        changed = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        assert changed.get_content_hash() != first.get_content_hash()
+        assert changed.get_data()['mission']['status'] == 'canceled'
+        unchanged = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        assert unchanged.get_content_hash() == changed.get_content_hash()
+
+        # Other refs and uncached endpoints are not revalidated
+        other = api.post('/missions/get', {'ref': 'MOCK-000002'})
+        assert other.get_content_hash() != first.get_content_hash()
+        api.post('/missions/update', {'ref': 'MOCK-000001', 'comment': 'x'})
+        assert len(cache) == 2
+
+        assert api.get_instrumentation().snapshot()['response_cache'] == {
+            'entries': 2,
+            'max_entries': 1000,
+            'not_modified': 2,
+            'unchanged': 0,
+            'changed': 1,
+        }
+
+
+def test_content_hash_detects_unchanged_bodies_without_validators():
+    """Test identical bodies resolve to the cached response when no ETag is sent"""
+    with MockEverestServer() as server:
+        cache = ResponseCache(endpoints=['/services'])
+        api = make_api(server, cache)
+
+        first = api.get('/services')
+        assert first.get_header('ETag') is None
+        assert api.get('/services').get_data() == first.get_data()
+        assert cache.snapshot()['unchanged'] == 1
+        assert server.not_modified_count == 0
+
+
+def test_cache_is_bounded():
+    """Test the least recently used response is evicted"""
+    with MockEverestServer(etags=True) as server:
+        cache = ResponseCache(max_entries=2)
+        api = make_api(server, cache)
+
+        for ref in ('MOCK-000001', 'MOCK-000002', 'MOCK-000001', 'MOCK-000003'):
+            api.post('/missions/get', {'ref': ref})
+        assert len(cache) == 2
+
+        api.post('/missions/get', {'ref': 'MOCK-000002'})
+        assert server.not_modified_count == 1
+
+
+class InterleavingTransport(RequestsTransport):
+    """Transport running another request just before sending a revalidation"""
+
+    interleave = None
+
+    def send(self, method, url, body, headers, timeout, verify):
+        if 'If-None-Match' in headers and self.interleave is not None:
+            interleave, self.interleave = self.interleave, None
+            interleave()
+        return super().send(method, url, body, headers, timeout, verify)
+
+
+def test_not_modified_after_eviction():
+    """Test a 304 is served from the revalidated response when its entry was evicted meanwhile"""
+    with MockEverestServer(etags=True) as server:
+        transport = InterleavingTransport()
+        cache = ResponseCache(max_entries=1)
+        api = EverestApi(server.base_url, 'client', 'secret', transport=transport)
+        api.set_response_cache(cache).auth()
+
+        first = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        transport.interleave = lambda: api.post('/missions/get', {'ref': 'MOCK-000002'})
+
+        again = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        assert server.not_modified_count == 1
+        assert again.get_status_code() == 200
+        assert again.get_data() == first.get_data()
+        assert cache.snapshot()['not_modified'] == 1
+
+
+class RevisingTransport(RequestsTransport):
+    """Transport giving every 200 response a new ETag and recording the ones sent back"""
+
+    def __init__(self):
+        super().__init__()
+        self.revision = 0
+        self.sent_etags = []
+
+    def send(self, method, url, body, headers, timeout, verify):
+        self.sent_etags.append(headers.get('If-None-Match'))
+        response = super().send(method, url, body, headers, timeout, verify)
+        etag = response.headers.get('ETag')
+        if response.status_code == 200 and etag:
+            self.revision += 1
+            response.headers = dict(response.headers, ETag=f'{etag[:-1]}-{self.revision}"')
+        return response
+
+
+def test_unchanged_body_keeps_new_validators():
+    """Test an unchanged body arriving with a new ETag is revalidated with that ETag"""
+    with MockEverestServer(etags=True) as server:
+        transport = RevisingTransport()
+        cache = ResponseCache()
+        api = EverestApi(server.base_url, 'client', 'secret', transport=transport)
+        api.set_response_cache(cache).auth()
+        transport.sent_etags.clear()
+
+        first = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        second = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        api.post('/missions/get', {'ref': 'MOCK-000001'})
+
+        assert second.get_content_hash() == first.get_content_hash()
+        assert second.get_header('ETag') != first.get_header('ETag')
+        assert transport.sent_etags == [None, first.get_header('ETag'), second.get_header('ETag')]
+        assert cache.snapshot()['unchanged'] == 2
+
+
+def test_response_parsing_is_lazy():
+    """Test the JSON body is parsed on first access and hashed by content"""
+    response = EverestApiResponse('{"a": 1}', 200, {})
+    assert response._parsed is False
+    assert response.get_data() == {'a': 1}
+    assert response.get_content_hash() == EverestApiResponse('{"a": 1}', 200, {}).get_content_hash()
+    assert response.get_content_hash() != EverestApiResponse('{"a": 2}', 200, {}).get_content_hash()
+    assert EverestApiResponse('not json', 500, {}).get_error_message() is None
+
+
+@pytest.mark.parametrize('etags', [True, False])
+def test_cached_reads_do_not_share_data(etags):
+    """Test changes made to the data of a cached read do not leak into later reads"""
+    with MockEverestServer(etags=etags) as server:
+        api = make_api(server, ResponseCache())
+
+        mission = TrackedMission.load(api, 'MOCK-000001')
+        mission['comment'] = 'unsaved edit'
+        first = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        first.get_data()['mission']['status'] = 'edited'
+
+        again = api.post('/missions/get', {'ref': 'MOCK-000001'})
+        assert again.get_data()['mission']['comment'] != 'unsaved edit'
+        assert again.get_data()['mission']['status'] != 'edited'
+        assert not TrackedMission.load(api, 'MOCK-000001').is_dirty()
+        assert server.not_modified_count == (3 if etags else 0)
+
+
+@pytest.mark.parametrize('parse', [False, True])
+def test_responses_can_be_pickled_and_copied(parse):
+    """Test lazily parsed responses survive pickling and deep copies"""
+    response = EverestApiResponse('{"a": [1, 2]}', 200, {'ETag': 'v1'})
+    if parse:
+        response.get_data()
+
+    for clone in (pickle.loads(pickle.dumps(response)), copy.deepcopy(response), response.copy()):
+        assert clone.get_data() == {'a': [1, 2]}
+        assert clone.get_header('etag') == 'v1'
+        assert clone.get_content_hash() == response.get_content_hash()
+
+
+@pytest.mark.parametrize('header', ['ETag', 'Last-Modified'])
+def test_conditional_headers(header):
+    """Test validators are turned into conditional request headers"""
+    response = EverestApiResponse('{}', 200, {header: 'v1'})
+    expected = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}[header]
+    assert ResponseCache.conditional_headers(response) == {expected: 'v1'}
@@ -0,0 +1,152 @@
+"""
+Tests for CircuitBreaker, CircuitBreakerRegistry and client integration
+"""
+
+import pickle
+
+import pytest
+from everest_api import EverestApi, EverestApiException, CircuitOpenException
+from everest_api.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from everest_api.transport import Transport, TransportResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubTransport(Transport):
+    """Transport answering with a fixed status code"""
+
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = 0
+
+    def send(self, method, url, body, headers, timeout, verify):
+        self.calls += 1
+        if self.status_code is None:
+            raise OSError('connection reset')
+        return TransportResponse(self.status_code, {}, b'{}')
+
+
+def test_opens_on_failure_rate():
+    """Test the breaker opens once the failure rate is reached"""
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, window_size=4, minimum_calls=4)
+
+    for success in (True, False, True):
+        assert breaker.allow() is True
+        breaker.record(success, 0.01)
+    assert breaker.get_state() == 'closed'
+
+    breaker.record(False, 0.01)
+    assert breaker.get_state() == 'open'
+    assert breaker.allow() is False
+
+
+def test_opens_on_slow_calls():
+    """Test the breaker opens when calls are too slow"""
+    breaker = CircuitBreaker(slow_call_threshold=1.0, slow_call_rate_threshold=0.5,
+                             window_size=2, minimum_calls=2)
+
+    breaker.record(True, 2.0)
+    breaker.record(True, 3.0)
+
+    assert breaker.get_state() == 'open'
+
+
+def test_half_open_recovery():
+    """Test trial calls close or re-open the breaker"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_timeout=10, clock=clock)
+    breaker.record(False, 0.1)
+    breaker.record(False, 0.1)
+    assert breaker.retry_after() == 10
+
+    clock.now = 10
+    assert breaker.get_state() == 'half_open'
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record(False, 0.1)
+    assert breaker.get_state() == 'open'
+
+    clock.now = 20
+    assert breaker.allow() is True
+    breaker.record(True, 0.1)
+    assert breaker.get_state() == 'closed'
+    assert breaker.snapshot()['calls'] == 0
+
+
+def test_registry_per_endpoint_settings():
+    """Test breakers are created per endpoint with overrides"""
+    registry = CircuitBreakerRegistry(window_size=10).configure('/missions', window_size=2,
+                                                                minimum_calls=2)
+
+    assert registry.get('missions/get') is registry.get('/missions/get')
+    registry.get('missions').record(False, 0.1)
+    registry.get('missions').record(False, 0.1)
+
+    snapshot = registry.snapshot()
+    assert snapshot['missions']['state'] == 'open'
+    assert snapshot['missions/get']['state'] == 'closed'
+
+
+def test_client_fails_fast_when_open():
+    """Test the client raises CircuitOpenException without sending"""
+    transport = StubTransport(503)
+    api = EverestApi('https://example.everst.io/api', 'id', 'secret', transport=transport)
+    api.set_circuit_breakers(CircuitBreakerRegistry(window_size=2, minimum_calls=2))
+
+    api.post('/missions/get', {'ref': 'A'})
+    api.post('/missions/get', {'ref': 'A'})
+
+    with pytest.raises(CircuitOpenException) as excinfo:
+        api.post('/missions/get', {'ref': 'A'})
+
+    assert isinstance(excinfo.value, EverestApiException)
+    assert excinfo.value.endpoint == 'missions/get'
+    assert transport.calls == 2
+
+    # Other endpoints are unaffected
+    transport.status_code = 200
+    assert api.post('/services').is_success() is True
+
+    snapshot = api.get_instrumentation().snapshot()
+    assert snapshot['circuit_breakers']['missions/get']['state'] == 'open'
+    assert snapshot['counters']['circuit_breaker_rejections'] == 1
+    assert snapshot['endpoints']['missions/get']['errors'] == 2
+
+
+def test_unexpected_errors_release_the_trial_slot():
+    """Test errors other than API errors are recorded as failures"""
+    clock = FakeClock()
+    transport = StubTransport(None)
+    api = EverestApi('https://example.everst.io/api', 'id', 'secret', transport=transport)
+    breakers = CircuitBreakerRegistry(window_size=2, minimum_calls=2, open_timeout=10, clock=clock)
+    api.set_circuit_breakers(breakers)
+
+    for _ in range(2):
+        with pytest.raises(OSError):
+            api.post('/services')
+    assert breakers.get('services').get_state() == 'open'
+
+    clock.now = 10
+    with pytest.raises(OSError):
+        api.post('/services')
+    assert breakers.get('services').get_state() == 'open'
+
+    clock.now = 20
+    transport.status_code = 200
+    assert api.post('/services').is_success() is True
+    assert breakers.get('services').get_state() == 'closed'
+
+
+def test_circuit_open_exception_pickles():
+    """Test the exception crosses process boundaries with its attributes"""
+    error = pickle.loads(pickle.dumps(CircuitOpenException('Circuit breaker open', 'missions', 2.5)))
+
+    assert isinstance(error, CircuitOpenException)
+    assert str(error) == 'Circuit breaker open'
+    assert (error.endpoint, error.retry_after) == ('missions', 2.5)
@@ -0,0 +1,155 @@
+"""
+Tests for request and response compression
+"""
+
+import gzip
+
+import pytest
+from everest_api import EverestApi, EverestApiException
+from everest_api.compression import accept_encoding, can_decode, compress, decode_chunks
+from everest_api.testing import MockEverestServer
+from everest_api.transport import TransportResponse
+
+
+def test_compress_round_trip():
+    """Test compressed bodies decode chunk by chunk"""
+    data = b'{"missions": []}' * 1000
+    compressed = compress(data, 'gzip')
+
+    assert gzip.decompress(compressed) == data
+    chunks = [compressed[i:i + 100] for i in range(0, len(compressed), 100)]
+    assert b''.join(decode_chunks(chunks, 'gzip')) == data
+    assert b''.join(decode_chunks([compress(data, 'deflate')], 'deflate')) == data
+
+
+def test_encoding_support():
+    """Test encoding negotiation helpers"""
+    assert 'gzip' in accept_encoding()
+    assert can_decode('GZIP') is True
+    assert can_decode('identity') is False
+    assert can_decode(None) is False
+
+    with pytest.raises(ValueError):
+        compress(b'data', 'lzma')
+
+    with pytest.raises(ValueError):
+        b''.join(decode_chunks([b'not gzip'], 'gzip'))
+
+
+def test_multiple_and_truncated_encodings():
+    """Test stacked codings are undone in reverse order and cut-off streams are rejected"""
+    data = b'{"missions": []}' * 100
+    stacked = compress(compress(data, 'gzip'), 'deflate')
+
+    assert can_decode('gzip, deflate') is True
+    assert can_decode('gzip, lzma') is False
+    assert b''.join(decode_chunks([stacked[:10], stacked[10:]], 'gzip, deflate')) == data
+    assert b''.join(decode_chunks([b''], 'gzip')) == b''
+
+    with pytest.raises(ValueError, match='Truncated'):
+        b''.join(decode_chunks([compress(data, 'gzip')[:-8]], 'gzip'))
+
+
+def test_transport_response_decodes_content():
+    """Test transport responses decode bodies and count bytes"""
+    body = b'{"success": true, "padding": "' + b'x' * 1000 + b'"}'
+    compressed = compress(body)
+
+    response = TransportResponse(200, {'content-encoding': 'gzip'}, compressed)
+    assert response.content == body
+    assert response.read_raw() == compressed
+    assert response.wire_bytes == len(compressed)
+    assert response.body_bytes == len(body)
+
+    streamed = TransportResponse(
+        200, {'Content-Encoding': 'gzip'}, None, lambda size: iter([compressed[:10], compressed[10:]])
+    )
+    assert b''.join(streamed.iter_content()) == body
+    assert streamed.wire_bytes == len(compressed)
+    assert streamed.body_bytes == len(body)
+
+
+def test_requests_compressed_above_threshold():
+    """Test only bodies above the threshold are compressed"""
+    with MockEverestServer() as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            api.set_compression(threshold=200)
+            api.auth()
+
+            api.post('/missions/create', {'address_end': 'x' * 500})
+            assert server.compressed_request_count == 1
+
+            created = api.post('/missions/create', {'address_end': 'y' * 500})
+            assert created.get_data()['mission']['address_end'] == 'y' * 500
+
+            api.post('/missions/get', {'ref': 'MOCK-000001'})
+            assert server.compressed_request_count == 2
+
+            stats = api.get_instrumentation().snapshot()
+            assert stats['counters']['compressed_requests'] == 2
+            assert stats['compression']['request_ratio'] > 1.0
+
+
+def test_compressed_responses():
+    """Test compressed responses are decoded, streamed and measured"""
+    with MockEverestServer(mission_count=200, mission_padding=100, compress_responses=True) as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            api.auth()
+
+            page = api.post('/missions', {'limit_start': 0, 'limit_end': 200})
+            assert page.get_header('content-encoding') == 'gzip'
+            assert len(page.get_data()['missions']) == 200
+
+            missions = list(api.stream_missions({'limit_start': 0, 'limit_end': 200}, chunk_size=512))
+            assert missions == page.get_data()['missions']
+
+            compression = api.get_instrumentation().snapshot()['compression']
+            assert compression['response_ratio'] > 5.0
+
+
+def test_accept_encoding_can_be_disabled():
+    """Test responses stay uncompressed when compression is not advertised"""
+    with MockEverestServer(compress_responses=True) as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            api.set_compression(accept_compressed=False)
+            api.auth()
+
+            response = api.post('/services')
+            assert response.get_header('content-encoding') is None
+            assert len(response.get_data()['services']) == 5
+
+
+def test_invalid_compressed_response():
+    """Test corrupt compressed bodies raise an API error"""
+    class CorruptTransport:
+        def send(self, *args):
+            return TransportResponse(200, {'Content-Encoding': 'gzip'}, b'garbage')
+
+        def close(self):
+            pass
+
+    api = EverestApi('https://example.test/api', 'client', 'secret', transport=CorruptTransport())
+    with pytest.raises(EverestApiException):
+        api.post('/services')
+
+
+def test_truncated_compressed_response():
+    """Test a cut-off compressed body raises an API error instead of a shortened payload"""
+    class TruncatingTransport:
+        def send(self, *args):
+            body = compress(b'{"services": [' + b'1, ' * 500 + b'1]}')
+            return TransportResponse(200, {'Content-Encoding': 'gzip'}, body[:len(body) // 2])
+
+        def close(self):
+            pass
+
+    api = EverestApi('https://example.test/api', 'client', 'secret', transport=TruncatingTransport())
+    with pytest.raises(EverestApiException, match='Truncated'):
+        api.post('/services')
+
+
+def test_unsupported_request_encoding():
+    """Test unavailable request encodings are rejected"""
+    api = EverestApi('https://example.test/api', 'client', 'secret')
+    with pytest.raises(ValueError):
+        api.set_compression(threshold=100, encoding='lzma')
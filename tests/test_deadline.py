@@ -0,0 +1,113 @@
+"""
+Tests for Deadline and client timeouts
+"""
+
+import pytest
+from everest_api import EverestApi, EverestApiException, Deadline, DeadlineExceededException
+from everest_api.testing import MockEverestServer, MOCK_TOKEN
+from everest_api.transport import Transport, TransportResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_deadline_remaining_and_cap():
+    """Test deadlines cap timeouts by the remaining budget"""
+    clock = FakeClock()
+    deadline = Deadline(5.0, clock)
+
+    assert deadline.cap((3.0, 30.0)) == (3.0, 5.0)
+
+    clock.now += 4.0
+    assert deadline.remaining() == pytest.approx(1.0)
+    assert deadline.limit(10.0).remaining() == pytest.approx(1.0)
+    assert deadline.limit(0.5).remaining() == pytest.approx(0.5)
+
+    clock.now += 1.0
+    assert deadline.expired() is True
+    with pytest.raises(DeadlineExceededException):
+        deadline.cap((3.0, 30.0))
+
+
+def test_endpoint_timeouts():
+    """Test client-wide and per-endpoint timeout configuration"""
+    api = EverestApi('https://example.everst.io/api', 'id', 'secret', connect_timeout=5.0)
+    api.set_timeout(read=20.0).set_timeout(connect=1.0, read=2.0, endpoint='/is-handled-address')
+
+    assert api.get_timeout() == (5.0, 20.0)
+    assert api.get_timeout('is-handled-address') == (1.0, 2.0)
+    assert api.get_timeout('/missions') == (5.0, 20.0)
+
+
+def test_slow_endpoint_times_out():
+    """Test a per-endpoint read timeout and deadline against a slow server"""
+    with MockEverestServer() as server:
+        server.set_latency(0.5, 'is-handled-address')
+        api = EverestApi(server.base_url, 'id', 'secret').set_token(MOCK_TOKEN)
+        params = {'address': 'Paris', 'service_id': 1}
+
+        api.set_timeout(read=0.1, endpoint='is-handled-address')
+        with pytest.raises(EverestApiException):
+            api.post('/is-handled-address', params)
+
+        api.set_timeout(read=5.0, endpoint='is-handled-address')
+        with pytest.raises(DeadlineExceededException):
+            api.post('/is-handled-address', params, deadline=Deadline(0.1))
+
+        deadline = Deadline(2.0)
+        assert api.post('/services', deadline=deadline).is_success() is True
+        assert deadline.remaining() < 2.0
+
+
+def test_expired_deadline_does_not_send():
+    """Test nothing is sent once the deadline has passed"""
+    with MockEverestServer() as server:
+        api = EverestApi(server.base_url, 'id', 'secret')
+
+        with pytest.raises(DeadlineExceededException):
+            api.auth(deadline=Deadline(0.0))
+
+        assert server.request_count == 0
+
+
+class SlowBodyTransport(Transport):
+    """Transport whose body chunks each take a second to arrive"""
+
+    def __init__(self, clock, chunks):
+        self.clock = clock
+        self.chunks = chunks
+        self.closed = False
+
+    def send(self, method, url, body, headers, timeout, verify):
+        return TransportResponse(200, {}, b''.join(self.chunks))
+
+    def stream(self, method, url, body, headers, timeout, verify):
+        def reader(chunk_size):
+            for chunk in self.chunks:
+                self.clock.now += 1.0
+                yield chunk
+
+        return TransportResponse(200, {}, None, reader, self.close)
+
+    def close(self):
+        self.closed = True
+
+
+def test_deadline_covers_the_whole_body():
+    """Test the deadline is checked while a slowly trickling body is read"""
+    clock = FakeClock()
+    transport = SlowBodyTransport(clock, [b'{"services": [', b'1, 2', b']}'])
+    api = EverestApi('https://example.everst.io/api', 'id', 'secret', transport=transport)
+    api.set_token(MOCK_TOKEN)
+
+    assert api.post('/services', deadline=Deadline(5.0, clock)).get_data() == {'services': [1, 2]}
+
+    with pytest.raises(DeadlineExceededException):
+        api.post('/services', deadline=Deadline(1.5, clock))
+    assert transport.closed is True
+    assert api.get_instrumentation().snapshot()['endpoints']['services']['errors'] == 1
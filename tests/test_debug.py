@@ -0,0 +1,93 @@
+"""
+Tests for DebugLogger and StructuredFormatter
+"""
+
+import json
+import logging
+
+from everest_api import DebugLogger
+from everest_api.debug import StructuredFormatter, REDACTED
+
+
+class ListHandler(logging.Handler):
+    """Handler collecting formatted records"""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def make_logger(name):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_sampling():
+    """Test that only one request in N is sampled"""
+    debug_logger = DebugLogger(make_logger('everest_test.sampling'), sample_rate=4)
+
+    sampled = [debug_logger.sample() for _ in range(12)]
+
+    assert sampled.count(True) == 3
+    assert sampled[0] is True
+
+
+def test_sampling_disabled_when_logger_not_enabled():
+    """Test that nothing is sampled when debug level is disabled"""
+    logger = make_logger('everest_test.disabled')
+    logger.setLevel(logging.INFO)
+    debug_logger = DebugLogger(logger)
+
+    assert debug_logger.sample() is False
+
+
+def test_redaction_and_truncation():
+    """Test secrets are masked and large bodies truncated"""
+    formatter = StructuredFormatter(max_body_length=60)
+    record = logging.LogRecord('everest', logging.DEBUG, __file__, 1, 'request', None, None)
+    record.everest = {
+        'method': 'POST',
+        'headers': {'Authorization': 'Bearer abc', 'Content-Type': 'text/plain'},
+        'body': json.dumps({'client_id': 'id', 'client_secret': 's3cr3t', 'pad': 'x' * 200}),
+    }
+
+    entry = json.loads(formatter.format(record))
+
+    assert entry['event'] == 'request'
+    assert entry['headers']['Authorization'] == REDACTED
+    assert entry['headers']['Content-Type'] == 'text/plain'
+    assert 's3cr3t' not in entry['body']
+    assert REDACTED in entry['body']
+    assert 'chars truncated' in entry['body']
+
+
+def test_background_listener():
+    """Test records are delivered through the background queue"""
+    handler = ListHandler()
+    debug_logger = DebugLogger(make_logger('everest_test.background'))
+    debug_logger.start_background([handler])
+
+    debug_logger.log_response('POST', 'https://x/api/auth', 200, {}, '{"token": "abc"}', 0.01)
+    debug_logger.close()
+
+    assert len(handler.lines) == 1
+    entry = json.loads(handler.lines[0])
+    assert entry['status_code'] == 200
+    assert 'abc' not in entry['body']
+
+
+def test_default_logger_leaves_package_logger_alone():
+    """Test debug=True does not change the level or propagation of the package logger"""
+    package_logger = logging.getLogger('everest_api')
+    level, propagate = package_logger.level, package_logger.propagate
+
+    debug_logger = DebugLogger.default()
+
+    assert debug_logger.get_logger().name == 'everest_api.debug'
+    assert debug_logger.get_logger().isEnabledFor(logging.DEBUG)
+    assert (package_logger.level, package_logger.propagate) == (level, propagate)
@@ -0,0 +1,108 @@
+"""
+Tests for MissionExporter
+"""
+
+import io
+import json
+
+import pytest
+from everest_api import (
+    CircuitBreakerRegistry, CircuitOpenException, EverestApi, EverestApiException, MissionExporter,
+    RateLimiter, Transport, export
+)
+from everest_api.testing import MOCK_TOKEN, MockEverestServer
+
+
+def started_only(mission):
+    """Transform run in the workers: keep started missions, drop their comment."""
+    if mission['status'] != 'started':
+        return None
+    return {'ref': mission['ref'], 'status': mission['status']}
+
+
+@pytest.fixture
+def server():
+    with MockEverestServer(mission_count=23) as server:
+        yield server
+
+
+def test_batches_cover_the_account_in_order(server):
+    """Test shards are fetched by workers and returned as ordered NDJSON batches"""
+    api = EverestApi(server.base_url, 'client', 'secret')
+    exporter = MissionExporter(api, processes=2, shard_size=5, page_size=2)
+
+    batches = list(exporter.batches())
+    assert [(b.start, b.end, b.mission_count) for b in batches] == [
+        (0, 5, 5), (5, 10, 5), (10, 15, 5), (15, 20, 5), (20, 23, 3),
+    ]
+    assert api.get_token() is not None
+    assert isinstance(batches[0].data, bytes)
+
+    missions = [m for batch in batches for m in batch.missions()]
+    assert missions == [server.mission(i) for i in range(23)]
+
+
+def test_workers_share_the_parent_token(server):
+    """Test workers send the parent's token instead of authenticating"""
+    # Without a secret, authenticating would fail
+    api = EverestApi(server.base_url, 'client', '').set_token(MOCK_TOKEN)
+    assert len(list(MissionExporter(api, processes=2, shard_size=10).missions())) == 23
+
+
+def test_export_range_with_transform(server):
+    """Test a range export writes transformed NDJSON lines"""
+    api = EverestApi(server.base_url, 'client', 'secret')
+    api.auth()
+    exporter = MissionExporter(api, processes=2, shard_size=4, transform=started_only)
+
+    output = io.BytesIO()
+    assert exporter.export(output, start=2, end=14) == 3
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {'ref': f'MOCK-{i:06d}', 'status': 'started'} for i in (2, 6, 10)
+    ]
+    assert list(exporter.missions(start=30)) == []
+
+
+def test_worker_errors_propagate(server):
+    """Test a failing shard request fails the export"""
+    api = EverestApi(server.base_url, 'client', 'secret').set_token('expired')
+
+    with pytest.raises(EverestApiException, match='401'):
+        list(MissionExporter(api, processes=1, shard_size=10).batches())
+
+
+def test_workers_inherit_client_settings(server):
+    """Test workers get the compression settings, a rate share and breaker settings"""
+    api = EverestApi(server.base_url, 'client', 'secret').set_token(MOCK_TOKEN)
+    api.set_compression(threshold=10, encoding='deflate', level=1)
+    api.set_rate_limiter(RateLimiter(100, burst=8))
+    api.set_circuit_breakers(CircuitBreakerRegistry(window_size=5).configure('/missions', minimum_calls=2))
+
+    export._init_worker(export._client_settings(api, 4), None)
+    worker = export._worker_api
+    assert (worker._compression_threshold, worker._compression_encoding) == (10, 'deflate')
+    assert worker._rate_limiter.snapshot()['rate'] == 25
+    assert worker._rate_limiter.snapshot()['burst'] == 2
+    assert worker._circuit_breakers.get('missions')._minimum_calls == 2
+    assert worker._circuit_breakers.get('services')._window.maxlen == 5
+
+    assert len(list(MissionExporter(api, processes=2, shard_size=10).missions())) == 23
+
+
+def test_custom_transports_are_rejected(server):
+    """Test clients whose transport cannot be rebuilt in the workers are refused"""
+    api = EverestApi(server.base_url, 'client', 'secret', transport=Transport()).set_token(MOCK_TOKEN)
+
+    with pytest.raises(EverestApiException, match='Transport'):
+        list(MissionExporter(api, processes=1).batches())
+
+
+def test_worker_breaker_errors_reach_the_parent(server):
+    """Test a breaker opening in a worker raises CircuitOpenException in the parent"""
+    api = EverestApi(server.base_url, 'client', 'secret').set_token(MOCK_TOKEN)
+    api.set_circuit_breakers(CircuitBreakerRegistry(slow_call_threshold=0, minimum_calls=1, window_size=1))
+
+    with pytest.raises(CircuitOpenException) as excinfo:
+        list(MissionExporter(api, processes=1, shard_size=50, page_size=10).batches())
+    assert excinfo.value.endpoint == 'missions'
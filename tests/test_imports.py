@@ -0,0 +1,69 @@
+"""
+Tests for lazy imports of the everest_api package
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import everest_api
+from everest_api.testing import MockEverestServer
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return which heavy modules it loaded."""
+    script = code + (
+        '\nimport json, sys\n'
+        'print(json.dumps(sorted(m for m in sys.modules'
+        ' if m.split(".")[0] in ("requests", "urllib3", "logging", "concurrent", "everest_api"))))'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script], check=True, stdout=subprocess.PIPE, universal_newlines=True
+    ).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+def test_import_does_not_load_submodules_or_requests():
+    """Test importing the package loads nothing but the package itself"""
+    assert loaded_modules('import everest_api') == {'everest_api'}
+
+    modules = loaded_modules(
+        'from everest_api import EverestApiResponse\n'
+        'EverestApiResponse(\'{"event": "mission.updated"}\', 200, {}).get_data()'
+    )
+    assert 'everest_api.response' in modules
+    assert not modules & {'requests', 'urllib3', 'everest_api.client', 'everest_api.transport'}
+
+
+def test_requests_is_imported_on_first_request():
+    """Test creating a client is cheap and requests loads when a request is sent"""
+    modules = loaded_modules(
+        'from everest_api import EverestApi\n'
+        'EverestApi("http://127.0.0.1:1/api", "id", "secret")'
+    )
+    assert 'everest_api.client' in modules
+    assert not modules & {'requests', 'urllib3', 'logging', 'concurrent'}
+
+    with MockEverestServer() as server:
+        modules = loaded_modules(
+            'from everest_api import EverestApi\n'
+            f'assert EverestApi({server.base_url!r}, "id", "secret").auth().is_success()'
+        )
+    assert {'requests', 'urllib3'} <= modules
+
+
+def test_public_names_and_submodules_resolve():
+    """Test every exported name and submodule is reachable as a package attribute"""
+    assert sorted(everest_api.__all__) == sorted(everest_api._EXPORTS)
+    for name in everest_api.__all__:
+        value = getattr(everest_api, name)
+        assert value.__module__.startswith('everest_api.')
+        assert name in dir(everest_api)
+
+    assert everest_api.testing.MockEverestServer is MockEverestServer
+    assert everest_api.MissionPoller is everest_api.polling.MissionPoller
+
+    with pytest.raises(AttributeError, match='missing'):
+        everest_api.missing
@@ -0,0 +1,107 @@
+"""
+Tests for MissionPoller
+"""
+
+import pytest
+from everest_api import EverestApi, MissionPoller
+from everest_api.polling import diff_missions
+from everest_api.testing import MockEverestServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+# Missions of the mock server start at 1760000000 + index * 600
+FAR_FROM_START = 1760000000 - 86400
+
+
+@pytest.fixture
+def api():
+    with MockEverestServer(mission_count=10) as server:
+        with EverestApi(server.base_url, 'client', 'secret') as client:
+            client.auth()
+            client.server = server
+            yield client
+
+
+def test_diff_missions():
+    """Test field-level diffs"""
+    assert diff_missions({'status': 'pending', 'a': 1}, {'status': 'started', 'a': 1, 'b': 2}) == {
+        'status': ('pending', 'started'),
+        'b': (None, 2),
+    }
+    assert diff_missions({'a': 1}, {'a': 1}) == {}
+
+
+def test_polls_only_due_refs_and_emits_changes(api):
+    """Test refs are polled at status-based intervals and changes are emitted"""
+    clock = FakeClock()
+    poller = MissionPoller(api, clock=clock, wall_clock=lambda: FAR_FROM_START)
+    # Statuses cycle pending, accepted, started, completed
+    poller.track_many(['MOCK-000000', 'MOCK-000001', 'MOCK-000002', 'MOCK-000003'])
+
+    assert poller.poll() == []  # baseline
+    assert poller.fetch_count == 4
+    assert 'MOCK-000003' not in poller  # completed missions are dropped
+    assert poller.next_due() == pytest.approx(30.0)
+
+    api.server.set_mission_fields('MOCK-000002', {'comment': 'Driver on the way'})
+    clock.now += 30
+    changes = poller.poll()
+    assert poller.fetch_count == 5
+    assert [(c.ref, c.changes) for c in changes] == [
+        ('MOCK-000002', {'comment': ('', 'Driver on the way')}),
+    ]
+
+    clock.now += 30
+    assert poller.poll() == []
+    assert poller.fetch_count == 6
+
+    api.server.set_mission_fields('MOCK-000001', {'status': 'canceled'})
+    clock.now += 60
+    changes = poller.poll()
+    assert poller.fetch_count == 8
+    assert changes[0].ref == 'MOCK-000001'
+    assert changes[0].changes == {'status': ('accepted', 'canceled')}
+    assert changes[0].previous['status'] == 'accepted'
+    assert sorted(poller.tracked()) == ['MOCK-000000', 'MOCK-000002']
+
+
+def test_imminent_missions_poll_faster(api):
+    """Test missions close to their start date are polled more often"""
+    poller = MissionPoller(api, imminent_window=900, imminent_interval=15,
+                           wall_clock=lambda: 1760000000 - 300)
+
+    assert poller.interval_for({'status': 'pending', 'start_date': 1760000000}) == 15
+    assert poller.interval_for({'status': 'pending', 'start_date': 1760003600}) == 300
+    assert poller.interval_for({'status': 'unknown'}) == 120
+
+
+def test_tracked_snapshot_missing_refs_and_run(api):
+    """Test known snapshots are diffed, missing missions reported and run() stops"""
+    clock = FakeClock()
+    poller = MissionPoller(api, clock=clock, wall_clock=lambda: FAR_FROM_START,
+                           terminal_statuses=['started'])
+
+    known = dict(api.post('/missions/get', {'ref': 'MOCK-000000'}).get_data()['mission'])
+    known['status'] = 'draft'
+    poller.track('MOCK-000000', known)
+    poller.track('MOCK-999999')
+    assert poller.next_due() == 0.0
+
+    api.server.set_mission_fields('MOCK-000000', {'status': 'started'})
+    events = []
+
+    def sleep(seconds):
+        clock.now += seconds
+
+    poller.run(events.append, sleep=sleep)
+
+    assert [(e.ref, e.mission is None) for e in events] == [('MOCK-999999', True), ('MOCK-000000', False)]
+    assert events[1].changes == {'status': ('draft', 'started')}
+    assert len(poller) == 0
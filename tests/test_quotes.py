@@ -0,0 +1,108 @@
+"""
+Tests for quote matrices
+"""
+
+import pytest
+from everest_api import EverestApi, PriorityScheduler, Quote, QuoteCache
+from everest_api.testing import MockEverestServer, MOCK_TOKEN
+from everest_api.transport import Transport, TransportResponse
+
+
+ADDRESSES = ['18 Boulevard des Batignolles, 75017 Paris', '5 Rue de Rivoli, 75004 Paris']
+SLOTS = [1760000000, 1760003600, 1760007200]
+
+
+def test_quote_matrix_dedups_and_prices():
+    """Test every distinct combination is quoted once"""
+    with MockEverestServer(service_count=3) as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            api.auth()
+            sent = server.request_count
+
+            matrix = api.quote_matrix(ADDRESSES + ADDRESSES[:1], [1, 2, 4, 2], SLOTS)
+
+            assert len(matrix) == 2 * 3 * 3
+            assert matrix.lookups == 18
+            assert server.request_count - sent == 18
+
+            quote = matrix.get(ADDRESSES[1], 2, SLOTS[2])
+            assert quote.handled is True
+            assert quote.total_ttc == pytest.approx(12.0)
+            assert matrix[(ADDRESSES[0], 4, SLOTS[0])] == Quote(False)
+            assert matrix.get('elsewhere', 1, SLOTS[0]) is None
+            assert list(matrix)[0] == (ADDRESSES[0], 1, SLOTS[0])
+
+            options = matrix.options(ADDRESSES[0], SLOTS[1])
+            assert [key[1] for key, _ in options] == [1, 2]
+            assert matrix.to_rows()[0]['total_ttc'] == pytest.approx(10.8)
+            assert matrix.errors() == {}
+
+
+def test_quote_matrix_uses_cache():
+    """Test cached quotes are reused and only new combinations are sent"""
+    with MockEverestServer() as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            api.auth()
+            cache = QuoteCache(ttl=60)
+
+            first = api.quote_matrix(ADDRESSES, [1, 2], SLOTS, cache=cache)
+            sent = server.request_count
+            second = api.quote_matrix(ADDRESSES, [1, 2, 3], SLOTS, cache=cache)
+
+            assert first.lookups == 12
+            assert second.cache_hits == 12
+            assert second.lookups == 6
+            assert server.request_count - sent == 6
+            assert len(cache) == 18
+
+
+def test_quote_matrix_reports_failures():
+    """Test failed lookups are reported per combination and not cached"""
+    with MockEverestServer() as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            cache = QuoteCache()
+            matrix = api.quote_matrix(ADDRESSES[:1], [1], SLOTS[:1], cache=cache)
+
+            assert matrix.errors() == {(ADDRESSES[0], 1, SLOTS[0]): 'Unauthorized'}
+            assert len(cache) == 0
+
+
+class ErrorBodyTransport(Transport):
+    """Transport answering lookups with a 2xx error body"""
+
+    def send(self, method, url, body, headers, timeout, verify):
+        return TransportResponse(200, {}, b'{"error": "Address service unavailable"}')
+
+
+def test_error_bodies_are_not_cached():
+    """Test a 2xx body with an error field is reported and not cached as not handled"""
+    api = EverestApi('https://example.test/api', 'client', 'secret', transport=ErrorBodyTransport())
+    api.set_token(MOCK_TOKEN)
+    cache = QuoteCache()
+
+    matrix = api.quote_matrix(ADDRESSES[:1], [1], SLOTS[:1], cache=cache)
+
+    assert matrix.errors() == {(ADDRESSES[0], 1, SLOTS[0]): 'Address service unavailable'}
+    assert len(cache) == 0
+
+
+def test_cache_expiry_and_priority_view():
+    """Test cached quotes expire and views pass their priority"""
+    now = [0.0]
+    cache = QuoteCache(ttl=10, max_entries=2, clock=lambda: now[0])
+    cache.put(('a', 1, 1), Quote(True, 12.0))
+    cache.put(('a', 1, 2), Quote(True, 13.0))
+    cache.put(('a', 1, 3), Quote(True, 14.0))
+    assert cache.get(('a', 1, 1)) is None
+    assert cache.get(('a', 1, 2)).total_ttc == 13.0
+    now[0] = 10.0
+    assert cache.get(('a', 1, 2)) is None
+
+    with MockEverestServer() as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            api.auth()
+            scheduler = PriorityScheduler(max_concurrent=4)
+            api.set_scheduler(scheduler)
+
+            api.with_priority('bulk').quote_matrix(ADDRESSES, [1], SLOTS)
+            assert scheduler.snapshot()['lanes']['bulk']['admitted'] == 6
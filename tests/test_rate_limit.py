@@ -0,0 +1,102 @@
+"""
+Tests for RateLimiter and client integration
+"""
+
+import pytest
+from everest_api import (
+    CircuitOpenException, Deadline, DeadlineExceededException, EverestApi, RateLimiter
+)
+from everest_api.circuit_breaker import CircuitBreakerRegistry
+from everest_api.transport import Transport, TransportResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StubTransport(Transport):
+    def send(self, method, url, body, headers, timeout, verify):
+        return TransportResponse(200, {}, b'{}')
+
+
+def test_burst_then_rate():
+    """Test the bucket allows a burst, then refills at the configured rate"""
+    clock = FakeClock()
+    limiter = RateLimiter(10, burst=3, clock=clock, sleep=clock.sleep)
+
+    assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    clock.now += 0.1
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+
+    snapshot = limiter.snapshot()
+    assert snapshot['acquired'] == 4
+    assert snapshot['rejected'] == 2
+
+
+def test_acquire_waits_in_order():
+    """Test waiting callers reserve consecutive slots"""
+    clock = FakeClock()
+    limiter = RateLimiter(10, burst=1, clock=clock, sleep=lambda seconds: None)
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(0.1)
+    assert limiter.acquire() == pytest.approx(0.2)
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.1)
+    assert limiter.snapshot()['delayed'] == 2
+
+
+def test_client_rate_limiting():
+    """Test clients wait for tokens and respect deadlines"""
+    clock = FakeClock()
+    limiter = RateLimiter(2, burst=1, clock=clock, sleep=clock.sleep)
+    api = EverestApi('https://example.test/api', 'client', 'secret', transport=StubTransport())
+    api.set_rate_limiter(limiter)
+
+    api.post('/services')
+    api.post('/services')
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    with pytest.raises(DeadlineExceededException):
+        api.post('/services', deadline=Deadline(0.1))
+
+    snapshot = api.get_instrumentation().snapshot()
+    assert snapshot['counters']['rate_limit_wait_time'] == pytest.approx(0.5)
+    assert snapshot['rate_limiter']['acquired'] == 2
+
+
+def test_open_breaker_does_not_use_tokens():
+    """Test the breaker is checked before the rate limiter and keeps its trial slot"""
+    clock = FakeClock()
+    limiter = RateLimiter(1, burst=1, clock=clock, sleep=clock.sleep)
+    breakers = CircuitBreakerRegistry(window_size=1, minimum_calls=1, open_timeout=10, clock=clock)
+    api = EverestApi('https://example.test/api', 'client', 'secret', transport=StubTransport())
+    api.set_rate_limiter(limiter).set_circuit_breakers(breakers)
+
+    breakers.get('services').record(False, 0.1)
+    with pytest.raises(CircuitOpenException):
+        api.post('/services')
+    assert limiter.snapshot()['acquired'] == 0
+
+    # A trial call that times out waiting for a token was never sent
+    clock.now = 10
+    assert limiter.try_acquire() is True
+    with pytest.raises(DeadlineExceededException):
+        api.post('/services', deadline=Deadline(0.1))
+    assert breakers.get('services').get_state() == 'half_open'
+
+    clock.now = 11
+    assert api.post('/services').is_success() is True
+    assert breakers.get('services').get_state() == 'closed'
@@ -61,3 +61,32 @@ def test_response_to_dict():
     assert 'status_code' in result
     assert 'headers' in result
     assert result['status_code'] == 200
+
+
+def test_response_headers_not_copied():
+    """Test headers are wrapped without copying and indexed lazily"""
+    headers = {'Content-Type': 'application/json', 'X-RateLimit-Remaining': '42'}
+    response = EverestApiResponse('{}', 200, headers)
+
+    assert response.get_headers() is headers
+    assert response.get_header('x-ratelimit-remaining') == '42'
+    assert response.get_header('CONTENT-TYPE') == 'application/json'
+
+
+def test_response_case_insensitive_mapping_used_directly():
+    """Test case-insensitive header mappings are looked up without an index copy"""
+    requests = pytest.importorskip('requests')
+    headers = requests.structures.CaseInsensitiveDict({'Retry-After': '3'})
+    response = EverestApiResponse('{}', 200, headers)
+
+    assert response.get_header('retry-after') == '3'
+    assert response._header_index is headers
+
+
+def test_response_uses_slots():
+    """Test responses do not carry a per-instance __dict__"""
+    response = EverestApiResponse('{}', 200, {})
+
+    assert not hasattr(response, '__dict__')
+    with pytest.raises(AttributeError):
+        response.extra = 1
@@ -0,0 +1,146 @@
+"""
+Tests for PriorityScheduler and client integration
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from everest_api import (
+    CircuitOpenException, Deadline, DeadlineExceededException, EverestApi, PriorityScheduler
+)
+from everest_api.circuit_breaker import CircuitBreakerRegistry
+from everest_api.testing import MockEverestServer, MOCK_TOKEN
+
+
+def _wait_until(condition, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, 'condition not reached'
+        time.sleep(0.001)
+
+
+def test_weighted_lane_order():
+    """Test interactive requests jump queued bulk work without starving it"""
+    scheduler = PriorityScheduler(max_concurrent=1, weights={'interactive': 2, 'bulk': 1})
+    assert scheduler.acquire('bulk') == 0.0
+
+    order = []
+    lock = threading.Lock()
+
+    def request(name, priority):
+        scheduler.acquire(priority)
+        with lock:
+            order.append(name)
+        scheduler.release()
+
+    threads = []
+    queued = 0
+    for name, priority in [('b1', 'bulk'), ('b2', 'bulk'), ('b3', 'bulk'),
+                           ('i1', 'interactive'), ('i2', 'interactive'),
+                           ('i3', 'interactive'), ('i4', 'interactive')]:
+        thread = threading.Thread(target=request, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        queued += 1
+        _wait_until(lambda: sum(
+            lane['queued'] for lane in scheduler.snapshot()['lanes'].values()
+        ) == queued)
+
+    scheduler.release()
+    for thread in threads:
+        thread.join(2)
+
+    # Two interactive slots for every bulk slot while both lanes wait, FIFO within a lane
+    assert order == ['i1', 'b1', 'i2', 'i3', 'b2', 'i4', 'b3']
+    snapshot = scheduler.snapshot()
+    assert snapshot['active'] == 0
+    assert snapshot['lanes']['bulk']['admitted'] == 4
+    assert snapshot['lanes']['interactive']['admitted'] == 4
+
+
+def test_acquire_timeout_and_unknown_priority():
+    """Test waits are bounded and priorities validated"""
+    scheduler = PriorityScheduler(max_concurrent=1)
+    scheduler.acquire()
+
+    with pytest.raises(TimeoutError):
+        scheduler.acquire('bulk', timeout=0.01)
+    assert scheduler.snapshot()['lanes']['bulk']['queued'] == 0
+
+    with pytest.raises(ValueError):
+        scheduler.acquire('urgent')
+
+    scheduler.release()
+    assert scheduler.acquire('bulk', timeout=0.01) == 0.0
+
+
+def test_interactive_calls_skip_bulk_queue():
+    """Test checkout calls are not starved by a bulk fan-out"""
+    with MockEverestServer(latency=0.05) as server:
+        with EverestApi(server.base_url, 'client', 'secret') as api:
+            api.auth()
+            api.set_scheduler(PriorityScheduler(max_concurrent=2))
+            bulk = api.with_priority('bulk')
+            assert bulk.get_priority() == 'bulk'
+            assert bulk.get_token() == api.get_token()
+
+            with ThreadPoolExecutor(max_workers=20) as executor:
+                futures = [
+                    executor.submit(bulk.post, '/missions/get', {'ref': f'MOCK-{i:06d}'})
+                    for i in range(20)
+                ]
+                _wait_until(lambda: api.get_instrumentation().snapshot()['scheduler']
+                            ['lanes']['bulk']['queued'] >= 10)
+
+                started = time.perf_counter()
+                check = api.post('/is-handled-address', {'address': 'Paris', 'service_id': 1},
+                                 priority='interactive')
+                interactive_elapsed = time.perf_counter() - started
+
+                assert all(f.result().is_success() for f in futures)
+
+            assert check.get_data()['success'] is True
+            # Queued behind the bulk calls it would have taken about 0.5s
+            assert interactive_elapsed < 0.2
+
+            missions = list(bulk.stream_missions({'limit_start': 0, 'limit_end': 10}))
+            assert len(missions) == 10
+            assert api.get_instrumentation().snapshot()['scheduler']['active'] == 0
+
+
+def test_deadline_bounds_scheduler_wait():
+    """Test a deadline expiring in the queue raises DeadlineExceededException"""
+    scheduler = PriorityScheduler(max_concurrent=1)
+    api = EverestApi('https://example.test/api', 'client', 'secret')
+    api.set_scheduler(scheduler)
+    scheduler.acquire()
+
+    with pytest.raises(DeadlineExceededException):
+        api.post('/services', deadline=Deadline(0.02))
+
+
+def test_open_breaker_does_not_queue():
+    """Test the breaker is checked before waiting for a slot and keeps its trial slot"""
+    with MockEverestServer() as server:
+        scheduler = PriorityScheduler(max_concurrent=1)
+        breakers = CircuitBreakerRegistry(window_size=1, minimum_calls=1, open_timeout=0.05)
+        api = EverestApi(server.base_url, 'client', 'secret').set_token(MOCK_TOKEN)
+        api.set_scheduler(scheduler).set_circuit_breakers(breakers)
+
+        breakers.get('services').record(False, 0.1)
+        scheduler.acquire()
+        with pytest.raises(CircuitOpenException):
+            api.post('/services', deadline=Deadline(5.0))
+        assert scheduler.snapshot()['lanes']['interactive']['queued'] == 0
+
+        # A trial call that times out in the queue was never sent
+        _wait_until(lambda: breakers.get('services').get_state() == 'half_open')
+        with pytest.raises(DeadlineExceededException):
+            api.post('/services', deadline=Deadline(0.02))
+        assert server.request_count == 0
+
+        scheduler.release()
+        assert api.post('/services').is_success() is True
+        assert breakers.get('services').get_state() == 'closed'
@@ -0,0 +1,114 @@
+"""
+Tests for incremental JSON array parsing and EverestApi.stream_missions
+"""
+
+import json
+
+import pytest
+from everest_api import EverestApi, EverestApiException
+from everest_api.streaming import JsonArrayStream, iter_json_array
+from everest_api.testing import MockEverestServer, MOCK_TOKEN
+from everest_api.transport import Transport, TransportResponse
+
+
+DOCUMENT = {
+    'total': 3,
+    'meta': {'nested': [1, {'tricky': '}]"\\'}], 'escaped': 'a\\"b'},
+    'missions': [
+        {'ref': f'R{i}', 'comment': 'é"\\}' * i, 'values': [i, None, True, -1.5e3]}
+        for i in range(20)
+    ] + [1, 'text', None, False],
+    'after': [1, 2],
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 20])
+def test_elements_across_chunk_boundaries(chunk_size):
+    """Test elements are decoded whatever the chunk boundaries"""
+    body = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode('utf-8')
+
+    assert list(iter_json_array(chunked(body, chunk_size), 'missions')) == DOCUMENT['missions']
+
+
+NUMBERS = [1, -0.0025, 12.5e-3, -7E+2, 0, 1234567, 3.25, -1, 2e10]
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 8))
+@pytest.mark.parametrize('separator', [', ', ','])
+def test_numbers_across_chunk_boundaries(chunk_size, separator):
+    """Test numbers split after a digit, sign, dot or exponent are decoded whole"""
+    body = ('{"missions": [' + separator.join(json.dumps(n) for n in NUMBERS) + ']}').encode()
+
+    assert list(iter_json_array(chunked(body, chunk_size), 'missions')) == NUMBERS
+    assert list(iter_json_array(chunked(b'{"missions": [1, -0.0025]}', 3), 'missions')) == [1, -0.0025]
+
+
+def test_elements_are_yielded_incrementally():
+    """Test each element is returned as soon as it is complete"""
+    parser = JsonArrayStream('missions')
+
+    assert parser.feed(b'{"missions": [{"ref": "A"}, {"ref"') == [{'ref': 'A'}]
+    assert parser.feed(b': "B"}') == [{'ref': 'B'}]
+    assert parser.feed(b']}') == []
+    assert parser.done() is True
+    assert parser.found() is True
+
+
+def test_missing_key_and_empty_array():
+    """Test bodies without elements"""
+    assert list(iter_json_array([b'{"missions": []}'], 'missions')) == []
+
+    parser = JsonArrayStream('missions')
+    parser.feed(b'{"error": "nope"}')
+    parser.close()
+    assert parser.found() is False
+
+
+@pytest.mark.parametrize('body', [b'{"missions": [1, 2', b'[1, 2]', b'{"missions": {}}'])
+def test_invalid_bodies(body):
+    """Test truncated or unexpected bodies raise ValueError"""
+    with pytest.raises(ValueError):
+        list(iter_json_array([body], 'missions'))
+
+
+def test_stream_missions():
+    """Test streaming missions from the mock server"""
+    with MockEverestServer(mission_count=40, mission_padding=500) as server:
+        api = EverestApi(server.base_url, 'id', 'secret').set_token(MOCK_TOKEN)
+
+        missions = list(api.stream_missions({'limit_start': 5, 'limit_end': 35}, chunk_size=256))
+
+        assert [m['ref'] for m in missions] == [f'MOCK-{i:06d}' for i in range(5, 35)]
+        assert missions == api.post('/missions', {'limit_start': 5, 'limit_end': 35}).get_data()['missions']
+        assert api.get_instrumentation().snapshot()['endpoints']['missions']['requests'] == 2
+
+
+def test_stream_missions_error_status():
+    """Test API errors are raised while streaming"""
+    with MockEverestServer() as server:
+        api = EverestApi(server.base_url, 'id', 'secret')
+
+        with pytest.raises(EverestApiException) as excinfo:
+            list(api.stream_missions())
+
+        assert 'Unauthorized' in str(excinfo.value)
+
+
+class ErrorBodyTransport(Transport):
+    """Transport answering with a 2xx error body"""
+
+    def send(self, method, url, body, headers, timeout, verify):
+        return TransportResponse(200, {}, b'{"error": "Invalid limit range"}')
+
+
+def test_stream_missions_error_body():
+    """Test a successful status without a missions array is an error"""
+    api = EverestApi('https://example.everst.io/api', 'id', 'secret', transport=ErrorBodyTransport())
+    api.set_token(MOCK_TOKEN)
+
+    with pytest.raises(EverestApiException, match='no "missions" array'):
+        list(api.stream_missions({'limit_start': 10, 'limit_end': 0}))
@@ -0,0 +1,109 @@
+"""
+Tests for TenantClientPool
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from everest_api import EverestApiException, RateLimiter, TenantClientPool
+from everest_api.testing import MockEverestServer
+
+
+def test_lazy_auth_and_shared_connections():
+    """Test tenants authenticate on first use and share connections"""
+    with MockEverestServer(mission_count=10) as server:
+        with TenantClientPool(server.base_url, rate_limiter=RateLimiter(1000)) as pool:
+            for i in range(20):
+                pool.add_tenant(f'tenant-{i}', f'client-{i}', 'secret')
+
+            client = pool.client('tenant-0')
+            assert client.get_token() is None
+            assert server.request_count == 0
+
+            def fetch(i):
+                tenant = pool.client(f'tenant-{i % 20}')
+                return tenant.post('/missions/get', {'ref': 'MOCK-000001'}).get_data()
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(fetch, range(60)))
+
+            assert all(result['mission']['ref'] == 'MOCK-000001' for result in results)
+            snapshot = pool.snapshot()
+            assert snapshot['auths'] == 20
+            assert snapshot['rate_limiter']['acquired'] == 80
+            assert snapshot['tenant_metrics']['tenant-3']['endpoints']['missions/get']['requests'] == 3
+            assert server.connection_count <= 4
+
+
+def test_lru_eviction():
+    """Test idle tenants are evicted and re-authenticate on their next use"""
+    with MockEverestServer() as server:
+        with TenantClientPool(server.base_url, max_tenants=2) as pool:
+            for name in ('a', 'b', 'c'):
+                pool.add_tenant(name, name, 'secret')
+
+            pool.client('a').post('/services')
+            pool.client('b').post('/services')
+            pool.client('a').post('/services')
+            pool.client('c').post('/services')
+
+            assert 'a' in pool and 'c' in pool and 'b' not in pool
+            assert len(pool) == 2
+
+            pool.client('b').post('/services')
+            snapshot = pool.snapshot()
+            assert snapshot['evictions'] == 2
+            assert snapshot['auths'] == 4
+
+
+def test_reauth_on_rejected_token():
+    """Test a rejected token is replaced once"""
+    with MockEverestServer() as server:
+        with TenantClientPool(server.base_url) as pool:
+            pool.add_tenant('a', 'a', 'secret')
+            client = pool.client('a')
+            client.set_token('expired-token')
+
+            assert client.post('/services').is_success() is True
+            assert client.get_token() == 'mock-token'
+
+
+def test_unknown_tenant_and_failed_auth():
+    """Test unknown tenants and bad credentials raise errors"""
+    with MockEverestServer() as server:
+        loaded = {'late': ('late', 'secret'), 'broken': ('broken', '')}
+        with TenantClientPool(server.base_url, credentials=loaded.get) as pool:
+            with pytest.raises(EverestApiException):
+                pool.client('nobody')
+
+            assert pool.client('late').post('/services').is_success() is True
+
+            with pytest.raises(EverestApiException):
+                pool.client('broken').post('/services')
+
+
+def test_slow_credentials_loader_does_not_block_other_tenants():
+    """Test credentials are loaded without holding the pool lock"""
+    entered = threading.Event()
+    release = threading.Event()
+
+    def load(tenant_id):
+        entered.set()
+        release.wait(5)
+        return (tenant_id, 'secret')
+
+    with TenantClientPool('http://127.0.0.1:1/api', credentials=load) as pool:
+        pool.add_tenant('known', 'known', 'secret')
+        cached = pool.client('known')
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            first = executor.submit(pool.client, 'vault')
+            assert entered.wait(5)
+            second = executor.submit(pool.client, 'vault')
+
+            assert executor.submit(pool.client, 'known').result(timeout=2) is cached
+
+            release.set()
+            assert first.result(timeout=5) is second.result(timeout=5)
+        assert len(pool) == 2
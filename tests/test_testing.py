@@ -0,0 +1,58 @@
+"""
+Tests for MockEverestServer used against EverestApi
+"""
+
+import pytest
+from everest_api import EverestApi
+from everest_api.testing import MockEverestServer, MOCK_TOKEN
+
+
+@pytest.fixture
+def server():
+    with MockEverestServer(mission_count=30) as server:
+        yield server
+
+
+def test_auth_and_services(server):
+    """Test authentication and an authenticated call"""
+    api = EverestApi(server.base_url, 'client', 'secret')
+
+    assert api.post('/services').get_status_code() == 401
+
+    assert api.auth().is_success() is True
+    assert api.get_token() == MOCK_TOKEN
+
+    services = api.post('/services')
+    assert services.is_success() is True
+    assert len(services.get_data()['services']) == 5
+
+
+def test_missions_pagination(server):
+    """Test limit_start/limit_end ranges"""
+    api = EverestApi(server.base_url, 'client', 'secret').set_token(MOCK_TOKEN)
+
+    page = api.post('/missions', {'limit_start': 20, 'limit_end': 50}).get_data()['missions']
+
+    assert len(page) == 10
+    assert page[0]['ref'] == 'MOCK-000020'
+
+
+def test_mission_get_and_update(server):
+    """Test mission lookup and field overrides"""
+    api = EverestApi(server.base_url, 'client', 'secret').set_token(MOCK_TOKEN)
+
+    api.post('/missions/update', {'ref': 'MOCK-000003', 'comment': 'updated'})
+    mission = api.post('/missions/get', {'ref': 'MOCK-000003'}).get_data()['mission']
+
+    assert mission['comment'] == 'updated'
+    assert api.post('/missions/get', {'ref': 'NOPE'}).get_status_code() == 404
+
+
+def test_is_handled_address(server):
+    """Test address eligibility and pricing"""
+    api = EverestApi(server.base_url, 'client', 'secret').set_token(MOCK_TOKEN)
+
+    data = api.post('/is-handled-address', {'address': 'Paris', 'service_id': 2}).get_data()
+
+    assert data['success'] is True
+    assert data['price']['total_ttc'] > 0
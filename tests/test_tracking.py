@@ -0,0 +1,142 @@
+"""
+Tests for TrackedMission and MissionUpdater
+"""
+
+import pytest
+from everest_api import (
+    EverestApi, EverestApiException, EverestApiResponse, MissionUpdater, TrackedMission
+)
+from everest_api.testing import MockEverestServer
+
+
+@pytest.fixture
+def api():
+    with MockEverestServer(mission_count=10) as server:
+        with EverestApi(server.base_url, 'client', 'secret') as client:
+            client.auth()
+            client.server = server
+            yield client
+
+
+def test_save_sends_only_changed_fields(api):
+    """Test saves send the ref and the changed fields only"""
+    mission = TrackedMission.load(api, 'MOCK-000001')
+    assert mission.save() is None
+    assert not mission.is_dirty()
+
+    mission['comment'] = 'Ring twice'
+    mission['address_end'] = mission['address_end']
+    assert mission.changes() == {'comment': 'Ring twice'}
+
+    response = mission.save()
+    assert response.is_success()
+    assert api.server.updates == [{'ref': 'MOCK-000001', 'comment': 'Ring twice'}]
+    assert not mission.is_dirty()
+    assert mission.save() is None
+
+    fetched = api.post('/missions/get', {'ref': 'MOCK-000001'}).get_data()['mission']
+    assert fetched['comment'] == 'Ring twice'
+
+    with pytest.raises(EverestApiException):
+        mission['ref'] = 'OTHER'
+    with pytest.raises(EverestApiException):
+        TrackedMission.load(api, 'MOCK-999999')
+
+
+def test_error_body_leaves_changes_unsaved(api):
+    """Test a 2xx response with an error body does not count as saved"""
+    mission = TrackedMission.load(api, 'MOCK-000002')
+    mission['comment'] = 'Ring twice'
+
+    api.server.set_error('missions/update', 'Mission is locked')
+    response = mission.save()
+    assert response.is_success() and response.has_error()
+    assert mission.changes() == {'comment': 'Ring twice'}
+
+    api.server.set_error('missions/update', None)
+    assert mission.save().has_error() is False
+    assert not mission.is_dirty()
+    assert api.server.updates == [{'ref': 'MOCK-000002', 'comment': 'Ring twice'}]
+
+
+def test_nested_changes_and_discard():
+    """Test in-place changes of nested values are detected and can be reverted"""
+    mission = TrackedMission(None, {'ref': 'REF', 'packages': [{'weight': 1}]})
+    mission['packages'][0]['weight'] = 2
+    assert mission.changes() == {'packages': [{'weight': 2}]}
+
+    mission.discard()
+    assert mission['packages'] == [{'weight': 1}]
+    assert not mission.is_dirty()
+
+
+def test_updater_coalesces_updates_per_ref(api):
+    """Test pending updates of the same ref are merged into one request"""
+    updater = MissionUpdater(api)
+    updater.update('MOCK-000001', {'comment': 'first', 'address_end_phone': '0600000000'})
+    updater.update('MOCK-000002', {'comment': 'other'})
+    updater.update('MOCK-000001', {'comment': 'second'})
+    assert len(updater) == 2
+    assert updater.coalesced_count == 1
+
+    mission = TrackedMission.load(api, 'MOCK-000003')
+    mission['comment'] = 'queued'
+    mission.queue(updater)
+    assert not mission.is_dirty()
+
+    responses = updater.flush()
+    assert sorted(responses) == ['MOCK-000001', 'MOCK-000002', 'MOCK-000003']
+    assert len(api.server.updates) == 3
+    assert {'ref': 'MOCK-000001', 'comment': 'second', 'address_end_phone': '0600000000'} in api.server.updates
+    assert len(updater) == 0
+    assert updater.flush() == {}
+
+
+def test_rejected_updates_are_dropped(api):
+    """Test updates rejected by the API are returned and not retried"""
+    updater = MissionUpdater(api)
+    updater.update('MOCK-999999', {'comment': 'lost', 'status': 'accepted'})
+    updater.update('MOCK-000001', {'comment': 'saved'})
+
+    responses = updater.flush()
+    assert responses['MOCK-999999'].get_status_code() == 404
+    assert responses['MOCK-000001'].is_success()
+    assert updater.pending() == {}
+    assert api.server.updates == [{'ref': 'MOCK-000001', 'comment': 'saved'}]
+
+
+class UnavailableApi:
+    """Client whose updates fail with a transport error or a server error"""
+
+    def __init__(self, updater=None):
+        self.updater = updater
+
+    def post(self, endpoint, params, deadline=None):
+        if self.updater is not None:
+            # A newer value queued while the request is in flight
+            self.updater.update(params['ref'], {'comment': 'newer'})
+        if params['ref'] == 'REF-1':
+            raise EverestApiException('Request error: connection reset')
+        return EverestApiResponse('{"error": "Service unavailable"}', 503, {})
+
+
+def test_failed_updates_are_requeued():
+    """Test fields of transient failures are retried without overwriting newer values"""
+    api = UnavailableApi()
+    updater = MissionUpdater(api)
+    with updater:
+        updater.update('REF-1', {'comment': 'lost', 'status': 'accepted'})
+        updater.update('REF-2', {'comment': 'busy'})
+    assert updater.pending() == {
+        'REF-1': {'comment': 'lost', 'status': 'accepted'},
+        'REF-2': {'comment': 'busy'},
+    }
+
+    api.updater = updater
+    responses = updater.flush()
+    assert list(responses) == ['REF-2']
+    assert responses['REF-2'].get_status_code() == 503
+    assert updater.pending() == {
+        'REF-1': {'comment': 'newer', 'status': 'accepted'},
+        'REF-2': {'comment': 'newer'},
+    }
@@ -0,0 +1,113 @@
+"""
+Tests for transports and record/replay cassettes
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from everest_api import EverestApi, EverestApiException, Http2Transport, RequestsTransport
+from everest_api.testing import MockEverestServer
+from everest_api.transport import RecordingTransport, ReplayTransport, request_key
+
+
+def test_request_key():
+    """Test request keys depend on method, URL and body"""
+    key = request_key('POST', 'https://x/api/missions', b'{}')
+
+    assert len(key) == 8
+    assert key == request_key('post', 'https://x/api/missions', b'{}')
+    assert key != request_key('POST', 'https://x/api/missions', b'{"limit_end": 5}')
+    assert key != request_key('GET', 'https://x/api/missions', b'{}')
+
+
+def test_record_and_replay(tmp_path):
+    """Test recorded responses are served offline"""
+    cassette = str(tmp_path / 'missions.cassette')
+
+    with MockEverestServer(mission_count=10) as server:
+        base_url = server.base_url
+        with EverestApi(base_url, 'client', 'secret', transport=RecordingTransport(cassette)) as api:
+            api.auth()
+            recorded = api.post('/missions/get', {'ref': 'MOCK-000004'})
+            api.post('/missions/get', {'ref': 'NOPE'})
+
+    with EverestApi(base_url, 'client', 'secret', transport=ReplayTransport(cassette)) as api:
+        assert len(api.get_transport()) == 3
+        assert api.auth().is_success() is True
+
+        replayed = api.post('/missions/get', {'ref': 'MOCK-000004'})
+        assert replayed.get_status_code() == 200
+        assert replayed.get_data() == recorded.get_data()
+        assert replayed.get_header('content-type') == 'application/json'
+
+        assert api.post('/missions/get', {'ref': 'NOPE'}).get_status_code() == 404
+
+        with pytest.raises(EverestApiException):
+            api.post('/missions/get', {'ref': 'MOCK-000005'})
+
+
+def test_replay_rejects_invalid_file(tmp_path):
+    """Test that incomplete cassettes are rejected"""
+    path = tmp_path / 'broken.cassette'
+    path.write_bytes(b'not a cassette at all, definitely not')
+
+    with pytest.raises(EverestApiException):
+        ReplayTransport(str(path))
+
+
+def _fan_out(api, refs):
+    """Fetch missions concurrently."""
+    with ThreadPoolExecutor(max_workers=len(refs)) as executor:
+        responses = list(executor.map(lambda ref: api.post('/missions/get', {'ref': ref}), refs))
+
+    assert [r.get_data()['mission']['ref'] for r in responses] == refs
+
+
+def test_http2_multiplexes_concurrent_requests():
+    """Test HTTP/2 serves a fan-out over one socket (timings are left to the benchmarks)"""
+    pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+
+    refs = [f'MOCK-{i:06d}' for i in range(40)]
+    # Latency keeps the requests in flight together
+    latency = 0.05
+
+    # HTTP/1.1 with two sockets: requests queue behind each other
+    with MockEverestServer(latency=latency, http2=True) as server:
+        session = requests.Session()
+        session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=2, pool_block=True))
+        with EverestApi(server.base_url, 'client', 'secret', transport=RequestsTransport(session)) as api:
+            api.auth()
+            _fan_out(api, refs)
+        http1_sockets = server.connection_count
+
+    # HTTP/2 with the same socket budget: requests are multiplexed
+    with MockEverestServer(latency=latency, http2=True) as server:
+        transport = Http2Transport(prior_knowledge=True, max_connections=2)
+        with EverestApi(server.base_url, 'client', 'secret', transport=transport) as api:
+            api.auth()
+            _fan_out(api, refs)
+            missions = list(api.stream_missions({'limit_start': 0, 'limit_end': 100}))
+        http2_sockets = server.connection_count
+
+    assert http1_sockets == 2
+    assert http2_sockets == 1
+    assert len(missions) == 100
+
+
+def test_http2_transport_falls_back_to_http1():
+    """Test the HTTP/2 transport talks HTTP/1.1 to servers without HTTP/2"""
+    pytest.importorskip('httpx')
+
+    with MockEverestServer(mission_count=10, compress_responses=True) as server:
+        with EverestApi(server.base_url, 'client', 'secret', transport=Http2Transport()) as api:
+            api.auth()
+            response = api.post('/missions/get', {'ref': 'MOCK-000003'})
+
+            assert response.get_data()['mission']['ref'] == 'MOCK-000003'
+            assert response.get_header('Content-Type') == 'application/json'
+            assert api.post('/missions/get', {'ref': 'NOPE'}).get_status_code() == 404
+
+    with pytest.raises(EverestApiException):
+        api.post('/services')